@@ -0,0 +1,57 @@
+"""Register ``litestar run`` without importing Granian until the command is used."""
+
+from typing import Any
+
+from click import Context
+from litestar.cli._utils import _inject_args  # pyright: ignore[reportPrivateUsage]
+
+try:
+    from rich_click import RichCommand as Command
+except ImportError:
+    from click import Command  # type: ignore[assignment]
+
+_SHORT_HELP = "Start application server"
+
+
+class _LazyRunCommand(Command):
+    """The ``run`` command, loaded from :mod:`litestar_granian.cli` on first use.
+
+    Litestar calls ``on_cli_init`` for every command, including migrations and
+    ``--help``. Listing the command only needs its name and short help; its
+    options, callback, and the Granian imports behind them load once the
+    command is parsed, invoked, or documented.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(name="run", help=_SHORT_HELP, short_help=_SHORT_HELP)
+        self._loaded = False
+
+    def make_context(
+        self,
+        info_name: str | None,
+        args: list[str],
+        parent: Context | None = None,
+        **extra: Any,
+    ) -> Context:
+        self._load()
+        return super().make_context(info_name, args, parent, **extra)
+
+    def get_params(self, ctx: Context) -> list[Any]:
+        self._load()
+        return super().get_params(ctx)
+
+    def to_info_dict(self, ctx: Context) -> dict[str, Any]:
+        self._load()
+        return super().to_info_dict(ctx)
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        from litestar_granian.cli import run_command
+
+        callback = run_command.callback
+        vars(self).update(vars(run_command))
+        # Litestar injects ``app`` and ``ctx`` when a command with a callback is added to its group; this
+        # command had none when it was added.
+        self.callback = _inject_args(callback) if callback is not None else None
+        self._loaded = True
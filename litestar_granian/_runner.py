@@ -1,53 +1,46 @@
 """Run Granian with Litestar reload and inherited-socket compatibility."""
 
+import gc
+import importlib
 import inspect
 import json
+import logging
+import multiprocessing
 import os
 import socket
 import sys
+import threading
+import time
+from functools import partial
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
-from watchfiles.filters import DefaultFilter
+from litestar_granian.collector import _GC_MODE_ENV, _GCMode, _load_with_gc_mode
+from litestar_granian.lifespans import _LIFESPAN_BARRIER_ENV, _load_with_lifespan_barrier
+from litestar_granian.memory import _MIB
+from litestar_granian.readiness import _READY_SOCKET_ENV, _load_reporting_target
+from litestar_granian.reloader import _ReloadPatternFilter
+from litestar_granian.resources import _MAX_RSS_AUTO_ENV, _memory_budget
+from litestar_granian.rsgi import _RSGI_ENV, _load_rsgi_target
+from litestar_granian.startup import _RUNNER_STARTED_ENV
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-
-
-class _ReloadPatternFilter(DefaultFilter):
-    """Apply Litestar's reload globs to Granian's reloader."""
-
-    include_patterns: tuple[str, ...] = ()
-    exclude_patterns: tuple[str, ...] = ()
-
-    def __init__(
-        self,
-        includes: tuple[str, ...] | None = None,
-        excludes: tuple[str, ...] | None = None,
-    ) -> None:
-        configured_includes = includes if includes is not None else self.include_patterns
-        configured_excludes = excludes if excludes is not None else self.exclude_patterns
-        default_includes = () if "*.py" in configured_excludes else ("*.py",)
-        self._includes = tuple(dict.fromkeys((*default_includes, *configured_includes)))
-        default_excludes = (".*", ".py[cod]", ".sw.*", "~*")
-        self._excludes = tuple(
-            pattern for pattern in (*default_excludes, *configured_excludes) if pattern not in self._includes
-        )
-        self._exclude_dirs = tuple(
-            path.resolve() for pattern in configured_excludes if (path := Path(pattern)).is_dir()
-        )
-        super().__init__()
+    from collections.abc import Callable, Sequence
+    from types import ModuleType
 
-    def __call__(self, change: Any, path: str) -> bool:
-        candidate = Path(path)
-        if not any(candidate.match(pattern) for pattern in self._includes):
-            return False
-        if any(directory == candidate or directory in candidate.parents for directory in self._exclude_dirs):
-            return False
-        if any(candidate.match(pattern) for pattern in self._excludes):
-            return False
-        return super().__call__(change, path)
+_REUSE_PORT_ENV = "LITESTAR_GRANIAN_REUSE_PORT"
+_EXTRA_FILE_DESCRIPTORS_ENV = "LITESTAR_GRANIAN_EXTRA_FILE_DESCRIPTORS"
+_PRELOAD_ENV = "LITESTAR_GRANIAN_PRELOAD"
+_PRELOAD_GC_FREEZE_ENV = "LITESTAR_GRANIAN_PRELOAD_GC_FREEZE"
+_TEMPORARY_FILES_ENV = "LITESTAR_GRANIAN_TEMPORARY_FILES"
+_WORKER_MODULES = ("granian.server.mp", "granian.server.mt")
+_WORKER_CLASSES = ("ASGIWorker", "RSGIWorker", "WSGIWorker")
+# Granian builds worker shutdown signals through these module globals.
+_SIGNAL_MODULES = ("granian._signals", "granian.server.mt")
+_extra_listeners_lock = threading.Lock()
+
+logger = logging.getLogger("litestar_granian.runner")
 
 
 def _load_patterns(name: str) -> tuple[str, ...]:
@@ -116,6 +109,14 @@ def _probe_granian_compatibility(granian_cli: Any) -> None:
     elif not callable(getattr(server_cls, "_init_shared_socket", None)):
         problems.append(f"{server_cls.__name__}._init_shared_socket is missing")
 
+    granian_internal: "ModuleType | None"
+    try:
+        granian_internal = importlib.import_module("granian._internal")
+    except ImportError:
+        granian_internal = None
+    if not callable(getattr(granian_internal, "load_target", None)):
+        problems.append("granian._internal.load_target is missing")
+
     try:
         from granian._granian import SocketHolder
     except ImportError:
@@ -124,24 +125,252 @@ def _probe_granian_compatibility(granian_cli: Any) -> None:
         if not _accepts_socket_holder_arguments(SocketHolder):
             problems.append(f"granian._granian.SocketHolder no longer accepts ({', '.join(_SOCKET_HOLDER_PARAMETERS)})")
 
+    if os.getenv(_REUSE_PORT_ENV):
+        granian_net: "ModuleType | None"
+        try:
+            granian_net = importlib.import_module("granian.net")
+        except ImportError:
+            granian_net = None
+        if not callable(getattr(granian_net, "SocketSpec", None)):
+            problems.append("granian.net.SocketSpec is missing (required by --reuse-port)")
+
+    if os.getenv(_EXTRA_FILE_DESCRIPTORS_ENV):
+        problems.extend(_extra_listener_problems())
+
     if problems:
         message = (
             "litestar-granian's Granian compatibility shim does not match installed "
             f"granian {_granian_version()}: {'; '.join(problems)}. "
-            "Pin granian==2.7.* or drop --fd/--reload-include/--reload-exclude."
+            "Pin granian==2.7.* or drop --fd/--reload-include/--reload-exclude/--rolling-restart/--reuse-port/--bind "
+            "and pass --no-parent-socket."
         )
         raise SystemExit(message)
 
 
-def _configure_server(granian_cli: Any) -> None:
+def _extra_listener_problems() -> list[str]:
+    """List the Granian globals that extra listeners patch but the installed release lacks.
+
+    Returns:
+        One problem per missing worker class or ``WorkerSignal`` global.
+    """
+    required = [(module, name) for module in _WORKER_MODULES for name in _WORKER_CLASSES]
+    required += [(module, "WorkerSignal") for module in (*_SIGNAL_MODULES, "granian._granian")]
+    problems: list[str] = []
+    for module_name, name in required:
+        module: "ModuleType | None"
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            module = None
+        if getattr(module, name, None) is None:
+            problems.append(f"{module_name}.{name} is missing (required by --bind and additional --fd listeners)")
+    return problems
+
+
+class _ChainedWorkerSignal:
+    """Stand in for Granian's ``WorkerSignal`` so shutdown also reaches extra listeners.
+
+    A ``WorkerSignal`` is consumed by the single worker it is served with and
+    holds one callback, so every extra listener gets its own signal that is
+    set together with the one Granian created.
+    """
+
+    def __init__(self) -> None:
+        self.signal = _granian_worker_signal()
+        self.followers: list[Any] = []
+
+    def set(self) -> None:
+        self.signal.set()
+        for follower in self.followers:
+            follower.set()
+
+    def add_cb(self, callback: "Callable[[], None]") -> None:
+        self.signal.add_cb(callback)
+
+
+class _MultiListenerWorker:
+    """Drive one Granian worker per listener from a single worker process.
+
+    Every worker shares the process's loaded application and event loop; only
+    the accepting socket differs.
+    """
+
+    def __init__(self, primary: Any, extras: list[tuple[Any, bool]]) -> None:
+        self._primary = primary
+        self._extras = extras
+
+    def __getattr__(self, name: str) -> Any:
+        serve_primary = getattr(self._primary, name)
+        if not name.startswith("serve_"):
+            return serve_primary
+        # Granian picks serve_<runtime> or serve_<runtime>_uds from the primary socket; each extra listener
+        # needs the variant that matches its own socket family.
+        method = name.removesuffix("_uds")
+
+        def serve(scheduler: Any, loop: Any, shutdown_event: Any) -> Any:
+            chained = shutdown_event if isinstance(shutdown_event, _ChainedWorkerSignal) else None
+            for worker, is_uds in self._extras:
+                follower = _granian_worker_signal()
+                if chained is not None:
+                    chained.followers.append(follower)
+                getattr(worker, f"{method}_uds" if is_uds else method)(scheduler, loop, follower)
+            return serve_primary(scheduler, loop, chained.signal if chained is not None else shutdown_event)
+
+        return serve
+
+
+class _MultiListenerWorkerFactory:
+    def __init__(self, worker_class: Any, holders: list[tuple[Any, bool]]) -> None:
+        self.worker_class = worker_class
+        self.holders = holders
+
+    def __call__(self, worker_id: int, sock: Any, *args: Any) -> _MultiListenerWorker:
+        primary = self.worker_class(worker_id, sock, *args)
+        extras = [(self.worker_class(worker_id, (None, holder), *args), is_uds) for holder, is_uds in self.holders]
+        return _MultiListenerWorker(primary, extras)
+
+
+def _granian_worker_signal() -> Any:
+    from granian._granian import WorkerSignal
+
+    return WorkerSignal()
+
+
+def _serve_extra_listeners(listeners: tuple[tuple[int, bool], ...], backlog: int) -> None:
+    """Make every Granian worker built in this process also accept on ``listeners``.
+
+    Runs in the Granian main process for thread workers and again in each
+    spawned worker process; patching is idempotent.
+
+    Raises:
+        RuntimeError: If no Granian worker class could be patched, since the
+            extra listeners would then accept connections no worker serves.
+    """
+    with _extra_listeners_lock:
+        holders: list[tuple[Any, bool]] | None = None
+        patched = False
+        for module in filter(None, (sys.modules.get(name) for name in _WORKER_MODULES)):
+            for name in _WORKER_CLASSES:
+                worker_class = getattr(module, name, None)
+                patched = patched or worker_class is not None
+                if worker_class is None or isinstance(worker_class, _MultiListenerWorkerFactory):
+                    continue
+                if holders is None:
+                    # Thread workers share these holders; each process builds them once.
+                    holders = [(_socket_holder(fd, is_uds=is_uds, backlog=backlog), is_uds) for fd, is_uds in listeners]
+                setattr(module, name, _MultiListenerWorkerFactory(worker_class, holders))
+        if not patched:
+            message = "No Granian worker class could be patched to serve the --bind and additional --fd listeners"
+            raise RuntimeError(message)
+        for signal_module in filter(None, (sys.modules.get(name) for name in _SIGNAL_MODULES)):
+            if hasattr(signal_module, "WorkerSignal"):
+                setattr(signal_module, "WorkerSignal", _ChainedWorkerSignal)
+
+
+def _load_target_with_extra_listeners(
+    target: str,
+    *,
+    loader: "Callable[..., Any]",
+    listeners: tuple[tuple[int, bool], ...],
+    backlog: int,
+) -> Any:
+    """Install the extra listeners in the worker process, then load the target.
+
+    Returns:
+        The target returned by ``loader``.
+    """
+    _serve_extra_listeners(listeners, backlog)
+    return loader(target)
+
+
+def _preload_target(
+    target: str,
+    *,
+    loader: "Callable[[str], Any]",
+    env_files: "Sequence[Path] | None",
+    freeze_gc: bool,
+) -> "Callable[[str], Any]":
+    """Load ``target`` in the Granian main process so forked workers share it copy-on-write.
+
+    Returns:
+        A loader that hands every worker the preloaded target instead of importing it again.
+    """
+    if env_files:
+        from granian._internal import load_env
+
+        cast("Callable[[Sequence[Path]], None]", load_env)(env_files)
+    started = time.perf_counter()
+    preloaded = loader(target)
+    if freeze_gc:
+        # Collect first so garbage is not frozen, then move every survivor to the permanent generation:
+        # later collections in the workers no longer write to the shared pages.
+        gc.collect()
+        gc.freeze()
+    if sys.platform != "win32" and multiprocessing.get_start_method(allow_none=True) != "fork":
+        # Spawned or forkserver workers would import the target again and share nothing.
+        multiprocessing.set_start_method("fork", force=True)
+    logger.info(
+        "Preloaded %s in %.0f ms (%d objects frozen)",
+        target,
+        (time.perf_counter() - started) * 1000,
+        gc.get_freeze_count(),
+    )
+    return partial(_preloaded_target, preloaded)
+
+
+def _preloaded_target(preloaded: Any, target: str) -> Any:
+    return preloaded
+
+
+def _socket_holder(fd: int, *, is_uds: bool, backlog: int) -> Any:
     from granian._granian import SocketHolder
 
+    values = {"fd": fd, "uds": is_uds, "backlog": backlog}
+    return cast("Callable[..., Any]", SocketHolder)(*(values[name] for name in _SOCKET_HOLDER_PARAMETERS))
+
+
+def _reevaluate_rss_budget(server: Any) -> None:
+    """Recompute the ``--workers-max-rss auto`` budget from the current parent and Granian main process RSS."""
+    raw_parent = os.getenv(_MAX_RSS_AUTO_ENV)
+    if raw_parent is None:
+        return
+    # After --exec there is no separate parent: the Granian main process kept its PID.
+    parent = int(raw_parent) if int(raw_parent) != os.getpid() else None
+    budget = _memory_budget(workers=server.workers, pids=(parent, None))
+    if budget.per_worker // _MIB != (server.workers_rss or 0) // _MIB:
+        from granian.log import logger as granian_logger
+
+        # Granian's own logger is configured in this process even when the application is not loaded here.
+        granian_logger.info("Worker RSS budget re-evaluated: %s", budget.summary())
+    server.workers_rss = budget.per_worker
+
+
+def _is_unix_socket(fd: int) -> bool:
+    inherited_socket = socket.socket(fileno=fd)
+    try:
+        return inherited_socket.family == getattr(socket, "AF_UNIX", object())
+    finally:
+        inherited_socket.detach()
+
+
+def _configure_server(granian_cli: Any) -> None:
     includes = _load_patterns("LITESTAR_GRANIAN_RELOAD_INCLUDES")
     excludes = _load_patterns("LITESTAR_GRANIAN_RELOAD_EXCLUDES")
     raw_fd = os.getenv("LITESTAR_GRANIAN_FILE_DESCRIPTOR")
     inherited_fd = int(raw_fd) if raw_fd is not None else None
+    reports_readiness = bool(os.getenv(_READY_SOCKET_ENV))
+    preload = bool(os.getenv(_PRELOAD_ENV))
+    preload_gc_freeze = bool(os.getenv(_PRELOAD_GC_FREEZE_ENV))
+    raw_gc_mode = os.getenv(_GC_MODE_ENV)
+    gc_mode = _GCMode(raw_gc_mode) if raw_gc_mode else None
+    serves_rsgi = bool(os.getenv(_RSGI_ENV))
+    raw_lifespan_barrier = os.getenv(_LIFESPAN_BARRIER_ENV)
+    lifespan_barrier = Path(raw_lifespan_barrier) if raw_lifespan_barrier else None
+    extra_fds = tuple(int(value) for value in json.loads(os.getenv(_EXTRA_FILE_DESCRIPTORS_ENV) or "[]"))
+    socket_spec_factory: "Callable[..., Any] | None" = None
+    if os.getenv(_REUSE_PORT_ENV):
+        socket_spec_factory = importlib.import_module("granian.net").SocketSpec
     original_server = granian_cli.Server
-    socket_holder_factory = cast("Callable[..., Any]", SocketHolder)
 
     class LitestarGranianServer(original_server):  # type: ignore[misc,valid-type]
         def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -153,25 +382,100 @@ def _configure_server(granian_cli: Any) -> None:
                 )
                 kwargs["reload_filter"] = reload_filter
             super().__init__(*args, **kwargs)
+            # Granian has read its configuration; nothing else removes these after the parent exec'd into us.
+            for raw_path in json.loads(os.environ.pop(_TEMPORARY_FILES_ENV, "[]")):
+                Path(raw_path).unlink(missing_ok=True)
+
+        def serve(
+            self,
+            spawn_target: "Callable[..., None] | None" = None,
+            target_loader: "Callable[..., Callable[..., Any]] | None" = None,
+            wrap_loader: bool = True,
+        ) -> None:
+            wraps_target = (
+                preload
+                or reports_readiness
+                or extra_fds
+                or gc_mode is not None
+                or serves_rsgi
+                or lifespan_barrier is not None
+            )
+            if target_loader is None and wraps_target:
+                from granian._internal import load_target
+
+                target_loader = partial(load_target, wd=self.working_dir, factory=self.factory)
+                if preload:
+                    target_loader = _preload_target(
+                        self.target,
+                        loader=target_loader,
+                        env_files=self.env_files,
+                        freeze_gc=preload_gc_freeze,
+                    )
+                if lifespan_barrier is not None:
+                    # Applied before the readiness report so workers only report once they may accept.
+                    target_loader = partial(_load_with_lifespan_barrier, loader=target_loader, path=lifespan_barrier)
+                if reports_readiness:
+                    target_loader = partial(_load_reporting_target, loader=target_loader)
+                if gc_mode is not None:
+                    target_loader = partial(_load_with_gc_mode, loader=target_loader, mode=gc_mode)
+                if serves_rsgi:
+                    target_loader = partial(
+                        _load_rsgi_target,
+                        loader=target_loader,
+                        root_path=self.url_path_prefix or "",
+                    )
+                wrap_loader = True
+            if extra_fds and target_loader is not None and wrap_loader:
+                listeners = tuple((fd, _is_unix_socket(fd)) for fd in extra_fds)
+                # Thread workers are built in this process; worker processes patch themselves on load.
+                _serve_extra_listeners(listeners, self.backlog)
+                target_loader = partial(
+                    _load_target_with_extra_listeners,
+                    loader=target_loader,
+                    listeners=listeners,
+                    backlog=self.backlog,
+                )
+            super().serve(spawn_target, target_loader, wrap_loader)
+
+        def _handle_rss_signal(self, spawn_target: Any, target_loader: Any) -> None:
+            _reevaluate_rss_budget(self)
+            super()._handle_rss_signal(spawn_target, target_loader)
 
         def _init_shared_socket(self) -> None:
+            if socket_spec_factory is not None:
+                # Every worker builds its own SO_REUSEPORT listener from the spec; this build only
+                # fails early if the address cannot be bound.
+                self._ssp = socket_spec_factory(self.bind_addr, self.bind_port, self.backlog)
+                self._ssp.build()
+                self._sso = None
+                return
             if inherited_fd is None:
                 super()._init_shared_socket()
                 return
-            inherited_socket = socket.socket(fileno=inherited_fd)
-            is_uds = inherited_socket.family == getattr(socket, "AF_UNIX", object())
-            inherited_socket.detach()
-            holder_values = {"fd": inherited_fd, "uds": is_uds, "backlog": self.backlog}
-            self._shd = socket_holder_factory(*(holder_values[name] for name in _SOCKET_HOLDER_PARAMETERS))
+            self._shd = _socket_holder(inherited_fd, is_uds=_is_unix_socket(inherited_fd), backlog=self.backlog)
             self._sfd = self._shd.get_fd()
             self._sso = socket.socket(fileno=self._sfd)
             self._sso.set_inheritable(True)
 
+        def _unlink_pidfile(self) -> None:
+            if inherited_fd is None:
+                super()._unlink_pidfile()
+                return
+            # The inherited Unix socket path belongs to the parent and must outlive this child.
+            bind_uds: Path | None = self.bind_uds  # type: ignore[has-type]
+            self.bind_uds = None
+            try:
+                super()._unlink_pidfile()
+            finally:
+                self.bind_uds = bind_uds
+
     setattr(granian_cli, "Server", LitestarGranianServer)
 
 
 def main() -> None:
     """Run Granian with Litestar CLI compatibility hooks enabled."""
+    # Workers inherit the mark and send it back with their readiness reports for the startup report.
+    os.environ[_RUNNER_STARTED_ENV] = repr(time.monotonic())
     import granian.cli
 
     _probe_granian_compatibility(granian.cli)
@@ -3,12 +3,14 @@
 import os
 import sys
 import sysconfig
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Mapping, Sequence
 from contextlib import ExitStack
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, NoReturn, TypeVar
 
-from click import UsageError
+from click import ClickException, ParamType, UsageError
 from click.exceptions import Exit
 from granian.cli import Duration, OctalIntType, _pretty_print_default
 from granian.cli import EnumType as GranianEnumType
@@ -26,20 +28,45 @@ from litestar.cli.commands.core import (
     CommaSplittedPath,
     _server_lifespan,  # pyright: ignore[reportPrivateUsage]
 )
+from litestar.plugins import CLIPlugin
 
-from litestar_granian.command import _build_granian_command, _GranianCommand
-from litestar_granian.supervisor import _GranianSupervisor, _SignalForwarder
+from litestar_granian.collector import _GCMode
+from litestar_granian.command import _build_granian_command, _get_plugin, _GranianCommand
+from litestar_granian.lifespans import (
+    _LIFESPAN_BARRIER_ENV,
+    _ConcurrentServerLifespans,
+    _create_lifespan_barrier,
+    _LifespanOverlap,
+)
+from litestar_granian.memory import _MIB, _release_parent_memory
+from litestar_granian.notify import _NOTIFY_SOCKET_ENV, _ReadinessAnnouncer
+from litestar_granian.readiness import _ReadinessChannel
+from litestar_granian.reloader import _ParentReloader, _reload_filter, _Reloader
+from litestar_granian.resources import _AUTO, _auto_workers
+from litestar_granian.rsgi import _Interface
+from litestar_granian.sockets import (
+    _activated_listeners,
+    _ActivatedListener,
+    _BindAddress,
+    _parent_listener,
+    _SocketTuning,
+    _tune_inherited_listener,
+)
+from litestar_granian.startup import _timeline
+from litestar_granian.supervisor import _GranianSupervisor, _MemoryLimit, _RespawnPolicy, _SignalForwarder
 
 try:
-    from rich_click import Command, Context, IntRange, Option, command
+    from rich_click import Command, Context, FloatRange, IntRange, Option, command
     from rich_click import Path as ClickPath
     from rich_click import option as click_option
 except ImportError:
-    from click import Command, Context, IntRange, Option, command  # type: ignore[no-redef]
+    from click import Command, Context, FloatRange, IntRange, Option, command  # type: ignore[no-redef]
     from click import Path as ClickPath
     from click import option as click_option  # type: ignore[assignment]
 
 if TYPE_CHECKING:
+    import socket
+
     from litestar import Litestar
 
 
@@ -50,6 +77,36 @@ class _EnumChoice(GranianEnumType):
         super().__init__(enum, case_sensitive)
 
 
+class _BindAddressType(ParamType):
+    """A Click type that parses ``--bind`` listener addresses."""
+
+    name = "address"
+
+    def convert(self, value: Any, param: Any, ctx: Any) -> _BindAddress:
+        if isinstance(value, _BindAddress):
+            return value
+        try:
+            return _BindAddress.parse(str(value))
+        except ValueError as exc:
+            self.fail(str(exc), param, ctx)
+
+
+class _CountOrAutoType(ParamType):
+    """A Click type that parses a positive integer or ``auto``."""
+
+    name = "integer|auto"
+
+    def convert(self, value: Any, param: Any, ctx: Any) -> int | str:
+        if isinstance(value, int):
+            return value
+        text = str(value).strip().lower()
+        if text == _AUTO:
+            return _AUTO
+        if not text.isdigit() or int(text) < 1:
+            self.fail(f"{value!r} is not a positive integer or 'auto'", param, ctx)
+        return int(text)
+
+
 _AnyCallable = Callable[..., Any]
 FC = TypeVar("FC", bound=_AnyCallable | Command)
 
@@ -139,15 +196,29 @@ def option(*param_decls: str, cls: type[Option] | None = None, **attrs: Any) ->
     help="Glob patterns for files to exclude when watching for file changes",
     envvar="LITESTAR_RELOAD_EXCLUDES",
 )
+@option(
+    "--reloader",
+    type=_EnumChoice(_Reloader),
+    default=lambda: _Reloader.parent if _is_free_threaded_build() else _Reloader.granian,
+    help=(
+        "Where --reload watches files: granian (Granian's main process restarts its workers) or parent (the "
+        "Litestar parent restarts the Granian child and keeps server lifespans running). Defaults to parent on "
+        "free-threaded Python, where Granian's reloader is unavailable, and granian otherwise"
+    ),
+    envvar="LITESTAR_GRANIAN_RELOADER",
+)
 @option("-p", "--port", help="Port to bind to", type=int, default=8000, envvar="LITESTAR_PORT")
 @option(
     "-W",
     "--wc",
     "--web-concurrency",
     "--workers",
-    type=IntRange(min=1),
+    type=_CountOrAutoType(),
     default=1,
-    help="Number of Granian application workers (processes on GIL builds; threads on free-threaded builds)",
+    help=(
+        "Number of Granian application workers (processes on GIL builds; threads on free-threaded builds), or "
+        "auto for one per CPU allowed by the cgroup v2 quota and affinity mask, divided by --runtime-threads"
+    ),
     envvar=["LITESTAR_WEB_CONCURRENCY", "WEB_CONCURRENCY"],
 )
 @option(
@@ -163,7 +234,8 @@ def option(*param_decls: str, cls: type[Option] | None = None, **attrs: Any) ->
     "--file-descriptor",
     "fd",
     type=int,
-    help="Bind to a socket from this file descriptor.",
+    multiple=True,
+    help="Bind to a socket from this file descriptor. Repeat to serve several inherited listeners.",
     envvar="LITESTAR_FILE_DESCRIPTOR",
 )
 @option(
@@ -205,6 +277,16 @@ def option(*param_decls: str, cls: type[Option] | None = None, **attrs: Any) ->
     envvar="LITESTAR_CREATE_SELF_SIGNED_CERT",
 )
 @option("--uds-permissions", type=OctalIntType(), help="Unix Domain Socket permissions (octal)")
+@option(
+    "--interface",
+    type=_EnumChoice(_Interface),
+    default=_Interface.asgi,
+    help=(
+        "Granian interface the application is served through: asgi, or rsgi to run Litestar behind the plugin's "
+        "RSGI adapter and skip Granian's ASGI emulation"
+    ),
+    envvar="LITESTAR_GRANIAN_INTERFACE",
+)
 @option(
     "--http",
     type=_EnumChoice(HTTPModes),
@@ -246,6 +328,54 @@ def option(*param_decls: str, cls: type[Option] | None = None, **attrs: Any) ->
     default=1024,
     help="Maximum number of connections to hold in backlog (globally)",
 )
+@option(
+    "--tcp-defer-accept",
+    type=IntRange(1),
+    help="Seconds the kernel holds a new connection until request data arrives (Linux TCP_DEFER_ACCEPT)",
+    envvar="LITESTAR_GRANIAN_TCP_DEFER_ACCEPT",
+)
+@option(
+    "--tcp-fastopen-queue",
+    type=IntRange(1),
+    help="Pending TCP Fast Open request queue length for the listener (TCP_FASTOPEN)",
+    envvar="LITESTAR_GRANIAN_TCP_FASTOPEN_QUEUE",
+)
+@option(
+    "--so-rcvbuf",
+    type=IntRange(1),
+    help="Receive buffer size in bytes for accepted connections (SO_RCVBUF)",
+    envvar="LITESTAR_GRANIAN_SO_RCVBUF",
+)
+@option(
+    "--so-sndbuf",
+    type=IntRange(1),
+    help="Send buffer size in bytes for accepted connections (SO_SNDBUF)",
+    envvar="LITESTAR_GRANIAN_SO_SNDBUF",
+)
+@option(
+    "--tcp-nodelay/--no-tcp-nodelay",
+    default=None,
+    help="Set TCP_NODELAY on the listener so accepted connections disable Nagle's algorithm",
+    envvar="LITESTAR_GRANIAN_TCP_NODELAY",
+)
+@option(
+    "--tcp-keepalive-idle",
+    type=IntRange(1),
+    help="Idle seconds before TCP keepalive probes start; enables SO_KEEPALIVE",
+    envvar="LITESTAR_GRANIAN_TCP_KEEPALIVE_IDLE",
+)
+@option(
+    "--tcp-keepalive-interval",
+    type=IntRange(1),
+    help="Seconds between TCP keepalive probes; enables SO_KEEPALIVE",
+    envvar="LITESTAR_GRANIAN_TCP_KEEPALIVE_INTERVAL",
+)
+@option(
+    "--tcp-keepalive-count",
+    type=IntRange(1),
+    help="Unanswered TCP keepalive probes before a connection is dropped; enables SO_KEEPALIVE",
+    envvar="LITESTAR_GRANIAN_TCP_KEEPALIVE_COUNT",
+)
 @option(
     "--backpressure",
     type=IntRange(1),
@@ -391,8 +521,12 @@ def option(*param_decls: str, cls: type[Option] | None = None, **attrs: Any) ->
 )
 @option(
     "--workers-max-rss",
-    type=IntRange(1),
-    help="The maximum amount of memory (in MiB) a worker can consume before respawn",
+    type=_CountOrAutoType(),
+    help=(
+        "The maximum amount of memory (in MiB) a worker can consume before respawn, or auto to split the cgroup "
+        "v2 memory.max or memory.high limit, less the parent and Granian main process RSS, across workers with "
+        "10% headroom, re-evaluated on every RSS sample"
+    ),
 )
 @option(
     "--rss-sample-interval",
@@ -431,6 +565,26 @@ def option(*param_decls: str, cls: type[Option] | None = None, **attrs: Any) ->
     default=50,
     help="The tick frequency (in milliseconds) the reloader watch for changes",
 )
+@option(
+    "--reload-quiet-period",
+    type=IntRange(0, 60000),
+    default=0,
+    help=(
+        "With --reloader parent, hold a reload until no files have changed for this many milliseconds, so a "
+        "burst of changes is coalesced into one reload; 0 reloads on every batch the watcher reports"
+    ),
+    envvar="LITESTAR_GRANIAN_RELOAD_QUIET_PERIOD",
+)
+@option(
+    "--reload-min-interval",
+    type=IntRange(0, 600000),
+    default=0,
+    help=(
+        "With --reloader parent, the minimum time in milliseconds between two reloads; changes arriving sooner "
+        "are coalesced into the next reload"
+    ),
+    envvar="LITESTAR_GRANIAN_RELOAD_MIN_INTERVAL",
+)
 @option(
     "--reload-ignore-worker-failure/--no-reload-ignore-worker-failure",
     default=False,
@@ -506,6 +660,199 @@ def option(*param_decls: str, cls: type[Option] | None = None, **attrs: Any) ->
 )
 @option("--metrics-address", default="127.0.0.1", help="Address to bind the metrics endpoint to.")
 @option("--metrics-port", type=IntRange(1, 65535), default=9090, help="Port to bind the metrics endpoint to.")
+@option(
+    "--parent-socket/--no-parent-socket",
+    default=True,
+    help=(
+        "Bind the listener in the Litestar parent and hand it to each Granian child, so queued connections "
+        "survive child restarts (POSIX; ignored with --fd)"
+    ),
+    envvar="LITESTAR_GRANIAN_PARENT_SOCKET",
+)
+@option(
+    "--bind",
+    type=_BindAddressType(),
+    multiple=True,
+    help=(
+        "Bind an additional listener in the parent, served by the same workers: HOST:PORT, [IPV6]:PORT, or "
+        "unix:PATH. Repeatable (POSIX)"
+    ),
+    envvar="LITESTAR_GRANIAN_BIND",
+)
+@option(
+    "--reuse-port/--no-reuse-port",
+    default=False,
+    help=(
+        "Give each Granian worker its own SO_REUSEPORT listener on --host/--port so the kernel spreads "
+        "connections across workers instead of sharing one accept queue (Linux; replaces --parent-socket)"
+    ),
+    envvar="LITESTAR_GRANIAN_REUSE_PORT",
+)
+@option(
+    "--rolling-restart/--no-rolling-restart",
+    default=False,
+    help=(
+        "On SIGHUP or SIGUSR2, start a replacement Granian child on the shared listener and drain "
+        "the previous child once every replacement worker is ready (POSIX)"
+    ),
+    envvar="LITESTAR_GRANIAN_ROLLING_RESTART",
+)
+@option(
+    "--rolling-restart-timeout",
+    type=Duration(1, 3600),
+    default=60,
+    help=(
+        "Time a replacement child may take to become ready before the rolling restart is abandoned "
+        "(supports human-readable format like '90s', '2m')"
+    ),
+    envvar="LITESTAR_GRANIAN_ROLLING_RESTART_TIMEOUT",
+)
+@option(
+    "--respawn-failed-child/--no-respawn-failed-child",
+    default=False,
+    help=(
+        "Restart the Granian child after an abnormal exit with exponential backoff, keeping Litestar "
+        "server lifespans running"
+    ),
+    envvar="LITESTAR_GRANIAN_RESPAWN_FAILED_CHILD",
+)
+@option(
+    "--child-respawn-backoff",
+    type=FloatRange(0.1, 60),
+    default=0.5,
+    help="Initial delay in seconds before respawning a failed Granian child; doubles on each consecutive failure",
+    envvar="LITESTAR_GRANIAN_CHILD_RESPAWN_BACKOFF",
+)
+@option(
+    "--child-respawn-max-backoff",
+    type=Duration(1, 3600),
+    default=30,
+    help="Upper bound for the child respawn backoff (supports human-readable format like '30s', '2m')",
+    envvar="LITESTAR_GRANIAN_CHILD_RESPAWN_MAX_BACKOFF",
+)
+@option(
+    "--child-respawn-limit",
+    type=IntRange(min=1),
+    default=5,
+    help="Consecutive child respawns allowed before the supervisor gives up and exits",
+    envvar="LITESTAR_GRANIAN_CHILD_RESPAWN_LIMIT",
+)
+@option(
+    "--child-max-rss",
+    type=IntRange(1),
+    help=(
+        "Memory budget in MiB for the whole Granian process group, enforced by the supervisor on Linux: after "
+        "--rss-samples consecutive samples over budget, taken every --rss-sample-interval, the child is replaced "
+        "through a rolling restart. Works on free-threaded Python"
+    ),
+    envvar="LITESTAR_GRANIAN_CHILD_MAX_RSS",
+)
+@option(
+    "--ready-file",
+    type=ClickPath(dir_okay=False, path_type=Path),  # type: ignore[type-var]
+    help=(
+        "Atomically write this file once every Granian worker is ready and remove it when shutdown begins "
+        "(POSIX); NOTIFY_SOCKET readiness is sent automatically"
+    ),
+    envvar="LITESTAR_GRANIAN_READY_FILE",
+)
+@option(
+    "--preload/--no-preload",
+    default=False,
+    help=(
+        "Import the application once in the Granian main process and fork workers from it, so imported code "
+        "and read-only data are shared copy-on-write (POSIX; with --reload only through --reloader parent)"
+    ),
+    envvar="LITESTAR_GRANIAN_PRELOAD",
+)
+@option(
+    "--preload-gc-freeze/--no-preload-gc-freeze",
+    default=True,
+    help="With --preload, call gc.freeze() before forking so garbage collection in workers leaves shared pages intact",
+    envvar="LITESTAR_GRANIAN_PRELOAD_GC_FREEZE",
+)
+@option(
+    "--gc-mode",
+    type=_EnumChoice(_GCMode),
+    default=None,
+    help=(
+        "Garbage collector tuning applied in each worker once the application has started: default (time pauses "
+        "only), freeze-after-startup, tuned-thresholds, or manual-idle (collect between requests)"
+    ),
+    envvar="LITESTAR_GRANIAN_GC_MODE",
+)
+@option(
+    "--parent-memory-release/--no-parent-memory-release",
+    default=False,
+    help=(
+        "After the Granian child starts, clear interpreter caches, collect garbage, and call malloc_trim(0) on "
+        "glibc in the supervising Litestar parent, and report its RSS before and after"
+    ),
+    envvar="LITESTAR_GRANIAN_PARENT_MEMORY_RELEASE",
+)
+@option(
+    "--parent-gc-freeze/--no-parent-gc-freeze",
+    default=False,
+    help=(
+        "Release parent memory as --parent-memory-release does, then also call gc.freeze() so later collections "
+        "in the parent skip the imported application"
+    ),
+    envvar="LITESTAR_GRANIAN_PARENT_GC_FREEZE",
+)
+@option(
+    "--exec/--no-exec",
+    "exec_granian",
+    default=False,
+    help=(
+        "Replace the Litestar parent with the Granian main process when nothing needs it (no server lifespans "
+        "or NOTIFY_SOCKET), so only Granian stays resident (POSIX)"
+    ),
+    envvar="LITESTAR_GRANIAN_EXEC",
+)
+@option(
+    "--embedded/--no-embedded",
+    default=False,
+    help=(
+        "Fork each Granian child from the Litestar parent and run Granian in-process instead of starting a new "
+        "interpreter that imports Granian, Litestar, and the application again (POSIX)"
+    ),
+    envvar="LITESTAR_GRANIAN_EMBEDDED",
+)
+@option(
+    "--lifespan-overlap",
+    type=_EnumChoice(_LifespanOverlap),
+    default=_LifespanOverlap.off,
+    help=(
+        "Start the Granian child while Litestar server lifespans are still starting: barrier (workers import the "
+        "application and run its startup hooks, but accept only once the lifespans have started) or eager "
+        "(workers accept as soon as they are ready); off starts the child after the lifespans"
+    ),
+    envvar="LITESTAR_GRANIAN_LIFESPAN_OVERLAP",
+)
+@option(
+    "--concurrent-lifespans/--no-concurrent-lifespans",
+    default=False,
+    help=(
+        "Start and stop Litestar server lifespans concurrently instead of in plugin order, honoring "
+        "GranianPlugin(lifespan_dependencies=...), and report how long each one took"
+    ),
+    envvar="LITESTAR_GRANIAN_CONCURRENT_LIFESPANS",
+)
+@option(
+    "--startup-report/--no-startup-report",
+    default=False,
+    help=(
+        "Print how long each startup phase took, from interpreter start through application import, server "
+        "lifespans, and child spawn to every worker accepting connections"
+    ),
+    envvar="LITESTAR_GRANIAN_STARTUP_REPORT",
+)
+@option(
+    "--startup-report-json",
+    type=ClickPath(dir_okay=False, path_type=Path),  # type: ignore[type-var]
+    help="Write the startup phase timings to this file as JSON once every Granian worker is ready",
+    envvar="LITESTAR_GRANIAN_STARTUP_REPORT_JSON",
+)
 @option(
     "--in-subprocess/--no-subprocess",
     default=None,
@@ -522,11 +869,12 @@ def run_command(
     app: "Litestar",
     host: str,
     port: int,
-    fd: int | None,
+    fd: tuple[int, ...],
     uds: str | None,
     uds_permissions: int | None,
+    interface: _Interface,
     http: HTTPModes,
-    wc: int,
+    wc: int | str,
     blocking_threads: int | None,
     blocking_threads_idle_timeout: int,
     runtime_threads: int,
@@ -535,6 +883,14 @@ def run_command(
     loop: Loops,
     task_impl: TaskImpl,
     backlog: int,
+    tcp_defer_accept: int | None,
+    tcp_fastopen_queue: int | None,
+    so_rcvbuf: int | None,
+    so_sndbuf: int | None,
+    tcp_nodelay: bool | None,
+    tcp_keepalive_idle: int | None,
+    tcp_keepalive_interval: int | None,
+    tcp_keepalive_count: int | None,
     backpressure: int | None,
     http1_buffer_size: int,
     http1_header_read_timeout: int,
@@ -566,17 +922,20 @@ def run_command(
     respawn_interval: float,
     workers_lifetime: int | None,
     workers_kill_timeout: int,
-    workers_max_rss: int | None,
+    workers_max_rss: int | str | None,
     rss_sample_interval: int,
     rss_samples: int,
     reload: bool,
     reload_paths: tuple[Path, ...],
     reload_include: tuple[str, ...],
     reload_exclude: tuple[str, ...],
+    reloader: _Reloader,
     reload_ignore_dirs: tuple[str, ...],
     reload_ignore_patterns: tuple[str, ...],
     reload_ignore_paths: tuple[Path, ...],
     reload_tick: int,
+    reload_quiet_period: int,
+    reload_min_interval: int,
     reload_ignore_worker_failure: bool,
     process_name: str | None,
     pid_file: Path | None,
@@ -596,6 +955,28 @@ def run_command(
     metrics_scrape_interval: int,
     metrics_address: str,
     metrics_port: int,
+    parent_socket: bool,
+    bind: tuple[_BindAddress, ...],
+    reuse_port: bool,
+    rolling_restart: bool,
+    rolling_restart_timeout: int,
+    respawn_failed_child: bool,
+    child_respawn_backoff: float,
+    child_respawn_max_backoff: int,
+    child_respawn_limit: int,
+    child_max_rss: int | None,
+    ready_file: Path | None,
+    preload: bool,
+    preload_gc_freeze: bool,
+    gc_mode: _GCMode | None,
+    parent_memory_release: bool,
+    parent_gc_freeze: bool,
+    exec_granian: bool,
+    embedded: bool,
+    lifespan_overlap: _LifespanOverlap,
+    concurrent_lifespans: bool,
+    startup_report: bool,
+    startup_report_json: Path | None,
     ctx: Context,
 ) -> None:
     """Run a Litestar application under a supervised Granian process group.
@@ -604,10 +985,25 @@ def run_command(
     Granian child group owns ASGI workers and returns its normalized exit
     status to this command.
     """  # ruff: ignore[docstring-missing-exception]
+    _timeline.begin()
     reload = reload or bool(reload_paths) or bool(reload_include) or bool(reload_exclude)
+    activated = _adopt_activated_listeners() if not fd and sys.platform != "win32" else []
+    inherited = fd or tuple(listener.socket.fileno() for listener in activated)
+    tuning = _SocketTuning(
+        tcp_defer_accept=tcp_defer_accept,
+        tcp_fastopen_queue=tcp_fastopen_queue,
+        so_rcvbuf=so_rcvbuf,
+        so_sndbuf=so_sndbuf,
+        tcp_nodelay=tcp_nodelay,
+        tcp_keepalive_idle=tcp_keepalive_idle,
+        tcp_keepalive_interval=tcp_keepalive_interval,
+        tcp_keepalive_count=tcp_keepalive_count,
+    )
     _validate_cli_options(
-        fd=fd,
+        fd=inherited[0] if inherited else None,
         reload=reload,
+        reloader=reloader,
+        reload_coalescing=bool(reload_quiet_period or reload_min_interval),
         workers_max_rss=workers_max_rss,
         ssl_client_verify=ssl_client_verify,
         ssl_ca=ssl_ca,
@@ -616,6 +1012,26 @@ def run_command(
         create_self_signed_cert=create_self_signed_cert,
         static_path_route=static_path_route,
         static_path_mount=static_path_mount,
+        parent_socket=parent_socket,
+        rolling_restart=rolling_restart,
+        child_max_rss=child_max_rss,
+        pid_file=pid_file,
+        metrics_enabled=metrics_enabled,
+        ready_file=ready_file,
+        reuse_port=reuse_port,
+        uds=uds,
+        port=port,
+        tuning=tuning,
+        bind=bind,
+        preload=preload,
+        exec_granian=exec_granian,
+        respawn_failed_child=respawn_failed_child,
+        embedded=embedded,
+        startup_report=startup_report or startup_report_json is not None,
+        lifespan_overlap=lifespan_overlap,
+        concurrent_lifespans=concurrent_lifespans,
+        parent_memory_release=parent_memory_release,
+        parent_gc_freeze=parent_gc_freeze,
     )
     _warn_deprecated_compatibility_options(
         in_subprocess=in_subprocess,
@@ -636,33 +1052,70 @@ def run_command(
     _warn_if_only_granian_metrics(env.app, metrics_enabled=metrics_enabled)
 
     if create_self_signed_cert:
-        certificate_path, keyfile_path = create_ssl_files(
-            str(ssl_certificate) if ssl_certificate is not None else None,
-            str(ssl_keyfile) if ssl_keyfile is not None else None,
-            host,
-        )
-        ssl_certificate = Path(certificate_path)
-        ssl_keyfile = Path(keyfile_path)
+        ssl_certificate, ssl_keyfile = _self_signed_certificate(ssl_certificate, ssl_keyfile, host)
 
     quiet_console = bool(os.getenv("LITESTAR_QUIET_CONSOLE"))
     if not quiet_console and isatty():
         console.rule("Starting [blue]Granian[/] supervisor", align="left")
         show_app_info(env.app)
-
+    if not quiet_console:
+        for listener in activated:
+            console.print(f"Serving socket-activated listener [blue]{listener.name}[/] on {listener.address}")
+    if isinstance(wc, str):
+        auto_workers = _auto_workers(runtime_threads=runtime_threads)
+        wc = auto_workers.count
+        if not quiet_console:
+            console.print(f"[dim]{auto_workers.summary()}[/]")
     options = dict(ctx.params)
     options.pop("in_subprocess", None)
     options.pop("use_litestar_logger", None)
-    options["reload"] = reload
+    options["reload"] = reload and reloader is _Reloader.granian
+    options["wc"] = wc
     options["ssl_certificate"] = ssl_certificate
     options["ssl_keyfile"] = ssl_keyfile
-    built_command = _build_granian_command(env, options)
-    exit_code = _run_supervised(
-        env,
-        built_command,
-        workers_kill_timeout=workers_kill_timeout,
-        host=host,
-        port=port,
-    )
+    options["exec_granian"] = exec_granian and _can_exec(env, quiet_console=quiet_console)
+    with ExitStack() as stack:
+        with _timeline.phase("listener binding"):
+            host, port = _open_listeners(stack, options, activated=activated, inherited=inherited, tuning=tuning)
+        built_command = _build_granian_command(env, options)
+        if options["exec_granian"]:
+            _exec_granian(env, built_command, host=host, port=port)
+        exit_code = _run_supervised(
+            env,
+            built_command,
+            workers_kill_timeout=workers_kill_timeout,
+            host=host,
+            port=port,
+            workers=wc,
+            rolling_restart=rolling_restart,
+            rolling_restart_timeout=rolling_restart_timeout,
+            respawn=_RespawnPolicy(
+                backoff=child_respawn_backoff,
+                max_backoff=child_respawn_max_backoff,
+                limit=child_respawn_limit,
+            )
+            if respawn_failed_child
+            else None,
+            memory_limit=_MemoryLimit(
+                limit=child_max_rss * _MIB,
+                interval=rss_sample_interval,
+                samples=rss_samples,
+            )
+            if child_max_rss is not None
+            else None,
+            ready_file=ready_file,
+            parent_memory_release=parent_memory_release or parent_gc_freeze,
+            parent_gc_freeze=parent_gc_freeze,
+            quiet_console=quiet_console,
+            embedded=embedded,
+            startup_report=startup_report,
+            startup_report_json=startup_report_json,
+            lifespan_overlap=lifespan_overlap,
+            concurrent_lifespans=concurrent_lifespans,
+            reloader=_parent_reloader(options, quiet_console=quiet_console)
+            if reload and reloader is _Reloader.parent
+            else None,
+        )
 
     if not quiet_console:
         console.print("[yellow]Granian workers stopped.[/]")
@@ -670,6 +1123,147 @@ def run_command(
         raise Exit(exit_code)
 
 
+def _self_signed_certificate(
+    ssl_certificate: Path | None,
+    ssl_keyfile: Path | None,
+    host: str,
+) -> tuple[Path, Path]:
+    certificate_path, keyfile_path = create_ssl_files(
+        str(ssl_certificate) if ssl_certificate is not None else None,
+        str(ssl_keyfile) if ssl_keyfile is not None else None,
+        host,
+    )
+    return Path(certificate_path), Path(keyfile_path)
+
+
+def _adopt_activated_listeners() -> list[_ActivatedListener]:
+    """Adopt the listeners passed by a socket-activating service manager, if any.
+
+    Returns:
+        The activated listeners, or an empty list when the process was not socket-activated.
+
+    Raises:
+        ClickException: If the passed descriptors are unusable.
+    """
+    try:
+        return _activated_listeners()
+    except ValueError as exc:
+        raise ClickException(str(exc)) from exc
+
+
+def _open_listeners(
+    stack: ExitStack,
+    options: dict[str, Any],
+    *,
+    activated: list[_ActivatedListener],
+    inherited: tuple[int, ...],
+    tuning: _SocketTuning,
+) -> tuple[str, int]:
+    """Prepare every listener Granian serves and record their descriptors in ``options``.
+
+    The first descriptor is the primary listener Granian reports; the others
+    are served by the same workers. Sockets the parent owns are closed when
+    ``stack`` unwinds.
+
+    Returns:
+        The primary host and port exported to server lifespans.
+    """
+    descriptors = list(inherited)
+    for adopted in activated:
+        stack.enter_context(adopted.socket)
+    if activated:
+        bound = activated[0].socket.getsockname()
+        if isinstance(bound, tuple):
+            options.update(host=bound[0], port=bound[1], uds=None)
+        else:
+            # The service manager owns the path; Granian only reports it.
+            options["uds"] = None if activated[0].address.startswith("@") else activated[0].address
+    elif not inherited and options["parent_socket"] and not options["reuse_port"] and sys.platform != "win32":
+        primary = _BindAddress(host=options["host"], port=options["port"], uds=options["uds"])
+        listener = _bind_parent_listener(stack, primary, options, tuning=tuning)
+        descriptors.append(listener.fileno())
+        if primary.uds is None:
+            options["port"] = listener.getsockname()[1]
+    if tuning.configured:
+        for descriptor in inherited:
+            _tune_inherited_listener(descriptor, tuning)
+    descriptors.extend(
+        _bind_parent_listener(stack, address, options, tuning=tuning).fileno() for address in options["bind"]
+    )
+    options["fd"] = tuple(descriptors)
+    return options["host"], options["port"]
+
+
+def _bind_parent_listener(
+    stack: ExitStack,
+    address: _BindAddress,
+    options: dict[str, Any],
+    *,
+    tuning: _SocketTuning | None = None,
+) -> "socket.socket":
+    """Bind a parent-owned listener and close it when ``stack`` unwinds.
+
+    Returns:
+        The listening socket whose descriptor each Granian child inherits.
+
+    Raises:
+        ClickException: If the address cannot be bound.
+    """
+    try:
+        return stack.enter_context(
+            _parent_listener(
+                host=address.host,
+                port=address.port,
+                uds=address.uds,
+                uds_permissions=options["uds_permissions"],
+                backlog=options["backlog"],
+                tuning=tuning,
+            ),
+        )
+    except OSError as exc:
+        message = f"cannot bind {address}: {exc.strerror or exc}"
+        raise ClickException(message) from exc
+
+
+def _can_exec(env: LitestarEnv, *, quiet_console: bool) -> bool:
+    """Tell whether the Litestar parent has nothing left to do once Granian starts.
+
+    Returns:
+        ``True`` when the parent can be replaced by the Granian main process.
+    """
+    reasons = []
+    managers = env.app._server_lifespan_managers  # pyright: ignore[reportPrivateUsage]
+    # CLIPlugin subclasses that keep the inherited no-op lifespan leave the parent nothing to run.
+    if any(getattr(manager, "__func__", None) is not CLIPlugin.server_lifespan for manager in managers):
+        reasons.append("the application registers server lifespans")
+    if os.environ.get(_NOTIFY_SOCKET_ENV):
+        reasons.append("NOTIFY_SOCKET readiness is announced by the parent")
+    if reasons and not quiet_console:
+        console.print(f"[yellow]Keeping the Litestar parent instead of --exec: {'; '.join(reasons)}.[/]")
+    return not reasons
+
+
+def _exec_granian(env: LitestarEnv, built_command: _GranianCommand, *, host: str, port: int) -> NoReturn:
+    """Replace this process with the Granian main process.
+
+    The process keeps its PID, so a container's PID 1 or a service manager's
+    main PID becomes Granian itself. Parent-owned listeners survive the exec
+    as the inherited descriptors Granian serves.
+    """
+    environment = {
+        **os.environ,
+        **built_command.environment,
+        "LITESTAR_APP": env.app_path,
+        "LITESTAR_HOST": host,
+        "LITESTAR_PORT": str(port),
+    }
+    for descriptor in built_command.pass_fds:
+        os.set_inheritable(descriptor, True)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execve(built_command.argv[0], built_command.argv, environment)  # ruff: ignore[start-process-with-no-shell]
+
+
 def _run_supervised(
     env: LitestarEnv,
     built_command: _GranianCommand,
@@ -677,14 +1271,77 @@ def _run_supervised(
     workers_kill_timeout: int,
     host: str,
     port: int,
+    workers: int = 1,
+    rolling_restart: bool = False,
+    rolling_restart_timeout: float = 60,
+    respawn: _RespawnPolicy | None = None,
+    memory_limit: _MemoryLimit | None = None,
+    ready_file: Path | None = None,
+    parent_memory_release: bool = False,
+    parent_gc_freeze: bool = False,
+    quiet_console: bool = False,
+    embedded: bool = False,
+    startup_report: bool = False,
+    startup_report_json: Path | None = None,
+    lifespan_overlap: _LifespanOverlap = _LifespanOverlap.off,
+    concurrent_lifespans: bool = False,
+    reloader: _ParentReloader | None = None,
 ) -> int:
     with ExitStack() as stack:
         stack.callback(built_command.cleanup)
+        notify_socket = os.environ.get(_NOTIFY_SOCKET_ENV) if sys.platform != "win32" else None
+        announcer = None
+        if notify_socket or ready_file is not None:
+            announcer = _ReadinessAnnouncer(notify_socket=notify_socket, ready_file=ready_file)
+            stack.callback(announcer.close)
+        reports_startup = startup_report or startup_report_json is not None
+        readiness = (
+            _ReadinessChannel(workers)
+            if rolling_restart or memory_limit is not None or announcer is not None or reports_startup
+            else None
+        )
+        if readiness is not None:
+            stack.callback(readiness.close)
+        environment = dict(built_command.environment)
+        barrier = None
+        if lifespan_overlap is _LifespanOverlap.barrier:
+            barrier = _create_lifespan_barrier()
+            stack.callback(barrier.unlink, missing_ok=True)
+            environment[_LIFESPAN_BARRIER_ENV] = str(barrier)
+        release_memory = (
+            partial(_shed_parent_memory, freeze=parent_gc_freeze, quiet_console=quiet_console)
+            if parent_memory_release
+            else None
+        )
+        on_started: Callable[[], None] | None = release_memory
+        enter_lifespans = partial(
+            _enter_server_lifespans,
+            stack,
+            env.app,
+            dependencies=_get_plugin(env).lifespan_dependencies if concurrent_lifespans else None,
+            quiet_console=quiet_console,
+        )
+        if lifespan_overlap is not _LifespanOverlap.off:
+            on_started = partial(
+                _enter_overlapped_lifespans, enter_lifespans, barrier=barrier, release_memory=release_memory
+            )
         supervisor = _GranianSupervisor(
             built_command.argv,
             kill_timeout=workers_kill_timeout,
-            environment=built_command.environment,
+            environment=environment,
             pass_fds=built_command.pass_fds,
+            rolling_restart=rolling_restart,
+            restart_timeout=rolling_restart_timeout,
+            readiness=readiness,
+            respawn=respawn,
+            memory_limit=memory_limit,
+            announcer=announcer,
+            on_started=on_started,
+            on_ready=partial(_report_startup, show=startup_report, json_path=startup_report_json)
+            if reports_startup
+            else None,
+            embedded=embedded,
+            reload_on_change=reloader is not None,
         )
         signal_forwarder = _SignalForwarder(supervisor)
         exports = (("LITESTAR_APP", env.app_path), ("LITESTAR_HOST", host), ("LITESTAR_PORT", str(port)))
@@ -694,11 +1351,113 @@ def _run_supervised(
             os.environ[name] = value
             stack.callback(_restore_environment, name, existed, previous)
         stack.callback(signal_forwarder.restore)
-        stack.enter_context(_server_lifespan(env.app))
+        if lifespan_overlap is _LifespanOverlap.off:
+            enter_lifespans()
         signal_forwarder.install()
+        if reloader is not None:
+            reloader.start(supervisor.reload)
+            stack.callback(reloader.stop)
         return supervisor.run()
 
 
+def _parent_reloader(options: Mapping[str, Any], *, quiet_console: bool) -> _ParentReloader:
+    """Watch the ``--reload-*`` paths from the Litestar parent instead of Granian's main process.
+
+    Returns:
+        A reloader to start once the supervisor runs.
+    """
+    reloader = _ParentReloader(
+        options["reload_paths"] or (Path.cwd(),),
+        watch_filter=_reload_filter(
+            includes=options["reload_include"],
+            excludes=options["reload_exclude"],
+            ignore_dirs=options["reload_ignore_dirs"],
+            ignore_patterns=options["reload_ignore_patterns"],
+            ignore_paths=options["reload_ignore_paths"],
+        ),
+        tick=options["reload_tick"],
+        quiet_period=options["reload_quiet_period"],
+        min_interval=options["reload_min_interval"],
+    )
+    if not quiet_console:
+        watched = ", ".join(str(path) for path in reloader.paths)
+        console.print(f"[dim]Reloading from the Litestar parent; watching {watched}[/]")
+    return reloader
+
+
+def _enter_server_lifespans(
+    stack: ExitStack,
+    app: "Litestar",
+    *,
+    dependencies: Mapping[type, Sequence[type]] | None,
+    quiet_console: bool,
+) -> None:
+    """Enter the server lifespans on ``stack``, in plugin order or concurrently.
+
+    ``dependencies`` is ``None`` for Litestar's sequential entry; otherwise
+    the lifespans start concurrently in that dependency order and their
+    startup and shutdown times are printed.
+
+    Raises:
+        ClickException: If the declared lifespan dependencies form a cycle.
+    """
+    if dependencies is None:
+        with _timeline.phase("server lifespans"):
+            stack.enter_context(_server_lifespan(app))
+        return
+    try:
+        lifespans = _ConcurrentServerLifespans(app, dependencies=dependencies)
+    except ValueError as exc:
+        raise ClickException(str(exc)) from exc
+    if not quiet_console:
+        stack.callback(lambda: console.print(f"[dim]{lifespans.shutdown_summary()}[/]"))
+    with _timeline.phase("server lifespans"):
+        lifespans.start()
+    stack.callback(lifespans.stop)
+    if not quiet_console:
+        console.print(f"[dim]{lifespans.startup_summary()}[/]")
+
+
+def _enter_overlapped_lifespans(
+    enter_lifespans: Callable[[], None],
+    *,
+    barrier: Path | None,
+    release_memory: Callable[[], None] | None,
+) -> None:
+    """Start server lifespans while the Granian child starts, then let its workers accept.
+
+    Runs as the supervisor's ``on_started`` hook, so a failing lifespan stops
+    the child before the error propagates. The lifespans stay on the
+    supervisor's exit stack and exit after the child, as they do without overlap.
+    """
+    enter_lifespans()
+    if barrier is not None:
+        barrier.unlink(missing_ok=True)
+    if release_memory is not None:
+        release_memory()
+
+
+def _shed_parent_memory(*, freeze: bool, quiet_console: bool) -> None:
+    """Release parent memory once the Granian child runs and report the RSS change."""
+    release = _release_parent_memory(freeze=freeze)
+    if not quiet_console:
+        console.print(f"[dim]{release.summary()}[/]")
+
+
+def _report_startup(reports: list[dict[str, str]], *, show: bool, json_path: Path | None) -> None:
+    """Print and optionally write the startup timeline once every worker has reported ready."""
+    ready = time.monotonic()
+    _timeline.add_worker_reports(reports)
+    if show:
+        for line in _timeline.render(ready):
+            console.print(line, markup=False, highlight=False, soft_wrap=True)
+    if json_path is not None:
+        try:
+            json_path.write_text(_timeline.as_json(ready), encoding="utf-8")
+        except OSError as exc:
+            console.print(f"[yellow]Could not write the startup report to {json_path}: {exc}[/]")
+
+
 def _is_free_threaded_build() -> bool:
     return bool(sysconfig.get_config_var("Py_GIL_DISABLED") == 1)
 
@@ -707,7 +1466,9 @@ def _validate_cli_options(
     *,
     fd: int | None,
     reload: bool,
-    workers_max_rss: int | None,
+    reloader: _Reloader,
+    reload_coalescing: bool,
+    workers_max_rss: int | str | None,
     ssl_client_verify: bool,
     ssl_ca: Path | None,
     ssl_certificate: Path | None,
@@ -715,17 +1476,104 @@ def _validate_cli_options(
     create_self_signed_cert: bool,
     static_path_route: tuple[str, ...],
     static_path_mount: tuple[Path, ...],
+    parent_socket: bool,
+    rolling_restart: bool,
+    child_max_rss: int | None,
+    pid_file: Path | None,
+    metrics_enabled: bool,
+    ready_file: Path | None,
+    reuse_port: bool,
+    uds: str | None,
+    port: int,
+    tuning: _SocketTuning,
+    bind: tuple[_BindAddress, ...],
+    preload: bool,
+    exec_granian: bool,
+    respawn_failed_child: bool,
+    embedded: bool,
+    startup_report: bool,
+    lifespan_overlap: _LifespanOverlap,
+    concurrent_lifespans: bool,
+    parent_memory_release: bool,
+    parent_gc_freeze: bool,
 ) -> None:
     if _is_free_threaded_build():
-        if reload:
-            message = "--reload is not supported on free-threaded Python"
+        if reload and reloader is _Reloader.granian:
+            message = "--reloader granian is not supported on free-threaded Python; use --reloader parent"
             raise UsageError(message)
         if workers_max_rss is not None:
-            message = "--workers-max-rss is not supported on free-threaded Python"
+            message = "--workers-max-rss is not supported on free-threaded Python; use --child-max-rss"
             raise UsageError(message)
+    # Granian's reloader already waits --reload-tick milliseconds without changes before it reloads.
+    if reload_coalescing and not (reload and reloader is _Reloader.parent):
+        message = "--reload-quiet-period and --reload-min-interval require --reload with --reloader parent"
+        raise UsageError(message)
+    if workers_max_rss == _AUTO and sys.platform != "linux":
+        message = "--workers-max-rss auto reads cgroup and /proc memory figures and is only supported on Linux"
+        raise UsageError(message)
     if fd is not None and sys.platform == "win32":
         message = "--fd is not supported on Windows"
         raise UsageError(message)
+    if ready_file is not None:
+        _validate_ready_file(ready_file)
+    if startup_report and sys.platform == "win32":
+        message = "--startup-report is not supported on Windows"
+        raise UsageError(message)
+    if embedded and sys.platform == "win32":
+        message = "--embedded is not supported on Windows"
+        raise UsageError(message)
+    # An embedded child is forked from the parent, which still holds the code it imported at startup.
+    if embedded and reload and reloader is _Reloader.parent:
+        message = "--embedded cannot be combined with --reloader parent"
+        raise UsageError(message)
+    if embedded and concurrent_lifespans:
+        _validate_embedded_concurrent_lifespans(
+            lifespan_overlap=lifespan_overlap,
+            rolling_restart=rolling_restart,
+            respawn_failed_child=respawn_failed_child,
+            child_max_rss=child_max_rss,
+        )
+    if preload:
+        _validate_preload(reload=reload and reloader is _Reloader.granian)
+    if exec_granian:
+        _validate_exec(
+            rolling_restart=rolling_restart,
+            child_max_rss=child_max_rss,
+            parent_reload=reload and reloader is _Reloader.parent,
+            respawn_failed_child=respawn_failed_child,
+            ready_file=ready_file,
+            startup_report=startup_report,
+            embedded=embedded,
+            lifespan_overlap=lifespan_overlap is not _LifespanOverlap.off,
+            concurrent_lifespans=concurrent_lifespans,
+            parent_memory_release=parent_memory_release,
+            parent_gc_freeze=parent_gc_freeze,
+        )
+    if bind:
+        _validate_bind(fd=fd, parent_socket=parent_socket, reuse_port=reuse_port)
+    if tuning.configured:
+        _validate_socket_tuning(tuning, fd=fd, uds=uds, parent_socket=parent_socket, reuse_port=reuse_port)
+    if reuse_port:
+        _validate_reuse_port(fd=fd, uds=uds, port=port, rolling_restart=rolling_restart)
+    if rolling_restart:
+        _validate_rolling_restart(
+            fd=fd,
+            parent_socket=parent_socket,
+            pid_file=pid_file,
+            metrics_enabled=metrics_enabled,
+        )
+    if child_max_rss is not None:
+        if sys.platform != "linux":
+            message = "--child-max-rss reads /proc memory figures and is only supported on Linux"
+            raise UsageError(message)
+        # Over-budget children are replaced through the rolling restart path.
+        _validate_rolling_restart(
+            fd=fd,
+            parent_socket=parent_socket,
+            pid_file=pid_file,
+            metrics_enabled=metrics_enabled,
+            option="--child-max-rss",
+        )
     _validate_tls_options(
         ssl_client_verify=ssl_client_verify,
         ssl_ca=ssl_ca,
@@ -738,6 +1586,173 @@ def _validate_cli_options(
         raise UsageError(message)
 
 
+def _validate_rolling_restart(
+    *,
+    fd: int | None,
+    parent_socket: bool,
+    pid_file: Path | None,
+    metrics_enabled: bool,
+    option: str = "--rolling-restart",
+) -> None:
+    if sys.platform == "win32":
+        message = f"{option} is not supported on Windows"
+        raise UsageError(message)
+    if fd is None and not parent_socket:
+        message = f"{option} requires a shared listener (--parent-socket or --fd)"
+        raise UsageError(message)
+    # Old and replacement children briefly overlap, so each would claim these exclusive resources.
+    if pid_file is not None:
+        message = f"{option} cannot be combined with --pid-file"
+        raise UsageError(message)
+    if metrics_enabled:
+        message = f"{option} cannot be combined with --metrics"
+        raise UsageError(message)
+
+
+def _validate_preload(*, reload: bool) -> None:
+    if sys.platform == "win32":
+        message = "--preload is not supported on Windows"
+        raise UsageError(message)
+    # Granian's reloader restarts workers from the main process, which would keep serving the stale preloaded app.
+    if reload:
+        message = "--preload cannot be combined with --reload; use --reloader parent"
+        raise UsageError(message)
+
+
+def _validate_exec(
+    *,
+    rolling_restart: bool,
+    child_max_rss: int | None,
+    parent_reload: bool,
+    respawn_failed_child: bool,
+    ready_file: Path | None,
+    startup_report: bool,
+    embedded: bool,
+    lifespan_overlap: bool,
+    concurrent_lifespans: bool,
+    parent_memory_release: bool,
+    parent_gc_freeze: bool,
+) -> None:
+    if sys.platform == "win32":
+        message = "--exec is not supported on Windows"
+        raise UsageError(message)
+    # Each of these is carried out by the Litestar parent that --exec replaces.
+    for flag, enabled in (
+        ("--rolling-restart", rolling_restart),
+        ("--child-max-rss", child_max_rss is not None),
+        ("--reloader parent", parent_reload),
+        ("--respawn-failed-child", respawn_failed_child),
+        ("--ready-file", ready_file is not None),
+        ("--startup-report", startup_report),
+        ("--embedded", embedded),
+        ("--lifespan-overlap", lifespan_overlap),
+        ("--concurrent-lifespans", concurrent_lifespans),
+        ("--parent-memory-release", parent_memory_release),
+        ("--parent-gc-freeze", parent_gc_freeze),
+    ):
+        if enabled:
+            message = f"--exec cannot be combined with {flag}"
+            raise UsageError(message)
+
+
+def _validate_embedded_concurrent_lifespans(
+    *,
+    lifespan_overlap: _LifespanOverlap,
+    rolling_restart: bool,
+    respawn_failed_child: bool,
+    child_max_rss: int | None,
+) -> None:
+    # Concurrent lifespans park one thread each in the parent, and an embedded child is a fork of the parent,
+    # so every fork has to happen before those threads start.
+    if lifespan_overlap is _LifespanOverlap.off:
+        message = (
+            "--embedded with --concurrent-lifespans requires --lifespan-overlap barrier or eager, "
+            "so the lifespan threads start after the Granian child is forked"
+        )
+        raise UsageError(message)
+    for flag, enabled in (
+        ("--rolling-restart", rolling_restart),
+        ("--respawn-failed-child", respawn_failed_child),
+        ("--child-max-rss", child_max_rss is not None),
+    ):
+        if enabled:
+            message = (
+                f"--embedded with --concurrent-lifespans cannot be combined with {flag}, "
+                "which forks later Granian children while the lifespan threads run"
+            )
+            raise UsageError(message)
+
+
+def _validate_ready_file(ready_file: Path) -> None:
+    if sys.platform == "win32":
+        message = "--ready-file is not supported on Windows"
+        raise UsageError(message)
+    # The file is replaced through a temporary file created next to it.
+    directory = ready_file.resolve().parent
+    if not directory.is_dir():
+        message = f"Directory for --ready-file was not found: {directory}"
+        raise UsageError(message)
+    if not os.access(directory, os.W_OK | os.X_OK):
+        message = f"Directory for --ready-file is not writable: {directory}"
+        raise UsageError(message)
+
+
+def _validate_bind(*, fd: int | None, parent_socket: bool, reuse_port: bool) -> None:
+    if sys.platform == "win32":
+        message = "--bind is not supported on Windows"
+        raise UsageError(message)
+    # Additional listeners ride along with a parent-owned primary listener.
+    if reuse_port:
+        message = "--bind cannot be combined with --reuse-port"
+        raise UsageError(message)
+    if fd is None and not parent_socket:
+        message = "--bind requires a parent-owned primary listener (--parent-socket or --fd)"
+        raise UsageError(message)
+
+
+def _validate_socket_tuning(
+    tuning: _SocketTuning,
+    *,
+    fd: int | None,
+    uds: str | None,
+    parent_socket: bool,
+    reuse_port: bool,
+) -> None:
+    flag = tuning.configured[0]
+    if sys.platform == "win32":
+        message = f"{flag} is not supported on Windows"
+        raise UsageError(message)
+    if reuse_port:
+        message = f"{flag} cannot be combined with --reuse-port, where every worker binds its own listener"
+        raise UsageError(message)
+    if fd is None and not parent_socket:
+        message = f"{flag} requires a parent-owned listener (--parent-socket or --fd)"
+        raise UsageError(message)
+    if fd is None and uds is not None and tuning.tcp_only:
+        message = f"{tuning.tcp_only[0]} requires a TCP listener and cannot be combined with --uds"
+        raise UsageError(message)
+
+
+def _validate_reuse_port(*, fd: int | None, uds: str | None, port: int, rolling_restart: bool) -> None:
+    if sys.platform != "linux":
+        message = "--reuse-port is only supported on Linux"
+        raise UsageError(message)
+    if uds is not None:
+        message = "--reuse-port requires a TCP listener and cannot be combined with --uds"
+        raise UsageError(message)
+    if fd is not None:
+        message = "--reuse-port binds one listener per worker and cannot use --fd or socket activation"
+        raise UsageError(message)
+    # Each worker binds separately, so an ephemeral port would give every worker a different one.
+    if port == 0:
+        message = "--reuse-port requires a fixed --port"
+        raise UsageError(message)
+    # A retiring worker's own accept queue is dropped with its socket instead of draining to the replacement.
+    if rolling_restart:
+        message = "--rolling-restart cannot be combined with --reuse-port"
+        raise UsageError(message)
+
+
 def _validate_tls_options(
     *,
     ssl_client_verify: bool,
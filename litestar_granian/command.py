@@ -1,6 +1,7 @@
 """Translate Litestar-facing options into one native Granian child command."""
 
 import json
+import logging
 import os
 import sys
 import tempfile
@@ -10,13 +11,21 @@ from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from litestar_granian.lifespans import _LifespanOverlap
 from litestar_granian.logging import build_logging_config
+from litestar_granian.memory import _MIB
+from litestar_granian.notify import _NOTIFY_SOCKET_ENV
 from litestar_granian.plugin import GranianPlugin
+from litestar_granian.resources import _AUTO, _MAX_RSS_AUTO_ENV, _memory_budget
+from litestar_granian.rsgi import _RSGI_ENV, _Interface
+from litestar_granian.startup import _timeline
 from litestar_granian.static import _resolve_static_mounts
 
 if TYPE_CHECKING:
     from litestar.cli._utils import LitestarEnv
 
+logger = logging.getLogger("litestar_granian.command")
+
 
 @dataclass
 class _GranianCommand:
@@ -38,7 +47,8 @@ def _build_granian_command(env: "LitestarEnv", options: Mapping[str, Any]) -> _G
         A command and any temporary files that must be cleaned up after use.
     """
     runner_module, environment, pass_fds = _compatibility_process(options)
-    argv = [sys.executable, "-m", runner_module, env.app_path, "--interface=asgi"]
+    interface = _value(options.get("interface") or _Interface.asgi)
+    argv = [sys.executable, "-m", runner_module, env.app_path, f"--interface={interface}"]
 
     _add_value(argv, "host", options.get("host"))
     _add_value(argv, "port", options.get("port"))
@@ -95,7 +105,7 @@ def _build_granian_command(env: "LitestarEnv", options: Mapping[str, Any]) -> _G
     _add_value(argv, "respawn-interval", options.get("respawn_interval"))
     _add_value(argv, "workers-lifetime", options.get("workers_lifetime"))
     _add_value(argv, "workers-kill-timeout", options.get("workers_kill_timeout"))
-    _add_value(argv, "workers-max-rss", options.get("workers_max_rss"))
+    _add_value(argv, "workers-max-rss", _workers_max_rss(options))
     _add_value(argv, "rss-sample-interval", options.get("rss_sample_interval"))
     _add_value(argv, "rss-samples", options.get("rss_samples"))
     _add_bool(argv, "factory", env.is_app_factory)
@@ -119,13 +129,14 @@ def _build_granian_command(env: "LitestarEnv", options: Mapping[str, Any]) -> _G
         _add_value(argv, "metrics-port", options.get("metrics_port"))
 
     plugin = _get_plugin(env)
-    static_config = _resolve_static_mounts(
-        env.app,
-        static_mode=plugin.static,
-        explicit_routes=tuple(options.get("static_path_route") or ()),
-        explicit_mounts=tuple(options.get("static_path_mount") or ()),
-        explicit_directory_index=options.get("static_path_dir_to_file"),
-    )
+    with _timeline.phase("static file resolution"):
+        static_config = _resolve_static_mounts(
+            env.app,
+            static_mode=plugin.static,
+            explicit_routes=tuple(options.get("static_path_route") or ()),
+            explicit_mounts=tuple(options.get("static_path_mount") or ()),
+            explicit_directory_index=options.get("static_path_dir_to_file"),
+        )
     if static_config is not None:
         _add_repeated(argv, "static-path-route", static_config.routes)
         _add_repeated(argv, "static-path-mount", static_config.mounts, absolute_path=True)
@@ -137,7 +148,8 @@ def _build_granian_command(env: "LitestarEnv", options: Mapping[str, Any]) -> _G
         _add_value(argv, "log-config", explicit_log_config, absolute_path=True)
         return _GranianCommand(argv, environment=environment, pass_fds=pass_fds)
 
-    log_config = build_logging_config(env.app.logging_config)
+    with _timeline.phase("logging configuration"):
+        log_config = build_logging_config(env.app.logging_config)
     if log_config is None:
         return _GranianCommand(argv, environment=environment, pass_fds=pass_fds)
 
@@ -150,9 +162,37 @@ def _build_granian_command(env: "LitestarEnv", options: Mapping[str, Any]) -> _G
         config_path.unlink(missing_ok=True)
         raise
     _add_value(argv, "log-config", config_path, absolute_path=True)
+    if options.get("exec_granian"):
+        # No parent outlives the exec to clean up, so the runner removes the file once Granian has read it.
+        environment["LITESTAR_GRANIAN_TEMPORARY_FILES"] = json.dumps([str(config_path)])
+        argv[2] = "litestar_granian._runner"
     return _GranianCommand(argv, (config_path,), environment, pass_fds)
 
 
+def _workers_max_rss(options: Mapping[str, Any]) -> object:
+    """Resolve ``--workers-max-rss auto`` to the starting per-worker budget in MiB.
+
+    The Granian main process re-evaluates the budget on every RSS sample once
+    it runs; this starting value only has to enable Granian's resource monitor.
+
+    Returns:
+        The value to forward to Granian.
+    """
+    workers_max_rss = options.get("workers_max_rss")
+    if workers_max_rss != _AUTO:
+        return workers_max_rss
+    budget = _memory_budget(workers=options.get("wc") or 1, pids=(None,))
+    samples = options.get("rss_samples") or 1
+    logger.info(
+        "Worker RSS budget: %s; sampled every %ss, respawning after %d consecutive %s over budget",
+        budget.summary(),
+        options.get("rss_sample_interval"),
+        samples,
+        "sample" if samples == 1 else "samples",
+    )
+    return budget.per_worker // _MIB
+
+
 def _get_plugin(env: "LitestarEnv") -> GranianPlugin:
     for plugin in env.app.plugins:
         if isinstance(plugin, GranianPlugin):
@@ -164,15 +204,47 @@ def _compatibility_process(options: Mapping[str, Any]) -> tuple[str, dict[str, s
     reload_include = tuple(options.get("reload_include") or ())
     reload_exclude = tuple(options.get("reload_exclude") or ())
     fd = options.get("fd")
+    descriptors: tuple[int, ...] = (fd,) if isinstance(fd, int) else tuple(fd or ())
     environment: dict[str, str] = {}
     if reload_include:
         environment["LITESTAR_GRANIAN_RELOAD_INCLUDES"] = json.dumps(reload_include)
     if reload_exclude:
         environment["LITESTAR_GRANIAN_RELOAD_EXCLUDES"] = json.dumps(reload_exclude)
-    if fd is not None:
-        environment["LITESTAR_GRANIAN_FILE_DESCRIPTOR"] = str(fd)
-    runner_module = "litestar_granian._runner" if environment else "granian"
-    return runner_module, environment, (fd,) if fd is not None else ()
+    if descriptors:
+        environment["LITESTAR_GRANIAN_FILE_DESCRIPTOR"] = str(descriptors[0])
+    # The runner makes every worker accept on these too, so one pool serves all listeners.
+    if len(descriptors) > 1:
+        environment["LITESTAR_GRANIAN_EXTRA_FILE_DESCRIPTORS"] = json.dumps(descriptors[1:])
+    if options.get("reuse_port"):
+        environment["LITESTAR_GRANIAN_REUSE_PORT"] = "1"
+    if options.get("preload"):
+        environment["LITESTAR_GRANIAN_PRELOAD"] = "1"
+        if options.get("preload_gc_freeze", True):
+            environment["LITESTAR_GRANIAN_PRELOAD_GC_FREEZE"] = "1"
+    if options.get("gc_mode") is not None:
+        environment["LITESTAR_GRANIAN_GC_MODE"] = str(_value(options["gc_mode"]))
+    if options.get("workers_max_rss") == _AUTO:
+        # The Granian main process re-evaluates the budget against this parent's RSS on every sample.
+        environment[_MAX_RSS_AUTO_ENV] = str(os.getpid())
+    if _value(options.get("interface")) == _Interface.rsgi.value:
+        # Granian's RSGI workers need the adapter the runner wraps around the Litestar application.
+        environment[_RSGI_ENV] = "1"
+    # Rolling restarts, memory recycling, readiness announcements, and startup reports need worker reports,
+    # which only the runner wires up.
+    reports_readiness = bool(
+        options.get("rolling_restart")
+        or options.get("child_max_rss")
+        or options.get("ready_file")
+        or options.get("startup_report")
+        or options.get("startup_report_json")
+    )
+    if sys.platform != "win32" and os.environ.get(_NOTIFY_SOCKET_ENV):
+        reports_readiness = True
+    # The parent exports the lifespan barrier at spawn time; the runner makes workers wait on it.
+    waits_for_lifespans = _value(options.get("lifespan_overlap")) == _LifespanOverlap.barrier.value
+    uses_runner = bool(environment) or reports_readiness or waits_for_lifespans
+    runner_module = "litestar_granian._runner" if uses_runner else "granian"
+    return runner_module, environment, descriptors
 
 
 def _add_bool(argv: list[str], name: str, value: object) -> None:
@@ -0,0 +1,128 @@
+"""Run the Granian command in a child forked from the Litestar parent."""
+
+import os
+import runpy
+import signal
+import subprocess  # ruff: ignore[suspicious-subprocess-import]
+import sys
+import time
+import traceback
+from collections.abc import Sequence
+from typing import NoReturn
+
+_POLL_INTERVAL = 0.05
+# Handlers the supervisor and signal forwarder install in the parent; Granian installs its own.
+_PARENT_SIGNALS = tuple(
+    getattr(signal, name) for name in ("SIGTERM", "SIGHUP", "SIGUSR2", "SIGALRM") if hasattr(signal, name)
+)
+
+
+class _EmbeddedChild:
+    """A forked Granian child with the part of :class:`subprocess.Popen` the supervisor uses.
+
+    The child runs the same ``python -m`` command line through :mod:`runpy`
+    instead of executing a new interpreter, so Granian, Litestar, and every
+    module the parent already imported are inherited rather than imported
+    again.
+    """
+
+    def __init__(self, command: Sequence[str], environment: dict[str, str]) -> None:
+        if len(command) < 3 or command[1] != "-m":
+            message = f"embedded Granian needs a 'python -m MODULE' command, got {list(command)!r}"
+            raise ValueError(message)
+        self.args = list(command)
+        self.returncode: int | None = None
+        sys.stdout.flush()
+        sys.stderr.flush()
+        started_read, started_write = os.pipe()
+        self.pid = os.fork()
+        if self.pid == 0:
+            os.close(started_read)
+            _run_module(self.args[2], self.args[3:], environment, started=started_write)
+        os.close(started_write)
+        # Like Popen, return only once the child leads its own session and can be signalled as a group.
+        with os.fdopen(started_read, "rb") as started:
+            started.read()
+
+    def poll(self) -> int | None:
+        """Reap the child if it has exited.
+
+        Returns:
+            The return code, or ``None`` while the child runs.
+        """
+        if self.returncode is None:
+            self._reap(os.WNOHANG)
+        return self.returncode
+
+    def wait(self, timeout: float | None = None) -> int:
+        """Wait for the child to exit.
+
+        Returns:
+            The return code, negative for a signal exit as with ``Popen``.
+
+        Raises:
+            TimeoutExpired: If ``timeout`` elapses first.
+        """
+        if timeout is None:
+            while self.returncode is None:
+                self._reap(0)
+            return self.returncode
+        deadline = time.monotonic() + timeout
+        while (returncode := self.poll()) is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self.args, timeout)
+            time.sleep(min(remaining, _POLL_INTERVAL))
+        return returncode
+
+    def send_signal(self, signum: int) -> None:
+        """Send ``signum`` to the child unless it was already reaped."""
+        if self.poll() is None:
+            os.kill(self.pid, signum)
+
+    def _reap(self, options: int) -> None:
+        try:
+            pid, status = os.waitpid(self.pid, options)
+        except ChildProcessError:
+            # Someone else reaped the child; Popen reports that as a clean exit too.
+            self.returncode = 0
+            return
+        if pid == self.pid:
+            self.returncode = os.waitstatus_to_exitcode(status)
+
+
+def _run_module(module: str, arguments: Sequence[str], environment: dict[str, str], *, started: int) -> NoReturn:
+    """Run ``python -m module arguments`` in this forked process and exit with its status."""
+    status = 1
+    try:
+        _detach_from_parent(environment, started=started)
+        sys.argv = [module, *arguments]
+        runpy.run_module(module, run_name="__main__", alter_sys=True)
+        status = 0
+    except SystemExit as exc:
+        status = _exit_status(exc.code)
+    except BaseException:  # ruff: ignore[blind-except]
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(status)
+
+
+def _detach_from_parent(environment: dict[str, str], *, started: int) -> None:
+    os.setsid()
+    os.close(started)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    for signum in _PARENT_SIGNALS:
+        signal.signal(signum, signal.SIG_DFL)
+    os.environ.clear()
+    os.environ.update(environment)
+
+
+def _exit_status(code: object) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    sys.stderr.write(f"{code}\n")
+    return 1
@@ -0,0 +1,262 @@
+"""Run Litestar server lifespans around the Granian child: overlapped with its start, or concurrently."""
+
+import asyncio
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from contextlib import AbstractContextManager
+from enum import Enum
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from litestar_granian.startup import _timeline
+
+_LIFESPAN_BARRIER_ENV = "LITESTAR_GRANIAN_LIFESPAN_BARRIER"
+_BARRIER_POLL_INTERVAL = 0.02
+
+logger = logging.getLogger("litestar_granian.lifespans")
+
+
+class _LifespanOverlap(str, Enum):
+    """When the Granian child starts relative to the parent's server lifespans."""
+
+    off = "off"
+    barrier = "barrier"
+    eager = "eager"
+
+
+def _create_lifespan_barrier() -> Path:
+    """Create the file whose removal tells workers the parent's server lifespans have started.
+
+    Returns:
+        The barrier path to export to the Granian child.
+    """
+    fd, raw_path = tempfile.mkstemp(prefix="litestar-granian-", suffix=".lifespans")
+    os.close(fd)
+    return Path(raw_path)
+
+
+async def _wait_for_lifespans(path: Path) -> None:
+    """Hold this worker's startup until the parent removes the barrier file."""
+    if not path.exists():  # ruff: ignore[blocking-path-method-in-async-function]
+        return
+    logger.debug("Waiting for Litestar server lifespans before accepting connections")
+    # A file reaches forked, spawned, and embedded workers alike; one stat per poll is cheap next to the lifespans.
+    while path.exists():  # ruff: ignore[async-busy-wait, blocking-path-method-in-async-function]
+        await asyncio.sleep(_BARRIER_POLL_INTERVAL)
+
+
+def _load_with_lifespan_barrier(target: str, *, loader: Callable[[str], Any], path: Path) -> Any:
+    """Load the Granian target with ``loader`` and make its startup wait for the parent's lifespans.
+
+    Litestar applications wait from an ``on_startup`` hook, so the application
+    is imported and its own startup hooks run while the parent's lifespans are
+    still starting; Granian accepts only once startup completes. Other ASGI
+    targets are served without waiting.
+
+    Returns:
+        The loaded Granian target.
+    """
+    loaded = loader(target)
+    startup_hooks = getattr(loaded, "on_startup", None)
+    if isinstance(startup_hooks, list):
+        startup_hooks.append(partial(_wait_for_lifespans, path))
+    return loaded
+
+
+class _LifespanThread:
+    """Enter, hold, and exit one server lifespan on its own thread.
+
+    The lifespan is entered once every dependency has entered, and exited once
+    every dependent has exited, so declared dependencies bracket it on both
+    sides. Entering and exiting on the same thread keeps thread-bound
+    resources, such as some database connections, valid.
+    """
+
+    def __init__(self, manager: Any, *, app: Any, name: str) -> None:
+        self.manager = manager
+        self.app = app
+        self.name = name
+        self.dependencies: list[_LifespanThread] = []
+        self.dependents: list[_LifespanThread] = []
+        self.error: BaseException | None = None
+        self.startup: float | None = None
+        self.shutdown: float | None = None
+        self.entered = threading.Event()
+        self.settled = threading.Event()
+        self.stop = threading.Event()
+        self.exited = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"litestar-granian-lifespan-{name}", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    @property
+    def started(self) -> bool:
+        return self._thread.ident is not None
+
+    def join(self) -> None:
+        if self.started:
+            self._thread.join()
+
+    def _run(self) -> None:
+        try:
+            self._serve()
+        except BaseException as exc:  # ruff: ignore[blind-except]
+            self.error = exc
+        finally:
+            self.settled.set()
+            self.exited.set()
+
+    def _serve(self) -> None:
+        for dependency in self.dependencies:
+            dependency.settled.wait()
+        if not all(dependency.entered.is_set() for dependency in self.dependencies):
+            return
+        manager = self.manager
+        if not isinstance(manager, AbstractContextManager):
+            manager = manager(self.app)
+        started = time.monotonic()
+        with manager:
+            entered = time.monotonic()
+            self.startup = entered - started
+            _timeline.add(f"server lifespan {self.name}", started, entered)
+            self.entered.set()
+            self.settled.set()
+            self.stop.wait()
+            for dependent in self.dependents:
+                dependent.exited.wait()
+            stopping = time.monotonic()
+        self.shutdown = time.monotonic() - stopping
+
+
+class _ConcurrentServerLifespans:
+    """Enter independent server lifespans concurrently instead of one after another.
+
+    Litestar enters each ``CLIPlugin.server_lifespan`` in plugin order, so
+    startup costs the sum of all lifespans. Here each lifespan runs on its own
+    thread and startup costs the slowest dependency chain. ``dependencies``
+    maps a plugin type to the plugin types whose lifespans must be up before
+    its own starts and stay up until it has exited.
+
+    If a lifespan fails to start, the lifespans that did start are exited
+    before the first startup error is raised.
+    """
+
+    def __init__(self, app: Any, *, dependencies: Mapping[type, Sequence[type]] | None = None) -> None:
+        self.app = app
+        self.lifespans = _plan_lifespans(app, dependencies or {})
+
+    def start(self) -> None:
+        """Enter every lifespan, each once its dependencies have entered.
+
+        If any lifespan fails to start, or the wait is interrupted, for example
+        by ``KeyboardInterrupt``, the lifespans that did start are exited
+        before the error is re-raised.
+
+        Raises:
+            RuntimeError: If a lifespan did not start without raising an error of its own.
+        """
+        try:
+            for lifespan in self.lifespans:
+                lifespan.start()
+            for lifespan in self.lifespans:
+                lifespan.settled.wait()
+        except BaseException:
+            # The threads are daemons, so lifespans left entered would never run their exit.
+            self._join()
+            raise
+        failed = [lifespan for lifespan in self.lifespans if not lifespan.entered.is_set()]
+        if not failed:
+            return
+        # Dependents of a failed lifespan never enter and carry no error of their own.
+        error = next((lifespan.error for lifespan in failed if lifespan.error is not None), None)
+        self._join()
+        if error is None:
+            message = f"server lifespan {failed[0].name} did not start"
+            raise RuntimeError(message)
+        raise error
+
+    def stop(self) -> None:
+        """Exit every lifespan, each once its dependents have exited, and re-raise the first exit error."""
+        self._join()
+        error = next((lifespan.error for lifespan in self.lifespans if lifespan.error is not None), None)
+        if error is not None:
+            raise error
+
+    def startup_summary(self) -> str:
+        """Describe how long each lifespan took to start.
+
+        Returns:
+            One line with the per-lifespan startup times.
+        """
+        timings = ", ".join(f"{lifespan.name} {lifespan.startup or 0.0:.2f}s" for lifespan in self.lifespans)
+        return f"Server lifespans started concurrently: {timings}"
+
+    def shutdown_summary(self) -> str:
+        """Describe how long each lifespan took to exit.
+
+        Returns:
+            One line with the per-lifespan shutdown times.
+        """
+        timings = ", ".join(
+            f"{lifespan.name} {lifespan.shutdown:.2f}s" for lifespan in self.lifespans if lifespan.shutdown is not None
+        )
+        return f"Server lifespans stopped: {timings}"
+
+    def _join(self) -> None:
+        for lifespan in self.lifespans:
+            lifespan.stop.set()
+            if not lifespan.started:
+                # Its dependencies wait for it to exit before they exit themselves.
+                lifespan.exited.set()
+        for lifespan in self.lifespans:
+            lifespan.join()
+
+
+def _plan_lifespans(app: Any, dependencies: Mapping[type, Sequence[type]]) -> list[_LifespanThread]:
+    """Build one lifespan thread per server lifespan manager and link declared dependencies.
+
+    Returns:
+        The lifespan threads in Litestar's plugin order.
+    """
+    managers = app._server_lifespan_managers
+    lifespans = [_LifespanThread(manager, app=app, name=_lifespan_name(manager)) for manager in managers]
+    owners = [getattr(manager, "__self__", manager) for manager in managers]
+    for lifespan, owner in zip(lifespans, owners, strict=True):
+        required = tuple(
+            dependency for kind, kinds in dependencies.items() if isinstance(owner, kind) for dependency in kinds
+        )
+        for other, other_owner in zip(lifespans, owners, strict=True):
+            if other is not lifespan and isinstance(other_owner, required):
+                lifespan.dependencies.append(other)
+                other.dependents.append(lifespan)
+    _check_acyclic(lifespans)
+    return lifespans
+
+
+def _check_acyclic(lifespans: Sequence[_LifespanThread]) -> None:
+    """Reject dependencies that would leave lifespans waiting on each other forever.
+
+    Raises:
+        ValueError: If the dependencies form a cycle.
+    """
+    remaining = {id(lifespan): len(lifespan.dependencies) for lifespan in lifespans}
+    ready = [lifespan for lifespan in lifespans if not lifespan.dependencies]
+    while ready:
+        for dependent in ready.pop().dependents:
+            remaining[id(dependent)] -= 1
+            if remaining[id(dependent)] == 0:
+                ready.append(dependent)
+    cycle = [lifespan.name for lifespan in lifespans if remaining[id(lifespan)]]
+    if cycle:
+        message = f"server lifespan dependencies form a cycle between {', '.join(cycle)}"
+        raise ValueError(message)
+
+
+def _lifespan_name(manager: Any) -> str:
+    return type(getattr(manager, "__self__", manager)).__name__
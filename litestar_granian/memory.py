@@ -0,0 +1,96 @@
+"""Shed memory the supervising Litestar parent no longer needs once Granian runs."""
+
+import ctypes
+import gc
+import linecache
+import os
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+_MIB = 1024 * 1024
+_STATM = Path("/proc/self/statm")
+
+
+@dataclass(frozen=True)
+class _MemoryRelease:
+    """Resident set sizes around one release of parent memory."""
+
+    before: int | None
+    after: int | None
+    trimmed: bool
+    frozen: int
+
+    def summary(self) -> str:
+        """Describe the release for the startup output.
+
+        Returns:
+            One line with the parent RSS before and after, when it can be read.
+        """
+        steps = ["collected"]
+        if self.trimmed:
+            steps.append("trimmed")
+        if self.frozen:
+            steps.append(f"{self.frozen:,} objects frozen")
+        done = ", ".join(steps)
+        if self.before is None or self.after is None:
+            return f"Litestar parent memory released ({done})"
+        return f"Litestar parent RSS {self.before / _MIB:.1f} MiB -> {self.after / _MIB:.1f} MiB ({done})"
+
+
+def _release_parent_memory(*, freeze: bool) -> _MemoryRelease:
+    """Return memory the parent kept from importing and configuring the application.
+
+    Clears interpreter caches the parent no longer reads, collects garbage,
+    optionally freezes the survivors so later collections skip them, and
+    hands freed heap pages back to the kernel with ``malloc_trim`` on glibc.
+
+    Returns:
+        The parent RSS before and after, and what was done.
+    """
+    before = _resident_set_size()
+    linecache.clearcache()
+    re.purge()
+    gc.collect()
+    frozen = 0
+    if freeze:
+        gc.freeze()
+        frozen = gc.get_freeze_count()
+    trimmed = _malloc_trim()
+    return _MemoryRelease(before=before, after=_resident_set_size(), trimmed=trimmed, frozen=frozen)
+
+
+def _resident_set_size(pid: int | None = None) -> int | None:
+    """Read the current resident set size of this process, or of ``pid``.
+
+    Returns:
+        The RSS in bytes, or ``None`` where ``/proc`` is unavailable or the process is gone.
+    """
+    statm = _STATM if pid is None else Path(f"/proc/{pid}/statm")
+    try:
+        resident_pages = int(statm.read_text(encoding="ascii").split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _malloc_trim() -> bool:
+    """Release free heap pages to the kernel where glibc supports it.
+
+    Returns:
+        ``True`` when ``malloc_trim(0)`` ran.
+    """
+    if sys.platform != "linux":
+        return False
+    try:
+        if not os.confstr("CS_GNU_LIBC_VERSION"):
+            return False
+    except (ValueError, OSError):
+        # musl and other C libraries do not answer the glibc version query.
+        return False
+    malloc_trim = getattr(ctypes.CDLL(None), "malloc_trim", None)
+    if malloc_trim is None:
+        return False
+    malloc_trim(0)
+    return True
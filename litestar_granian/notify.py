@@ -0,0 +1,98 @@
+"""Announce supervisor readiness to service managers and orchestrators."""
+
+import logging
+import os
+import socket
+import tempfile
+from contextlib import suppress
+from pathlib import Path
+
+_NOTIFY_SOCKET_ENV = "NOTIFY_SOCKET"
+
+logger = logging.getLogger("litestar_granian.notify")
+
+
+class _ReadinessAnnouncer:
+    """Publish readiness through ``sd_notify`` and an optional readiness file.
+
+    ``NOTIFY_SOCKET`` follows the systemd protocol: ``READY=1`` once every
+    worker of the serving child is ready, ``STATUS=`` on supervisor state
+    changes, and ``STOPPING=1`` when shutdown begins. The readiness file is
+    replaced atomically, so a reader never observes a partial write, and is
+    removed as soon as the server stops being ready.
+    """
+
+    def __init__(self, *, notify_socket: str | None, ready_file: Path | None) -> None:
+        self.ready_file = ready_file.resolve() if ready_file is not None else None
+        self._address = _notify_address(notify_socket) if notify_socket else None
+        self._socket: socket.socket | None = None
+        if self._address is not None:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)  # type: ignore[attr-defined,unused-ignore]
+        self._remove_ready_file()
+
+    @property
+    def notifies(self) -> bool:
+        return self._socket is not None
+
+    def ready(self, *, generation: int, workers: int) -> None:
+        """Announce that every worker of ``generation`` is serving."""
+        status = f"Serving with {workers} worker{'s' if workers != 1 else ''} (generation {generation})"
+        # Write the file first so a manager reacting to READY=1 already finds it.
+        if self.ready_file is not None:
+            try:
+                _replace_file(self.ready_file, f"READY=1\nMAINPID={os.getpid()}\nGENERATION={generation}\n")
+            except OSError as exc:
+                # The server is serving either way; a lost readiness file must not stop it.
+                logger.warning("Could not write the ready file %s: %s", self.ready_file, exc)
+        self._notify("READY=1", f"MAINPID={os.getpid()}", f"STATUS={status}")
+
+    def status(self, status: str) -> None:
+        """Publish a free-form supervisor status line."""
+        self._notify(f"STATUS={status}")
+
+    def withdraw(self, status: str) -> None:
+        """Publish ``status`` and remove the readiness file while no child serves."""
+        self._notify(f"STATUS={status}")
+        self._remove_ready_file()
+
+    def stopping(self) -> None:
+        """Announce that shutdown started and withdraw the readiness file."""
+        self._notify("STOPPING=1", "STATUS=Stopping")
+        self._remove_ready_file()
+
+    def close(self) -> None:
+        self._remove_ready_file()
+        if self._socket is not None:
+            with suppress(OSError):
+                self._socket.close()
+            self._socket = None
+
+    def _remove_ready_file(self) -> None:
+        if self.ready_file is not None:
+            with suppress(OSError):
+                self.ready_file.unlink(missing_ok=True)
+
+    def _notify(self, *fields: str) -> None:
+        if self._socket is None or self._address is None:
+            return
+        try:
+            self._socket.sendto("\n".join(fields).encode("utf-8"), self._address)
+        except OSError as exc:
+            logger.debug("Could not notify the service manager: %s", exc)
+
+
+def _notify_address(value: str) -> str | bytes:
+    # A leading "@" names a Linux abstract-namespace socket.
+    return b"\0" + value[1:].encode() if value.startswith("@") else value
+
+
+def _replace_file(path: Path, content: str) -> None:
+    fd, raw_path = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    temporary = Path(raw_path)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as stream:
+            stream.write(content)
+        temporary.replace(path)
+    except OSError:
+        temporary.unlink(missing_ok=True)
+        raise
@@ -1,5 +1,6 @@
 """Expose the public plugin that installs the supervised Granian command."""
 
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Literal
 
 from litestar.plugins import CLIPluginProtocol, InitPlugin
@@ -23,29 +24,43 @@ class GranianPlugin(InitPlugin, CLIPluginProtocol):
             static routing. ``"auto"`` consumes exactly one compatible static
             provider when its configuration is safe, otherwise it falls back
             to Litestar. Explicit CLI mounts always take precedence.
+        lifespan_dependencies: Server lifespan ordering for
+            ``--concurrent-lifespans``. Maps a plugin type to the plugin types
+            whose server lifespans must start before its own and stop after
+            it. Plugins are matched with ``isinstance``.
 
     Raises:
-        ValueError: If ``static`` is not one of the documented literal values.
+        ValueError: If ``static`` is not one of the documented literal values,
+            or ``lifespan_dependencies`` names something other than a class.
     """
 
-    __slots__ = ("static",)
+    __slots__ = ("lifespan_dependencies", "static")
 
     static: StaticMode
+    lifespan_dependencies: dict[type, tuple[type, ...]]
 
     def __init__(
         self,
         *,
         static: StaticMode = "off",
+        lifespan_dependencies: Mapping[type, Sequence[type]] | None = None,
     ) -> None:
         if static not in {"off", "auto"}:
             message = "static must be 'off' or 'auto'"
             raise ValueError(message)
+        dependencies = {kind: tuple(kinds) for kind, kinds in (lifespan_dependencies or {}).items()}
+        if not all(isinstance(kind, type) for item in dependencies.items() for kind in (item[0], *item[1])):
+            message = "lifespan_dependencies must map plugin types to sequences of plugin types"
+            raise ValueError(message)
         self.static = static
+        self.lifespan_dependencies = dependencies
 
     def on_cli_init(self, cli: "Group") -> None:  # ruff: ignore[no-self-use]
-        from litestar_granian.cli import run_command
+        from litestar_granian._lazy import _LazyRunCommand
+        from litestar_granian.startup import _timeline
 
-        cli.add_command(run_command)
+        _timeline.mark_cli_initialized()
+        cli.add_command(_LazyRunCommand())
 
     def on_app_init(self, app_config: "AppConfig") -> "AppConfig":
         return super().on_app_init(app_config)
@@ -0,0 +1,182 @@
+"""Report Granian worker readiness back to the supervising Litestar parent."""
+
+import itertools
+import os
+import select
+import shutil
+import socket
+import tempfile
+import time
+from collections.abc import Callable
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
+
+from litestar_granian.startup import _RUNNER_STARTED_ENV
+
+_READY_SOCKET_ENV = "LITESTAR_GRANIAN_READY_SOCKET"
+_GENERATION_ENV = "LITESTAR_GRANIAN_GENERATION"
+_POLL_INTERVAL = 0.1
+_MAX_DATAGRAM = 4096
+_REPORT_SEQUENCE = itertools.count(1)
+
+
+def _parse_report(payload: bytes) -> dict[str, str]:
+    """Parse one ``KEY=value`` line-oriented readiness datagram.
+
+    Returns:
+        The reported fields. Malformed lines are ignored.
+    """
+    fields: dict[str, str] = {}
+    for line in payload.decode("utf-8", errors="replace").splitlines():
+        key, separator, value = line.partition("=")
+        if separator:
+            fields[key.strip()] = value.strip()
+    return fields
+
+
+class _ReadinessChannel:
+    """Receive ``READY`` datagrams from the workers of each child generation.
+
+    The parent binds a private ``AF_UNIX`` datagram socket and exports its path
+    to every Granian child. Each spawn carries a generation number so reports
+    from a retiring child never count toward its replacement.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self._directory = Path(tempfile.mkdtemp(prefix="litestar-granian-"))
+        self.path = self._directory / "ready.sock"
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)  # type: ignore[attr-defined,unused-ignore]
+        try:
+            self._socket.bind(str(self.path))
+        except OSError:
+            self.close()
+            raise
+        self._socket.setblocking(False)
+        self._ready: dict[int, dict[str, dict[str, str]]] = {}
+
+    def environment(self, generation: int) -> dict[str, str]:
+        """Build the child environment for one spawn.
+
+        Returns:
+            Variables that route worker reports for ``generation`` to this channel.
+        """
+        return {_READY_SOCKET_ENV: str(self.path), _GENERATION_ENV: str(generation)}
+
+    def fileno(self) -> int:
+        return self._socket.fileno()
+
+    def is_ready(self, generation: int) -> bool:
+        return len(self._ready.get(generation, ())) >= self.workers
+
+    def drain(self) -> None:
+        """Record every datagram currently queued on the channel."""
+        while True:
+            try:
+                payload = self._socket.recv(_MAX_DATAGRAM)
+            except OSError:
+                return
+            fields = _parse_report(payload)
+            if fields.get("READY") != "1":
+                continue
+            try:
+                generation = int(fields.get("GENERATION", ""))
+            except ValueError:
+                continue
+            worker = fields.get("WORKER") or fields.get("PID") or ""
+            self._ready.setdefault(generation, {})[worker] = fields
+
+    def wait(self, generation: int, *, timeout: float, alive: Callable[[], bool]) -> bool:
+        """Wait until every worker of ``generation`` has reported readiness.
+
+        Returns:
+            ``True`` once all workers reported, ``False`` if the deadline
+            expired or ``alive`` reported that the child can no longer succeed.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            self.drain()
+            if self.is_ready(generation):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not alive():
+                return False
+            select.select([self._socket], [], [], min(remaining, _POLL_INTERVAL))
+
+    def reports(self, generation: int) -> list[dict[str, str]]:
+        """Return the fields of every worker report received for ``generation``.
+
+        Returns:
+            One parsed datagram per reporting worker.
+        """
+        return list(self._ready.get(generation, {}).values())
+
+    def forget(self, generation: int) -> None:
+        self._ready.pop(generation, None)
+
+    def close(self) -> None:
+        with suppress(OSError):
+            self._socket.close()
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+
+class _ReadyReport:
+    """The final ``on_startup`` hook that reports this worker with its application load timing."""
+
+    __slots__ = ("load_finished", "load_started")
+
+    def __init__(self, *, load_started: float, load_finished: float) -> None:
+        self.load_started = load_started
+        self.load_finished = load_finished
+
+    def __call__(self) -> None:
+        _report_ready(load_started=self.load_started, load_finished=self.load_finished)
+
+
+def _report_ready(*, load_started: float | None = None, load_finished: float | None = None) -> None:
+    """Send this worker's ``READY`` datagram when a parent channel exists.
+
+    The datagram also carries :func:`time.monotonic` marks for the startup
+    report: when the Granian runner started, when this worker loaded the
+    application, and when it became ready.
+    """
+    path = os.environ.get(_READY_SOCKET_ENV)
+    if not path or not hasattr(socket, "AF_UNIX"):
+        return
+    worker = f"{os.getpid()}-{next(_REPORT_SEQUENCE)}"
+    lines = [
+        "READY=1",
+        f"GENERATION={os.environ.get(_GENERATION_ENV, '0')}",
+        f"PID={os.getpid()}",
+        f"WORKER={worker}",
+        f"READY_AT={time.monotonic()!r}",
+    ]
+    runner_started = os.environ.get(_RUNNER_STARTED_ENV)
+    if runner_started:
+        lines.append(f"RUNNER_STARTED={runner_started}")
+    if load_started is not None and load_finished is not None:
+        lines.extend((f"LOAD_STARTED={load_started!r}", f"LOAD_FINISHED={load_finished!r}"))
+    payload = "\n".join(lines)
+    with suppress(OSError), socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sender:  # type: ignore[attr-defined,unused-ignore]
+        sender.sendto(payload.encode("utf-8"), path)
+
+
+def _load_reporting_target(target: str, *, loader: Callable[[str], Any]) -> Any:
+    """Load the Granian target with ``loader`` and report readiness after application startup.
+
+    Litestar applications report from a final ``on_startup`` hook so the report
+    follows every user startup hook. Other ASGI targets report once loaded.
+
+    Returns:
+        The loaded Granian target.
+    """
+    load_started = time.monotonic()
+    loaded = loader(target)
+    load_finished = time.monotonic()
+    startup_hooks = getattr(loaded, "on_startup", None)
+    if isinstance(startup_hooks, list):
+        startup_hooks.append(_ReadyReport(load_started=load_started, load_finished=load_finished))
+    else:
+        _report_ready(load_started=load_started, load_finished=load_finished)
+    return loaded
@@ -0,0 +1,339 @@
+"""Watch application files and reload Granian, from its main process or from the Litestar parent."""
+
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path, PurePath
+from typing import Any
+
+import watchfiles
+from watchfiles import Change
+from watchfiles.filters import DefaultFilter
+
+# Batches reach the filter in set order, so the cache should hold every directory a large checkout touches.
+_DIRECTORY_CACHE_SIZE = 16384
+# watchfiles' default for how long its Rust watcher waits for a change before returning empty-handed.
+_RUST_TIMEOUT = 5000
+_LOGGED_CHANGES = 10
+
+logger = logging.getLogger("litestar_granian.reloader")
+
+
+class _Reloader(str, Enum):
+    """Which process watches files for ``--reload``."""
+
+    granian = "granian"
+    parent = "parent"
+
+
+class _ReloadPatternFilter(DefaultFilter):
+    """Apply Litestar's reload globs to Granian's reloader.
+
+    A checkout or branch switch can deliver tens of thousands of events at
+    once, so the include and exclude globs are compiled into one regex each
+    and excluded directories into one prefix regex. Directory decisions are
+    cached, since a storm touches far fewer directories than files.
+    """
+
+    include_patterns: tuple[str, ...] = ()
+    exclude_patterns: tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        includes: tuple[str, ...] | None = None,
+        excludes: tuple[str, ...] | None = None,
+    ) -> None:
+        configured_includes = includes if includes is not None else self.include_patterns
+        configured_excludes = excludes if excludes is not None else self.exclude_patterns
+        default_includes = () if "*.py" in configured_excludes else ("*.py",)
+        self._includes = tuple(dict.fromkeys((*default_includes, *configured_includes)))
+        default_excludes = (".*", ".py[cod]", ".sw.*", "~*")
+        self._excludes = tuple(
+            pattern for pattern in (*default_excludes, *configured_excludes) if pattern not in self._includes
+        )
+        self._exclude_dirs = tuple(
+            path.resolve() for pattern in configured_excludes if (path := Path(pattern)).is_dir()
+        )
+        self._include_globs = _CompiledGlobs(self._includes)
+        self._exclude_globs = _CompiledGlobs(self._excludes)
+        self._excluded_directory = _compile_directories(self._exclude_dirs)
+        self._exclude_dir_paths = frozenset(str(directory) for directory in self._exclude_dirs)
+        self._directory_allowed = lru_cache(maxsize=_DIRECTORY_CACHE_SIZE)(self._allows_directory)
+        super().__init__()
+
+    def __call__(self, change: Any, path: str) -> bool:
+        directory, _, name = path.rpartition(os.sep)
+        if not self._directory_allowed(directory):
+            return False
+        candidate = _posix_path(path)
+        if not self._include_globs.matches(candidate, name) or self._exclude_globs.matches(candidate, name):
+            return False
+        # The rest of DefaultFilter's checks, for the entry itself; its directories were checked above.
+        return not (
+            path in self._exclude_dir_paths
+            or name in self._ignore_dirs
+            or any(regex.search(name) for regex in self._ignore_entity_regexes)
+            or (self._ignore_paths and path.startswith(self._ignore_paths))
+        )
+
+    def _allows_directory(self, directory: str) -> bool:
+        if self._excluded_directory is not None and self._excluded_directory.match(_posix_path(directory)):
+            return False
+        # Splitting the string is several times cheaper than parsing a PurePath on a cache miss.
+        return self._ignore_dirs.isdisjoint(directory.split(os.sep))  # ruff: ignore[os-sep-split]
+
+
+def _posix_path(path: str) -> str:
+    return path if os.sep == "/" else path.replace(os.sep, "/")
+
+
+class _CompiledGlobs:
+    """``Path.match`` globs compiled into one regex for file names and one for whole paths.
+
+    Relative globs match the trailing path components, absolute globs the
+    whole path, and wildcards never cross a separator, as with ``Path.match``.
+    Most globs name a single component, so they only look at the file name.
+    """
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        names = []
+        paths = []
+        for pattern in patterns:
+            pure = PurePath(pattern)
+            parts = pure.parts[1:] if pure.anchor else pure.parts
+            if not parts:
+                continue
+            if not pure.anchor and len(parts) == 1:
+                names.append(_translate_glob(parts[0]))
+                continue
+            anchor = f"^{re.escape(_posix_path(pure.anchor))}" if pure.anchor else "(?:^|/)"
+            paths.append(anchor + "/".join(_translate_glob(part) for part in parts) + r"\Z")
+        # Path.match folds case on Windows.
+        flags = re.IGNORECASE if os.name == "nt" else 0
+        self._name = re.compile("|".join(names), flags) if names else None
+        self._path = re.compile("|".join(paths), flags) if paths else None
+
+    def matches(self, path: str, name: str) -> bool:
+        """Check the ``/``-separated ``path`` whose last component is ``name`` against every glob.
+
+        Returns:
+            ``True`` if any glob matches.
+        """
+        if self._name is not None and self._name.fullmatch(name):
+            return True
+        return self._path is not None and self._path.search(path) is not None
+
+
+def _translate_glob(part: str) -> str:
+    """Translate one ``fnmatch`` path component into a regex that stays within the component.
+
+    Returns:
+        The regex source for ``part``.
+    """
+    translated = []
+    index, length = 0, len(part)
+    while index < length:
+        character = part[index]
+        index += 1
+        if character == "*":
+            translated.append("[^/]*")
+        elif character == "?":
+            translated.append("[^/]")
+        elif character == "[":
+            end = index + (part[index : index + 1] == "!")
+            end += part[end : end + 1] == "]"
+            end = part.find("]", end)
+            if end < 0:
+                translated.append(re.escape(character))
+                continue
+            translated.append(_translate_set(part[index:end]))
+            index = end + 1
+        else:
+            translated.append(re.escape(character))
+    return "(?:" + "".join(translated) + ")"
+
+
+def _translate_set(members: str) -> str:
+    members = re.sub(r"([&~|])", r"\\\1", members.replace("\\", "\\\\"))
+    if members.startswith("!"):
+        translated = f"[^{members[1:]}/]"
+    elif members.startswith(("^", "[")):
+        translated = f"[\\{members}]"
+    else:
+        translated = f"[{members}]"
+    try:
+        re.compile(translated)
+    except re.error:
+        # fnmatch treats an empty range such as [z-a] as matching nothing.
+        return "(?!)"
+    return translated
+
+
+def _compile_directories(directories: Sequence[Path]) -> "re.Pattern[str] | None":
+    if not directories:
+        return None
+    prefixes = "|".join(re.escape(_posix_path(str(directory)).rstrip("/")) for directory in directories)
+    return re.compile(f"(?:{prefixes})(?:/|\\Z)", re.IGNORECASE if os.name == "nt" else 0)
+
+
+def _reload_filter(
+    *,
+    includes: tuple[str, ...],
+    excludes: tuple[str, ...],
+    ignore_dirs: tuple[str, ...],
+    ignore_patterns: tuple[str, ...],
+    ignore_paths: tuple[Path, ...],
+) -> _ReloadPatternFilter:
+    """Build the filter Granian's reloader would apply for the same ``--reload-*`` options.
+
+    Returns:
+        A filter with Litestar's globs and watchfiles' default ignores extended like Granian extends them.
+    """
+    directories = (*DefaultFilter.ignore_dirs, *ignore_dirs)
+    entity_patterns = (*DefaultFilter.ignore_entity_patterns, *ignore_patterns)
+    paths = (*DefaultFilter.ignore_paths, *ignore_paths)
+
+    class LitestarReloadFilter(_ReloadPatternFilter):
+        include_patterns = includes
+        exclude_patterns = excludes
+        ignore_dirs = directories
+        ignore_entity_patterns = entity_patterns
+        ignore_paths = paths
+
+    return LitestarReloadFilter()
+
+
+@dataclass(frozen=True)
+class _ReloadBatch:
+    """Changes coalesced into one reload."""
+
+    changes: frozenset[tuple[Change, str]]
+    events: int
+    batches: int
+
+
+def _coalesce_changes(
+    batches: Iterable[set[tuple[Change, str]]],
+    *,
+    wait_for_quiet: bool,
+    min_interval: float,
+) -> Iterator[_ReloadBatch]:
+    """Merge watchfiles batches into reloads.
+
+    With ``wait_for_quiet``, changes keep accumulating until watchfiles yields
+    an empty batch, which it does once its timeout passes without changes.
+    ``min_interval`` seconds must separate two reloads; changes arriving
+    sooner are held and merged into the next one.
+
+    Yields:
+        One batch of coalesced changes per reload.
+    """
+    pending: set[tuple[Change, str]] = set()
+    events = 0
+    merged = 0
+    next_reload = 0.0
+    for changes in batches:
+        if changes:
+            pending |= changes
+            events += len(changes)
+            merged += 1
+            if wait_for_quiet:
+                continue
+        if not pending:
+            continue
+        if min_interval:
+            now = time.monotonic()
+            if now < next_reload:
+                continue
+            next_reload = now + min_interval
+        yield _ReloadBatch(frozenset(pending), events, merged)
+        pending = set()
+        events = 0
+        merged = 0
+
+
+class _ParentReloader:
+    """Watch files from the Litestar parent and ask the supervisor for a fresh Granian child on changes.
+
+    Granian's own reloader runs in its main process and is unavailable on
+    free-threaded Python. Watching from the parent works on every build and
+    restarts only the child, so server lifespans stay up across reloads.
+
+    A branch switch or code generator can write hundreds of files over a few
+    hundred milliseconds. ``quiet_period`` holds the reload until that many
+    milliseconds pass without changes, and ``min_interval`` caps the reload
+    rate, so such a burst costs one child import instead of several.
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[Path],
+        *,
+        watch_filter: DefaultFilter,
+        tick: int,
+        quiet_period: int = 0,
+        min_interval: int = 0,
+    ) -> None:
+        self.paths = tuple(paths)
+        self.watch_filter = watch_filter
+        self.tick = tick
+        self.quiet_period = quiet_period
+        self.min_interval = min_interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self, on_change: Callable[[], object]) -> None:
+        """Watch on a daemon thread and call ``on_change`` once per coalesced batch of changes."""
+        self._thread = threading.Thread(
+            target=self._watch, args=(on_change,), name="litestar-granian-reloader", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching and wait for the watcher thread to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _watch(self, on_change: Callable[[], object]) -> None:
+        holds = bool(self.quiet_period or self.min_interval)
+        try:
+            batches = watchfiles.watch(
+                *self.paths,
+                watch_filter=self.watch_filter,
+                stop_event=self._stop,
+                step=self.tick,
+                # Empty batches on timeout tell a quiet window apart and let held changes through later.
+                rust_timeout=(self.quiet_period or self.tick) if holds else _RUST_TIMEOUT,
+                yield_on_timeout=holds,
+                raise_interrupt=False,
+            )
+            for batch in _coalesce_changes(
+                batches, wait_for_quiet=bool(self.quiet_period), min_interval=self.min_interval / 1000
+            ):
+                _log_batch(batch)
+                on_change()
+        except Exception:
+            logger.exception("File watching stopped; later changes will not reload the Granian child")
+
+
+def _log_batch(batch: _ReloadBatch) -> None:
+    if batch.batches > 1 or batch.events > len(batch.changes):
+        logger.info(
+            "Changes detected, reloading the Granian child (%d events in %d batches coalesced into one reload)",
+            batch.events,
+            batch.batches,
+        )
+    else:
+        logger.info("Changes detected, reloading the Granian child")
+    changes = sorted(batch.changes)
+    for change, path in changes[:_LOGGED_CHANGES]:
+        logger.info("%s: %s", change.raw_str().capitalize(), path)
+    if len(changes) > _LOGGED_CHANGES:
+        logger.info("... and %d more changed paths", len(changes) - _LOGGED_CHANGES)
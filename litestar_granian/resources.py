@@ -0,0 +1,226 @@
+"""Size Granian workers from the CPUs and memory the process may actually use."""
+
+import logging
+import math
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from litestar_granian.memory import _MIB, _resident_set_size
+
+_AUTO = "auto"
+_MAX_RSS_AUTO_ENV = "LITESTAR_GRANIAN_MAX_RSS_AUTO"
+# Kept free of worker budgets so page cache, sockets, and brief spikes do not push the cgroup into OOM kills.
+_RSS_HEADROOM = 0.1
+_MIN_WORKER_RSS = 64 * _MIB
+_PROC = Path("/proc")
+_PROC_CGROUP = Path("/proc/self/cgroup")
+# /proc/<pid>/stat field 5, counted from the first field after the parenthesized command name.
+_PGRP_FIELD = 2
+_CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+logger = logging.getLogger("litestar_granian.resources")
+
+
+@dataclass(frozen=True)
+class _CPUBudget:
+    """The CPUs this process may run on, by each limit that applies."""
+
+    logical: int
+    affinity: int | None
+    quota: float | None
+
+    @property
+    def cpus(self) -> int:
+        """The whole CPUs left once every limit is applied."""
+        limits = [self.logical]
+        if self.affinity is not None:
+            limits.append(self.affinity)
+        if self.quota is not None:
+            limits.append(max(math.floor(self.quota), 1))
+        return min(limits)
+
+
+@dataclass(frozen=True)
+class _AutoWorkers:
+    """The ``--workers auto`` decision and what it was derived from."""
+
+    count: int
+    budget: _CPUBudget
+    runtime_threads: int
+
+    def summary(self) -> str:
+        """Describe the decision for the startup output.
+
+        Returns:
+            One line with the worker count and every limit that was considered.
+        """
+        limits = [] if self.budget.affinity is None else [f"affinity {self.budget.affinity}"]
+        limits.append(f"cgroup quota {self.budget.quota:g}" if self.budget.quota is not None else "no cgroup quota")
+        threads = "thread" if self.runtime_threads == 1 else "threads"
+        return (
+            f"Granian workers: {self.count} (auto: {self.budget.cpus} of {self.budget.logical} logical CPUs usable; "
+            f"{', '.join(limits)}; {self.runtime_threads} runtime {threads} per worker)"
+        )
+
+
+@dataclass(frozen=True)
+class _MemoryBudget:
+    """The ``--workers-max-rss auto`` ceiling and what it was derived from."""
+
+    limit: int
+    source: str
+    baseline: int
+    workers: int
+
+    @property
+    def per_worker(self) -> int:
+        """The RSS in bytes each worker may reach before Granian respawns it."""
+        available = self.limit * (1 - _RSS_HEADROOM) - self.baseline
+        return max(int(available // self.workers), _MIN_WORKER_RSS)
+
+    def summary(self) -> str:
+        """Describe the budget for the startup output.
+
+        Returns:
+            One line with the per-worker ceiling and the figures it came from.
+        """
+        return (
+            f"{self.per_worker // _MIB} MiB per worker ({self.source} {self.limit // _MIB} MiB, "
+            f"{_RSS_HEADROOM:.0%} headroom, {self.baseline // _MIB} MiB for the parent and Granian main process, "
+            f"{self.workers} workers)"
+        )
+
+
+def _auto_workers(*, runtime_threads: int) -> _AutoWorkers:
+    """Choose one worker per usable CPU, shared among each worker's runtime threads.
+
+    Returns:
+        The worker count with the CPU budget it was derived from.
+    """
+    budget = _cpu_budget()
+    decision = _AutoWorkers(max(budget.cpus // runtime_threads, 1), budget, runtime_threads)
+    logger.debug(decision.summary())
+    return decision
+
+
+def _cpu_budget() -> _CPUBudget:
+    """Read the logical CPU count, the affinity mask, and the cgroup v2 CPU quota.
+
+    Returns:
+        The budget; limits that do not apply on this platform are ``None``.
+    """
+    affinity = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else None
+    return _CPUBudget(os.cpu_count() or 1, affinity, _cgroup_cpu_quota())
+
+
+def _memory_budget(*, workers: int, pids: tuple[int | None, ...]) -> _MemoryBudget:
+    """Split the memory limit, minus the RSS of ``pids``, across ``workers`` with headroom.
+
+    ``None`` in ``pids`` stands for this process.
+
+    Returns:
+        The per-worker budget with the figures it was derived from.
+    """
+    limit, source = _memory_limit()
+    baseline = sum(rss for pid in pids if (rss := _resident_set_size(pid)) is not None)
+    return _MemoryBudget(limit, source, baseline, workers)
+
+
+def _memory_limit() -> tuple[int, str]:
+    """Read the tightest cgroup v2 ``memory.max`` or ``memory.high`` on this process's path.
+
+    ``memory.high`` throttles and reclaims before ``memory.max`` kills, so
+    either one bounds what the workers can use.
+
+    Returns:
+        The limit in bytes and where it came from; physical memory without a cgroup limit.
+    """
+    limits = [
+        (int(value), f"cgroup {name}")
+        for directory in _cgroup_directories()
+        for name in ("memory.max", "memory.high")
+        if (value := _read_cgroup_value(directory / name)).isdigit()
+    ]
+    if limits:
+        return min(limits)
+    return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES"), "physical memory"
+
+
+def _process_group_memory(pgid: int) -> int | None:
+    """Sum the memory of every process in process group ``pgid``.
+
+    Each process counts its proportional set size from ``smaps_rollup``, so
+    pages forked workers still share with the Granian main process are
+    counted once across the group rather than once per worker. Kernels
+    without ``smaps_rollup`` fall back to the resident set size.
+
+    Returns:
+        The group's memory in bytes, or ``None`` if no member could be read.
+    """
+    sizes = [
+        size
+        for entry in _PROC.iterdir()
+        if entry.name.isdigit() and _process_group(entry) == pgid
+        if (size := _proportional_set_size(entry) or _resident_set_size(int(entry.name))) is not None
+    ]
+    return sum(sizes) if sizes else None
+
+
+def _process_group(entry: Path) -> int | None:
+    try:
+        return int((entry / "stat").read_text(encoding="ascii").rpartition(")")[2].split()[_PGRP_FIELD])
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def _proportional_set_size(entry: Path) -> int | None:
+    try:
+        rollup = (entry / "smaps_rollup").read_text(encoding="ascii")
+    except OSError:
+        return None
+    for line in rollup.splitlines():
+        if line.startswith("Pss:"):
+            return int(line.split()[1]) * 1024
+    return None
+
+
+def _cgroup_cpu_quota() -> float | None:
+    """Read the tightest ``cpu.max`` quota on this process's cgroup v2 path.
+
+    A quota set on any ancestor cgroup caps every cgroup below it, so the
+    smallest quota along the path applies.
+
+    Returns:
+        The quota in CPUs, or ``None`` without cgroup v2 or without a quota.
+    """
+    quotas = []
+    for directory in _cgroup_directories():
+        limit, _, period = _read_cgroup_value(directory / "cpu.max").partition(" ")
+        if limit.isdigit() and period.isdigit() and int(period):
+            quotas.append(int(limit) / int(period))
+    return min(quotas, default=None)
+
+
+def _read_cgroup_value(path: Path) -> str:
+    try:
+        return path.read_text(encoding="ascii").strip()
+    except OSError:
+        return ""
+
+
+def _cgroup_directories() -> list[Path]:
+    """List this process's cgroup v2 directory and its ancestors, innermost first.
+
+    Returns:
+        Directories under the cgroup v2 mount; empty where cgroup v2 is unavailable.
+    """
+    try:
+        lines = _PROC_CGROUP.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return []
+    relative = next((line[3:] for line in lines if line.startswith("0::")), None)
+    if relative is None:
+        return []
+    directory = _CGROUP_ROOT / relative.lstrip("/")
+    return [directory, *(parent for parent in directory.parents if parent.is_relative_to(_CGROUP_ROOT))]
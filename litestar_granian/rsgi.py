@@ -0,0 +1,229 @@
+"""Serve a Litestar application through Granian's RSGI interface."""
+
+import logging
+import sys
+from collections.abc import AsyncIterator, Callable
+from enum import Enum
+from functools import lru_cache
+from typing import Any, cast
+
+_RSGI_ENV = "LITESTAR_GRANIAN_RSGI"
+_ASGI_VERSION = {"version": "3.0", "spec_version": "2.3"}
+# Request bodies up to this size are read with one call into Granian; larger or unsized bodies are streamed.
+_BUFFERED_BODY_LIMIT = 64 * 1024
+# granian.rsgi.WebsocketMessageType values; anything else is the peer closing.
+_WS_BYTES, _WS_STRING = 1, 2
+
+logger = logging.getLogger("litestar_granian.rsgi")
+
+
+class _Interface(str, Enum):
+    """The Granian interface Litestar is served through."""
+
+    asgi = "asgi"
+    rsgi = "rsgi"
+
+
+class _RSGIApp:
+    """Expose an ASGI application as a Granian RSGI target.
+
+    Granian's ASGI layer builds every request out of scope dictionaries and
+    ``receive``/``send`` message round trips. Under RSGI the request body is
+    read and the response written with single calls into Granian, so only the
+    scope and the messages the application itself sends are translated here.
+    Lifespan events run through Granian's own ASGI lifespan handler from the
+    RSGI worker init and teardown hooks.
+    """
+
+    def __init__(self, app: Callable[..., Any], *, root_path: str = "") -> None:
+        self.app = app
+        self.root_path = root_path
+        self._lifespan: Any = None
+        self._state: dict[str, Any] = {}
+
+    def __rsgi_init__(self, loop: Any) -> None:  # ruff: ignore[bad-dunder-method-name]
+        from granian.asgi import LifespanProtocol
+
+        self._lifespan = cast("Callable[[Any], Any]", LifespanProtocol)(self.app)
+        self._state = self._lifespan.state
+        loop.run_until_complete(self._lifespan.startup())
+        if self._lifespan.interrupt:
+            logger.error("ASGI lifespan startup failed", exc_info=self._lifespan.exc)
+            sys.exit(1)
+
+    def __rsgi_del__(self, loop: Any) -> None:  # ruff: ignore[bad-dunder-method-name]
+        if self._lifespan is not None:
+            loop.run_until_complete(self._lifespan.shutdown())
+
+    def __rsgi__(self, scope: Any, protocol: Any) -> Any:  # ruff: ignore[bad-dunder-method-name]
+        if scope.proto == "http":
+            return self._serve_http(scope, protocol)
+        return self._serve_websocket(scope, protocol)
+
+    async def _serve_http(self, scope: Any, protocol: Any) -> None:
+        exchange = _HTTPExchange(protocol, scope.headers)
+        await self.app(
+            {
+                "type": "http",
+                "asgi": _ASGI_VERSION,
+                "http_version": scope.http_version,
+                "method": scope.method,
+                "scheme": scope.scheme,
+                "path": scope.path,
+                "raw_path": scope.path.encode(),
+                "query_string": scope.query_string.encode(),
+                "root_path": self.root_path,
+                "headers": _asgi_headers(scope.headers),
+                "server": _address(scope.server),
+                "client": _address(scope.client),
+                "state": self._state.copy(),
+                "extensions": {"http.response.pathsend": {}},
+            },
+            exchange.receive,
+            exchange.send,
+        )
+
+    async def _serve_websocket(self, scope: Any, protocol: Any) -> None:
+        exchange = _WebSocketExchange(protocol)
+        subprotocols = scope.headers.get("sec-websocket-protocol")
+        try:
+            await self.app(
+                {
+                    "type": "websocket",
+                    "asgi": _ASGI_VERSION,
+                    "http_version": scope.http_version,
+                    "scheme": "wss" if scope.scheme == "https" else "ws",
+                    "path": scope.path,
+                    "raw_path": scope.path.encode(),
+                    "query_string": scope.query_string.encode(),
+                    "root_path": self.root_path,
+                    "headers": _asgi_headers(scope.headers),
+                    "server": _address(scope.server),
+                    "client": _address(scope.client),
+                    "subprotocols": [item.strip() for item in subprotocols.split(",")] if subprotocols else [],
+                    "state": self._state.copy(),
+                    "extensions": {},
+                },
+                exchange.receive,
+                exchange.send,
+            )
+        finally:
+            exchange.close(1000)
+
+
+class _HTTPExchange:
+    """The ``receive`` and ``send`` callables for one HTTP request."""
+
+    __slots__ = ("_body", "_body_done", "_protocol", "_request_headers", "_response_headers", "_status", "_stream")
+
+    def __init__(self, protocol: Any, request_headers: Any) -> None:
+        self._protocol = protocol
+        self._request_headers = request_headers
+        self._body: AsyncIterator[bytes] | None = None
+        self._body_done = False
+        self._status = 200
+        self._response_headers: list[tuple[str, str]] = []
+        self._stream: Any = None
+
+    async def receive(self) -> dict[str, Any]:
+        if self._body_done:
+            await self._protocol.client_disconnect()
+            return {"type": "http.disconnect"}
+        if self._body is None:
+            length = self._request_headers.get("content-length")
+            if length is not None and length.isdigit() and int(length) <= _BUFFERED_BODY_LIMIT:
+                self._body_done = True
+                return {"type": "http.request", "body": await self._protocol(), "more_body": False}
+            self._body = aiter(self._protocol)
+        try:
+            chunk = await anext(self._body)
+        except StopAsyncIteration:
+            self._body_done = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        return {"type": "http.request", "body": chunk, "more_body": True}
+
+    async def send(self, message: dict[str, Any]) -> None:
+        kind = message["type"]
+        if kind == "http.response.body":
+            body = message.get("body", b"")
+            if self._stream is None:
+                if not message.get("more_body"):
+                    self._protocol.response_bytes(self._status, self._response_headers, body)
+                    return
+                self._stream = self._protocol.response_stream(self._status, self._response_headers)
+            if body:
+                await self._stream.send_bytes(body)
+        elif kind == "http.response.start":
+            self._status = message["status"]
+            self._response_headers = [
+                (name.decode("latin-1"), value.decode("latin-1")) for name, value in message.get("headers", ())
+            ]
+        elif kind == "http.response.pathsend":
+            self._protocol.response_file(self._status, self._response_headers, message["path"])
+
+
+class _WebSocketExchange:
+    """The ``receive`` and ``send`` callables for one websocket connection."""
+
+    __slots__ = ("_closed", "_connected", "_protocol", "_transport")
+
+    def __init__(self, protocol: Any) -> None:
+        self._protocol = protocol
+        self._transport: Any = None
+        self._connected = False
+        self._closed = False
+
+    async def receive(self) -> dict[str, Any]:
+        if not self._connected:
+            self._connected = True
+            return {"type": "websocket.connect"}
+        if self._transport is None or self._closed:
+            return {"type": "websocket.disconnect", "code": 1000}
+        message = await self._transport.receive()
+        if message.kind == _WS_STRING:
+            return {"type": "websocket.receive", "text": message.data}
+        if message.kind == _WS_BYTES:
+            return {"type": "websocket.receive", "bytes": message.data}
+        self._closed = True
+        # RSGI does not expose the peer's close code.
+        return {"type": "websocket.disconnect", "code": 1005}
+
+    async def send(self, message: dict[str, Any]) -> None:
+        kind = message["type"]
+        if kind == "websocket.send":
+            text = message.get("text")
+            if text is not None:
+                await self._transport.send_str(text)
+            else:
+                await self._transport.send_bytes(message.get("bytes") or b"")
+        elif kind == "websocket.accept":
+            self._transport = await self._protocol.accept()
+        elif kind == "websocket.close":
+            self.close(message.get("code", 1000))
+
+    def close(self, code: int) -> None:
+        if not self._closed:
+            self._closed = True
+            self._protocol.close(code)
+
+
+def _load_rsgi_target(target: str, *, loader: Callable[[str], Any], root_path: str) -> Any:
+    """Load the ASGI target with ``loader`` and wrap it for Granian's RSGI workers.
+
+    Returns:
+        The RSGI adapter around the loaded application.
+    """
+    return _RSGIApp(loader(target), root_path=root_path)
+
+
+def _asgi_headers(headers: Any) -> list[tuple[bytes, bytes]]:
+    return [(name.encode("latin-1"), value.encode("latin-1")) for name, value in headers.items()]
+
+
+@lru_cache(maxsize=1024)
+def _address(value: str) -> tuple[str, int] | None:
+    # Keep-alive clients and the server address repeat on every request of a connection.
+    host, separator, port = value.rpartition(":")
+    if not separator or not port.isdigit():
+        return None
+    return host.strip("[]"), int(port)
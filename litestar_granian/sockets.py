@@ -0,0 +1,298 @@
+"""Bind Granian listeners in the Litestar parent so they outlive every child."""
+
+import logging
+import os
+import socket
+from collections.abc import Generator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, fields
+from pathlib import Path
+
+# sd_listen_fds(3): activated descriptors start right after stdin, stdout, and stderr.
+_LISTEN_FDS_START = 3
+_LISTEN_ENVIRONMENT = ("LISTEN_PID", "LISTEN_FDS", "LISTEN_FDNAMES")
+
+logger = logging.getLogger("litestar_granian.sockets")
+
+
+@dataclass(frozen=True)
+class _SocketTuning:
+    """Socket options applied to a listener before Granian adopts it.
+
+    Connections accepted from the listener inherit these options on Linux.
+    Options the running kernel does not expose are skipped with a warning.
+    """
+
+    tcp_defer_accept: int | None = None
+    tcp_fastopen_queue: int | None = None
+    so_rcvbuf: int | None = None
+    so_sndbuf: int | None = None
+    tcp_nodelay: bool | None = None
+    tcp_keepalive_idle: int | None = None
+    tcp_keepalive_interval: int | None = None
+    tcp_keepalive_count: int | None = None
+
+    @property
+    def configured(self) -> tuple[str, ...]:
+        """The command-line names of the options that were set."""
+        return tuple(
+            f"--{item.name.replace('_', '-')}" for item in fields(self) if getattr(self, item.name) is not None
+        )
+
+    @property
+    def tcp_only(self) -> tuple[str, ...]:
+        """The configured options that only apply to TCP listeners."""
+        return tuple(name for name in self.configured if name.startswith("--tcp-"))
+
+    def apply(self, listener: socket.socket) -> None:
+        """Set every configured option on ``listener``."""
+        is_tcp = listener.family in {socket.AF_INET, socket.AF_INET6}
+        keepalive = (self.tcp_keepalive_idle, self.tcp_keepalive_interval, self.tcp_keepalive_count)
+        # TCP_KEEPIDLE is spelled TCP_KEEPALIVE on macOS.
+        idle_option = "TCP_KEEPIDLE" if hasattr(socket, "TCP_KEEPIDLE") else "TCP_KEEPALIVE"
+        settings = (
+            ("--so-rcvbuf", socket.SOL_SOCKET, "SO_RCVBUF", self.so_rcvbuf),
+            ("--so-sndbuf", socket.SOL_SOCKET, "SO_SNDBUF", self.so_sndbuf),
+            ("--tcp-nodelay", socket.IPPROTO_TCP, "TCP_NODELAY", self.tcp_nodelay),
+            ("--tcp-defer-accept", socket.IPPROTO_TCP, "TCP_DEFER_ACCEPT", self.tcp_defer_accept),
+            ("--tcp-fastopen-queue", socket.IPPROTO_TCP, "TCP_FASTOPEN", self.tcp_fastopen_queue),
+            ("--tcp-keepalive-*", socket.SOL_SOCKET, "SO_KEEPALIVE", True if any(keepalive) else None),
+            ("--tcp-keepalive-idle", socket.IPPROTO_TCP, idle_option, self.tcp_keepalive_idle),
+            ("--tcp-keepalive-interval", socket.IPPROTO_TCP, "TCP_KEEPINTVL", self.tcp_keepalive_interval),
+            ("--tcp-keepalive-count", socket.IPPROTO_TCP, "TCP_KEEPCNT", self.tcp_keepalive_count),
+        )
+        for flag, level, name, value in settings:
+            if value is None:
+                continue
+            if flag.startswith("--tcp-") and not is_tcp:
+                logger.warning("%s only applies to TCP listeners; ignoring it", flag)
+                continue
+            _set_option(listener, flag, level, name, int(value))
+
+
+@dataclass(frozen=True)
+class _BindAddress:
+    """An additional listener address given with ``--bind``."""
+
+    host: str = ""
+    port: int = 0
+    uds: str | None = None
+
+    @classmethod
+    def parse(cls, value: str) -> "_BindAddress":
+        """Parse ``HOST:PORT``, ``[IPV6]:PORT``, ``unix:PATH``, or an absolute socket path.
+
+        Returns:
+            The parsed address.
+
+        Raises:
+            ValueError: If ``value`` is not one of the accepted forms.
+        """
+        if value.startswith(("unix:", "/")):
+            path = value.removeprefix("unix:")
+            if not path:
+                message = f"{value!r} does not name a Unix socket path"
+                raise ValueError(message)
+            return cls(uds=path)
+        host, separator, raw_port = value.rpartition(":")
+        if not separator or not raw_port.isdigit() or not 0 < int(raw_port) < 65536:
+            message = f"{value!r} is not HOST:PORT, [IPV6]:PORT, or unix:PATH"
+            raise ValueError(message)
+        if host.startswith("[") and host.endswith("]"):
+            host = host[1:-1]
+        return cls(host=host, port=int(raw_port))
+
+    def __str__(self) -> str:
+        if self.uds is not None:
+            return f"unix:{self.uds}"
+        return f"[{self.host}]:{self.port}" if ":" in self.host else f"{self.host}:{self.port}"
+
+
+@dataclass(frozen=True)
+class _ActivatedListener:
+    """A listening socket passed in by a service manager."""
+
+    name: str
+    socket: socket.socket
+
+    @property
+    def address(self) -> str:
+        """The bound address, formatted for messages."""
+        bound = self.socket.getsockname()
+        if isinstance(bound, tuple):
+            host, port = bound[0], bound[1]
+            return f"[{host}]:{port}" if ":" in host else f"{host}:{port}"
+        return _unix_address(bound)
+
+
+def _activated_listeners() -> list[_ActivatedListener]:
+    """Adopt the sockets a service manager passed through ``LISTEN_FDS``.
+
+    Follows ``sd_listen_fds(3)``: the descriptors are only adopted when
+    ``LISTEN_PID`` names this process, and the ``LISTEN_*`` variables are
+    removed either way so neither server lifespans nor Granian children try to
+    adopt them again.
+
+    Returns:
+        The activated listeners in descriptor order, or an empty list.
+
+    Raises:
+        ValueError: If ``LISTEN_FDS`` is malformed or a descriptor is not a
+            listening stream socket.
+    """
+    pid, count, names = (os.environ.pop(name, None) for name in _LISTEN_ENVIRONMENT)
+    if pid is None or count is None or pid.strip() != str(os.getpid()):
+        return []
+    try:
+        total = int(count)
+    except ValueError:
+        message = f"LISTEN_FDS must be an integer, got {count!r}"
+        raise ValueError(message) from None
+    labels = names.split(":") if names else []
+    listeners: list[_ActivatedListener] = []
+    for index in range(total):
+        fd = _LISTEN_FDS_START + index
+        name = labels[index] if index < len(labels) else f"fd{fd}"
+        try:
+            listener = socket.socket(fileno=fd)
+        except OSError as exc:
+            message = f"activated descriptor {fd} ({name}) is not a socket: {exc.strerror or exc}"
+            raise ValueError(message) from exc
+        if listener.type != socket.SOCK_STREAM or not _is_listening(listener):
+            listener.detach()
+            message = f"activated descriptor {fd} ({name}) is not a listening stream socket"
+            raise ValueError(message)
+        listener.set_inheritable(False)
+        listeners.append(_ActivatedListener(name=name, socket=listener))
+    return listeners
+
+
+@contextmanager
+def _parent_listener(
+    *,
+    host: str,
+    port: int,
+    uds: str | None,
+    uds_permissions: int | None,
+    backlog: int,
+    tuning: _SocketTuning | None = None,
+) -> Generator[socket.socket, None, None]:
+    """Own one listening socket for the lifetime of the supervised run.
+
+    The socket is handed to each Granian child as an inherited descriptor, so
+    its accept queue keeps absorbing connections while children crash, restart,
+    or overlap during a rolling restart.
+
+    Yields:
+        The bound, listening socket.
+    """
+    if uds is None:
+        listener = _bind_tcp_listener(host, port, backlog=backlog, tuning=tuning)
+        try:
+            yield listener
+        finally:
+            listener.close()
+        return
+
+    path = Path(uds).resolve()
+    listener = _bind_unix_listener(path, permissions=uds_permissions, backlog=backlog, tuning=tuning)
+    bound_inode = path.stat().st_ino
+    try:
+        yield listener
+    finally:
+        listener.close()
+        with suppress(OSError):
+            if path.stat().st_ino == bound_inode:
+                path.unlink()
+
+
+def _tune_inherited_listener(fd: int, tuning: _SocketTuning) -> None:
+    """Apply ``tuning`` to an already-listening descriptor owned by someone else."""
+    listener = socket.socket(fileno=fd)
+    try:
+        tuning.apply(listener)
+    finally:
+        listener.detach()
+
+
+def _is_listening(candidate: socket.socket) -> bool:
+    accept_connections = getattr(socket, "SO_ACCEPTCONN", None)
+    if accept_connections is None:
+        return True
+    return bool(candidate.getsockopt(socket.SOL_SOCKET, accept_connections))
+
+
+def _unix_address(bound: "str | bytes") -> str:
+    if isinstance(bound, bytes):
+        bound = bound.decode(errors="replace")
+    return f"@{bound[1:]}" if bound.startswith("\0") else bound
+
+
+def _set_option(listener: socket.socket, flag: str, level: int, name: str, value: int) -> None:
+    option = getattr(socket, name, None)
+    if option is None:
+        logger.warning("%s is not supported on this platform; ignoring it", flag)
+        return
+    try:
+        listener.setsockopt(level, option, value)
+    except OSError as exc:
+        logger.warning("%s was rejected by the kernel (%s); ignoring it", flag, exc.strerror or exc)
+
+
+def _bind_tcp_listener(
+    host: str,
+    port: int,
+    *,
+    backlog: int,
+    tuning: _SocketTuning | None = None,
+) -> socket.socket:
+    family, kind, protocol, _, address = socket.getaddrinfo(
+        host or None,
+        port,
+        type=socket.SOCK_STREAM,
+        flags=socket.AI_PASSIVE,
+    )[0]
+    listener = socket.socket(family, kind, protocol)
+    # Receive buffers must be sized before listen() for the window scale to account for them.
+    if tuning is not None:
+        tuning.apply(listener)
+    try:
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind(address)
+        listener.listen(backlog)
+    except OSError:
+        listener.close()
+        raise
+    return listener
+
+
+def _bind_unix_listener(
+    path: Path,
+    *,
+    permissions: int | None,
+    backlog: int,
+    tuning: _SocketTuning | None = None,
+) -> socket.socket:
+    if path.is_socket() and not _accepts_connections(path):
+        path.unlink()
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)  # type: ignore[attr-defined,unused-ignore]
+    if tuning is not None:
+        tuning.apply(listener)
+    try:
+        listener.bind(str(path))
+        if permissions is not None:
+            path.chmod(permissions)
+        listener.listen(backlog)
+    except OSError:
+        listener.close()
+        raise
+    return listener
+
+
+def _accepts_connections(path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:  # type: ignore[attr-defined,unused-ignore]
+        try:
+            probe.connect(str(path))
+        except OSError:
+            return False
+    return True
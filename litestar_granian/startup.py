@@ -0,0 +1,178 @@
+"""Time the phases of a supervised startup and report where the time went."""
+
+import json
+import operator
+import os
+import sys
+import time
+from collections.abc import Generator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+_RUNNER_STARTED_ENV = "LITESTAR_GRANIAN_RUNNER_STARTED"
+_PROC_STAT = Path("/proc/self/stat")
+# /proc/<pid>/stat field 22, counted from the first field after the parenthesized command name.
+_STARTTIME_FIELD = 19
+_SPAWN_PHASE = "Granian child spawn"
+_PARENT = "Litestar parent"
+_CHILD = "Granian child"
+
+
+@dataclass(frozen=True)
+class _Phase:
+    """One timed startup phase, in :func:`time.monotonic` seconds."""
+
+    name: str
+    process: str
+    started: float
+    finished: float
+
+    @property
+    def duration(self) -> float:
+        return max(self.finished - self.started, 0.0)
+
+
+class _StartupTimeline:
+    """Collect the startup phases of the Litestar parent, the Granian child, and its workers.
+
+    Every mark is a :func:`time.monotonic` reading. That clock is system-wide
+    on Linux, macOS, and Windows, so marks the workers send back with their
+    readiness reports line up with the parent's.
+    """
+
+    def __init__(self) -> None:
+        self.phases: list[_Phase] = []
+        self.cli_initialized: float | None = None
+
+    def mark_cli_initialized(self) -> None:
+        """Record that Litestar has imported the application and is loading CLI plugins."""
+        self.cli_initialized = time.monotonic()
+
+    def begin(self) -> None:
+        """Start a new timeline when ``litestar run`` is invoked.
+
+        The interpreter start time is read from ``/proc`` on Linux; elsewhere
+        the timeline starts once Litestar has imported the application.
+        """
+        now = time.monotonic()
+        self.phases.clear()
+        process_started = _process_started()
+        imported = self.cli_initialized if self.cli_initialized is not None else now
+        if process_started is not None:
+            self.add("interpreter start, Litestar CLI, and application import", process_started, imported)
+        if self.cli_initialized is not None:
+            self.add("run command import and option parsing", self.cli_initialized, now)
+
+    def add(self, name: str, started: float, finished: float, *, process: str = _PARENT) -> None:
+        self.phases.append(_Phase(name, process, started, finished))
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        """Time the body of the ``with`` block as one parent phase.
+
+        Yields:
+            Nothing; the phase is recorded when the block exits.
+        """
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add(name, started, time.monotonic())
+
+    def add_worker_reports(self, reports: Sequence[Mapping[str, str]]) -> None:
+        """Add the Granian child and worker phases carried by readiness reports."""
+        # Server lifespans may still be starting after the spawn, so the child's marks start from the spawn itself.
+        spawned = next((phase.finished for phase in self.phases if phase.name == _SPAWN_PHASE), None)
+        workers = sorted(
+            (marks for report in reports if (marks := _worker_marks(report)) is not None),
+            key=operator.itemgetter(1),
+        )
+        runner_started = next(
+            (mark for report in reports if (mark := _mark(report, "RUNNER_STARTED")) is not None), None
+        )
+        if spawned is not None and runner_started is not None:
+            self.add("interpreter start and runner import", spawned, runner_started, process=_CHILD)
+        child_started = runner_started if runner_started is not None else spawned
+        if workers and child_started is not None:
+            self.add("Granian startup and worker spawn", child_started, workers[0][1], process=_CHILD)
+        for index, (pid, load_started, load_finished, ready) in enumerate(workers, start=1):
+            process = f"worker {index} (pid {pid})"
+            self.add("application import", load_started, load_finished, process=process)
+            self.add("startup hooks until accepting", load_finished, ready, process=process)
+
+    def render(self, ready: float) -> list[str]:
+        """Format the timeline for the console, slowest phase flagged.
+
+        Returns:
+            One heading line and one line per phase in start order.
+        """
+        if not self.phases:
+            return []
+        origin = min(phase.started for phase in self.phases)
+        slowest = max(self.phases, key=lambda phase: phase.duration)
+        lines = [f"Startup report: ready {ready - origin:.3f}s after start"]
+        for phase in sorted(self.phases, key=lambda phase: phase.started):
+            flag = "  <- slowest" if phase is slowest else ""
+            lines.append(
+                f"  +{phase.started - origin:7.3f}s {phase.duration:7.3f}s  {phase.process:<22} {phase.name}{flag}"
+            )
+        return lines
+
+    def as_json(self, ready: float) -> str:
+        """Serialize the timeline with offsets relative to the first mark.
+
+        Returns:
+            A JSON document with the total time to ready and every phase.
+        """
+        origin = min((phase.started for phase in self.phases), default=ready)
+        document = {
+            "ready_seconds": round(ready - origin, 6),
+            "phases": [
+                {
+                    "process": phase.process,
+                    "name": phase.name,
+                    "offset_seconds": round(phase.started - origin, 6),
+                    "duration_seconds": round(phase.duration, 6),
+                }
+                for phase in sorted(self.phases, key=lambda phase: phase.started)
+            ],
+        }
+        return json.dumps(document, indent=2)
+
+
+_timeline = _StartupTimeline()
+
+
+def _worker_marks(report: Mapping[str, str]) -> tuple[str, float, float, float] | None:
+    load_started = _mark(report, "LOAD_STARTED")
+    load_finished = _mark(report, "LOAD_FINISHED")
+    ready = _mark(report, "READY_AT")
+    if load_started is None or load_finished is None or ready is None:
+        return None
+    return report.get("PID", "?"), load_started, load_finished, ready
+
+
+def _mark(report: Mapping[str, str], name: str) -> float | None:
+    try:
+        return float(report[name])
+    except (KeyError, ValueError):
+        return None
+
+
+def _process_started() -> float | None:
+    """Estimate when this process started, on the :func:`time.monotonic` clock.
+
+    Returns:
+        The start time to the kernel's clock tick, or ``None`` where
+        ``/proc/self/stat`` is unavailable.
+    """
+    if sys.platform != "linux":
+        return None
+    try:
+        fields = _PROC_STAT.read_text(encoding="ascii").rpartition(")")[2].split()
+        ticks = int(fields[_STARTTIME_FIELD])
+    except (OSError, IndexError, ValueError):
+        return None
+    age = time.clock_gettime(time.CLOCK_BOOTTIME) - ticks / os.sysconf("SC_CLK_TCK")
+    return time.monotonic() - age
@@ -1,20 +1,52 @@
 """Supervise one fresh Granian child process group and forward signals."""
 
+import logging
 import os
+import random
+import select
 import shutil
 import signal
 import subprocess  # ruff: ignore[suspicious-subprocess-import]
 import sys
 import time
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from contextlib import suppress
+from dataclasses import dataclass
 from pathlib import Path
 from types import FrameType
-from typing import Any
+from typing import TYPE_CHECKING, Any, Protocol
+
+from litestar_granian.embedded import _EmbeddedChild
+from litestar_granian.memory import _MIB
+from litestar_granian.notify import _NOTIFY_SOCKET_ENV
+from litestar_granian.resources import _process_group_memory
+from litestar_granian.startup import _SPAWN_PHASE, _timeline
+
+if TYPE_CHECKING:
+    from litestar_granian.notify import _ReadinessAnnouncer
+    from litestar_granian.readiness import _ReadinessChannel
 
 _CREATE_NEW_PROCESS_GROUP = getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0x00000200)
 _POLL_INTERVAL = 0.1
 _KILL_GRACE_PERIOD = 5.0
+_RESPAWN_STREAK_RESET = 60.0
+_HAS_PIDFD = hasattr(os, "pidfd_open")
+_ROLLING_RESTART_SIGNALS = frozenset(getattr(signal, name) for name in ("SIGHUP", "SIGUSR2") if hasattr(signal, name))
+
+logger = logging.getLogger("litestar_granian.supervisor")
+
+
+class _Child(Protocol):
+    """The part of :class:`subprocess.Popen` the supervisor uses for a Granian child."""
+
+    pid: int
+    returncode: Any
+
+    def poll(self) -> int | None: ...
+
+    def wait(self, timeout: float | None = None) -> int: ...
+
+    def send_signal(self, sig: int) -> None: ...
 
 
 def _map_exit_code(returncode: int) -> int:
@@ -26,12 +58,81 @@ def _map_exit_code(returncode: int) -> int:
     return 128 + abs(returncode) if returncode < 0 else returncode
 
 
+@dataclass(frozen=True)
+class _RespawnPolicy:
+    """Exponential backoff with jitter for respawning a failed Granian child.
+
+    ``limit`` caps consecutive respawns. A child that stays up for
+    ``_RESPAWN_STREAK_RESET`` seconds clears the failure streak.
+    """
+
+    backoff: float
+    max_backoff: float
+    limit: int
+
+    def delay(self, attempt: int) -> float:
+        """Pick the pause before respawn ``attempt``.
+
+        Returns:
+            A delay between half and all of the capped exponential backoff.
+        """
+        ceiling = min(self.max_backoff, self.backoff * 2 ** min(attempt - 1, 32))
+        return random.uniform(ceiling / 2, ceiling)  # ruff: ignore[suspicious-non-cryptographic-random-usage]
+
+
+@dataclass(frozen=True)
+class _MemoryLimit:
+    """A memory budget for the whole Granian process group.
+
+    The group is sampled every ``interval`` seconds and recycled once
+    ``samples`` consecutive samples exceed ``limit`` bytes.
+    """
+
+    limit: int
+    interval: float
+    samples: int
+
+
 class _GranianSupervisor:
     """Supervise a fresh Granian process group from the Litestar CLI parent.
 
-    POSIX blocks in :meth:`subprocess.Popen.wait` and enforces the forced-kill
-    deadline with an ``ITIMER_REAL`` alarm. Windows has no interval timer, so it
-    polls the child and compares :attr:`deadline` instead.
+    On Linux the supervisor waits on a pidfd for the child and on a private
+    wakeup pipe for forwarded signals in one ``select`` loop, and enforces the
+    forced-kill deadline from that loop without touching ``SIGALRM``. Other
+    POSIX platforms, and kernels without ``pidfd_open``, block in
+    :meth:`subprocess.Popen.wait` and enforce the deadline with an
+    ``ITIMER_REAL`` alarm. Windows has no interval timer, so it polls the child
+    and compares :attr:`deadline` instead.
+
+    With ``rolling_restart`` enabled, ``SIGHUP`` and ``SIGUSR2`` start a
+    replacement child on the same inherited listener. The previous child is
+    drained only after every replacement worker reports readiness, so the
+    shared accept queue is never left without a serving worker pool.
+
+    With a ``respawn`` policy, a child that exits abnormally without a
+    requested shutdown is started again after a jittered backoff. Parent
+    server lifespans stay up across respawns until the policy gives up.
+
+    With an ``announcer``, the supervisor watches the readiness channel for
+    the serving generation and announces ``READY`` once every worker has
+    reported, and ``STOPPING`` when the first termination signal arrives.
+
+    ``on_started`` runs once in the parent after the first child is spawned.
+    ``on_ready`` runs once with the worker readiness reports when the first
+    child generation is ready.
+
+    With ``embedded`` on POSIX, each child is forked from the parent and runs
+    the command in-process instead of starting a new interpreter.
+
+    With a ``memory_limit`` on Linux, the supervisor samples the memory of the
+    child's process group and replaces an over-budget child through the
+    rolling restart path. This works whether workers are processes or
+    free-threaded threads.
+
+    With ``reload_on_change``, :meth:`reload` stops the serving child and
+    starts a fresh one that imports the changed code, while parent server
+    lifespans stay up. A child that fails is started again on the next
+    reload instead of stopping the supervisor.
     """
 
     def __init__(
@@ -42,19 +143,51 @@ class _GranianSupervisor:
         environment: dict[str, str] | None = None,
         pass_fds: tuple[int, ...] = (),
         platform: str = sys.platform,
+        rolling_restart: bool = False,
+        restart_timeout: float = 60.0,
+        readiness: "_ReadinessChannel | None" = None,
+        respawn: _RespawnPolicy | None = None,
+        announcer: "_ReadinessAnnouncer | None" = None,
+        on_started: Callable[[], object] | None = None,
+        on_ready: Callable[[list[dict[str, str]]], object] | None = None,
+        embedded: bool = False,
+        memory_limit: _MemoryLimit | None = None,
+        reload_on_change: bool = False,
     ) -> None:
         self.command = list(command)
         self.kill_timeout = kill_timeout
         self.environment = environment or {}
         self.pass_fds = pass_fds
         self.platform = platform
+        self.rolling_restart = rolling_restart
+        self.restart_timeout = restart_timeout
+        self.readiness = readiness
+        self.respawn = respawn
+        self.announcer = announcer if readiness is not None else None
+        self.on_started = on_started
+        self.on_ready = on_ready if readiness is not None else None
+        self.embedded = embedded and platform != "win32"
+        # Recycling goes through the rolling restart path, which waits on worker readiness.
+        self.memory_limit = memory_limit if readiness is not None and platform == "linux" else None
+        self.reload_on_change = reload_on_change
         self.deadline: float | None = None
-        self._process: subprocess.Popen[Any] | None = None
+        self._process: _Child | None = None
+        self._replacement: _Child | None = None
+        self._retiring: list[_Child] = []
+        self._generation = 1
+        self._started_at = 0.0
+        self._failures = 0
+        self._announce_pending: int | None = None
         self._pending_signals: list[int] = []
+        self._restart_requested = False
+        self._reload_requested = False
         self._termination_forwarded = False
         self._killed = False
         self._alarm_installed = False
         self._previous_alarm_handler: Any = None
+        self._wakeup: tuple[int, int] | None = None
+        self._next_memory_sample = 0.0
+        self._over_memory_limit = 0
 
     def run(self) -> int:
         """Start Granian and wait for it.
@@ -62,47 +195,378 @@ class _GranianSupervisor:
         Returns:
             The normalized Granian exit status.
         """
-        popen_kwargs: dict[str, Any] = {}
-        if self.environment:
-            popen_kwargs["env"] = {**os.environ, **self.environment}
-        if self.platform == "win32":
-            popen_kwargs["creationflags"] = _CREATE_NEW_PROCESS_GROUP
+        if self.on_ready is None:
+            self._process = self._spawn()
         else:
-            popen_kwargs["start_new_session"] = True
-            if self.pass_fds:
-                popen_kwargs["pass_fds"] = self.pass_fds
-        process = subprocess.Popen(self.command, **popen_kwargs)
-        self._process = process
+            # Only the startup report reads the spawn time, so plain runs skip the clock reads.
+            with _timeline.phase(_SPAWN_PHASE):
+                self._process = self._spawn()
+        self._mark_started()
+        self._expect_ready()
+        self._open_wakeup(self._process)
         self._install_deadline_handler()
         pending_signals, self._pending_signals = self._pending_signals, []
         for signum in pending_signals:
             self.forward(signum)
 
-        try:
-            return _map_exit_code(self._wait(process))
+        try:  # ruff: ignore[too-many-statements-in-try-clause]
+            if self.on_started is not None:
+                self.on_started()
+            while True:
+                returncode = self._wait(self._process)
+                if returncode is None and self._reload_requested:
+                    self._reload()
+                elif returncode is None:
+                    self._rolling_restart()
+                elif not (self._respawn_after(returncode) or self._reload_after(returncode)):
+                    return _map_exit_code(returncode)
         except BaseException:
-            if process.poll() is None:
+            if any(child.poll() is None for child in self._children()):
                 self._kill_group()
             raise
         finally:
             self._cancel_deadline()
+            self._close_wakeup()
+
+    def _spawn(self) -> _Child:
+        environment = dict(self.environment)
+        if self.readiness is not None:
+            environment.update(self.readiness.environment(self._generation))
+        popen_kwargs: dict[str, Any] = {}
+        if self.announcer is not None and self.announcer.notifies:
+            # The parent is the service's main process; a child must not answer the manager itself.
+            inherited = {name: value for name, value in os.environ.items() if name != _NOTIFY_SOCKET_ENV}
+            popen_kwargs["env"] = {**inherited, **environment}
+        elif environment:
+            popen_kwargs["env"] = {**os.environ, **environment}
+        if self.embedded:
+            return _EmbeddedChild(self.command, popen_kwargs.get("env", dict(os.environ)))
+        if self.platform == "win32":
+            popen_kwargs["creationflags"] = _CREATE_NEW_PROCESS_GROUP
+        else:
+            popen_kwargs["start_new_session"] = True
+            if self.pass_fds:
+                popen_kwargs["pass_fds"] = self.pass_fds
+        return subprocess.Popen(self.command, **popen_kwargs)
+
+    def _mark_started(self) -> None:
+        # Only the respawn policy and the memory limit read the clock, so plain runs skip it.
+        if self.respawn is not None:
+            self._started_at = time.monotonic()
+        if self.memory_limit is not None:
+            self._next_memory_sample = time.monotonic() + self.memory_limit.interval
+            self._over_memory_limit = 0
 
-    def _wait(self, process: subprocess.Popen[Any]) -> int:
-        if self.platform != "win32":
+    def _expect_ready(self) -> None:
+        if self.announcer is not None or self.on_ready is not None:
+            self._announce_pending = self._generation
+
+    def _check_ready(self) -> None:
+        generation = self._announce_pending
+        if generation is None or self.readiness is None:
+            return
+        self.readiness.drain()
+        if self.readiness.is_ready(generation):
+            self._announce_pending = None
+            reports = self.readiness.reports(generation)
+            self.readiness.forget(generation)
+            if self.announcer is not None:
+                self.announcer.ready(generation=generation, workers=self.readiness.workers)
+            on_ready, self.on_ready = self.on_ready, None
+            if on_ready is not None:
+                on_ready(reports)
+
+    def _children(self) -> list[_Child]:
+        return [child for child in (self._process, self._replacement, *self._retiring) if child is not None]
+
+    def _wait(self, process: _Child) -> int | None:
+        """Wait for ``process`` to exit or for a requested rolling restart.
+
+        Returns:
+            The raw child return code, or ``None`` when a rolling restart is due.
+        """
+        if self._wakeup is not None:
+            return self._wait_pidfd(process, self._wakeup[0])
+        if (
+            self.platform != "win32"
+            and not self.rolling_restart
+            and self._announce_pending is None
+            and self.memory_limit is None
+            and not self.reload_on_change
+        ):
             return process.wait()
         while True:
+            self._check_ready()
+            self._sample_memory()
+            if self._restart_requested or self._reload_requested:
+                self._restart_requested = False
+                return None
             try:
                 return process.wait(timeout=_POLL_INTERVAL)
             except subprocess.TimeoutExpired:
                 if self.deadline is not None and time.monotonic() >= self.deadline:
                     self._kill_group()
 
+    def _wait_pidfd(self, process: _Child, wakeup: int) -> int | None:
+        """Multiplex child exit, forwarded signals, and the kill deadline.
+
+        Returns:
+            The raw child return code, or ``None`` when a rolling restart is due.
+        """
+        try:
+            pidfd = os.pidfd_open(process.pid)  # type: ignore[attr-defined,unused-ignore]
+        except ProcessLookupError:
+            return process.wait()
+        try:
+            while True:
+                if self._restart_requested or self._reload_requested:
+                    self._restart_requested = False
+                    return None
+                returncode = process.poll()
+                if returncode is not None:
+                    return returncode
+                timeout = None
+                if self.deadline is not None:
+                    timeout = self.deadline - time.monotonic()
+                    if timeout <= 0:
+                        self._kill_group()
+                        timeout = None
+                if self.memory_limit is not None and self.deadline is None:
+                    timeout = max(self._next_memory_sample - time.monotonic(), 0.0)
+                watched = [pidfd, wakeup]
+                if self._announce_pending is not None and self.readiness is not None:
+                    watched.append(self.readiness.fileno())
+                readable, _, _ = select.select(watched, [], [], timeout)
+                if wakeup in readable:
+                    with suppress(BlockingIOError):
+                        os.read(wakeup, 512)
+                self._check_ready()
+                self._sample_memory()
+        finally:
+            os.close(pidfd)
+
+    def _sample_memory(self) -> None:
+        """Request a recycle once the child group stays over its memory limit for enough samples."""
+        limit = self.memory_limit
+        process = self._process
+        if limit is None or process is None or self._termination_forwarded:
+            return
+        now = time.monotonic()
+        if now < self._next_memory_sample:
+            return
+        self._next_memory_sample = now + limit.interval
+        used = _process_group_memory(process.pid)
+        if used is None or used <= limit.limit:
+            self._over_memory_limit = 0
+            return
+        self._over_memory_limit += 1
+        logger.warning(
+            "Granian child group uses %.1f MiB, over its %.1f MiB budget (sample %d of %d)",
+            used / _MIB,
+            limit.limit / _MIB,
+            self._over_memory_limit,
+            limit.samples,
+        )
+        if self._over_memory_limit >= limit.samples:
+            logger.warning("Recycling the Granian child group through a rolling restart to release memory")
+            self._over_memory_limit = 0
+            self._restart_requested = True
+
+    def _open_wakeup(self, process: _Child) -> None:
+        if self.platform != "linux" or not _HAS_PIDFD:
+            return
+        try:
+            os.close(os.pidfd_open(process.pid))  # type: ignore[attr-defined,unused-ignore]
+        except OSError:
+            # Kernels before 5.3 or seccomp sandboxes refuse pidfds; keep the SIGALRM deadline.
+            return
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        self._wakeup = (read_fd, write_fd)
+
+    def _close_wakeup(self) -> None:
+        wakeup, self._wakeup = self._wakeup, None
+        if wakeup is not None:
+            for fd in wakeup:
+                os.close(fd)
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            with suppress(OSError):
+                os.write(self._wakeup[1], b"\0")
+
+    def _rolling_restart(self) -> None:
+        """Replace the serving child once its successor reports readiness."""
+        previous = self._process
+        if previous is None or self._termination_forwarded or self.readiness is None:
+            return
+        self._generation += 1
+        generation = self._generation
+        logger.info("Starting replacement Granian child (generation %d)", generation)
+        if self.announcer is not None:
+            self.announcer.status(f"Rolling restart to generation {generation}")
+        replacement = self._spawn()
+        self._replacement = replacement
+        try:
+            ready = self.readiness.wait(
+                generation,
+                timeout=self.restart_timeout,
+                alive=lambda: replacement.poll() is None and not self._termination_forwarded,
+            )
+        finally:
+            self._replacement = None
+            self.readiness.forget(generation)
+        if not ready:
+            logger.warning(
+                "Replacement Granian child (generation %d) did not become ready; keeping the current child",
+                generation,
+            )
+            self._drain(replacement)
+            if self.announcer is not None:
+                self.announcer.status(f"Rolling restart to generation {generation} failed")
+            return
+        self._process = replacement
+        self._mark_started()
+        if self.announcer is not None:
+            self._announce_pending = None
+            self.announcer.ready(generation=generation, workers=self.readiness.workers)
+        logger.info("Replacement Granian child is ready; draining generation %d", generation - 1)
+        self._drain(previous)
+
+    def _respawn_after(self, returncode: int) -> bool:
+        """Start a new child after an abnormal exit when the policy allows it.
+
+        Returns:
+            ``True`` if a new child is now serving, ``False`` if the supervisor
+            should stop with ``returncode``.
+        """
+        policy = self.respawn
+        if policy is None or returncode == 0 or self._termination_forwarded:
+            return False
+        if time.monotonic() - self._started_at >= _RESPAWN_STREAK_RESET:
+            self._failures = 0
+        self._failures += 1
+        status = _map_exit_code(returncode)
+        if self.announcer is not None:
+            self.announcer.withdraw(f"Granian child exited with status {status}")
+        if self._failures > policy.limit:
+            logger.error("Granian child exited with status %d after %d respawns; giving up", status, policy.limit)
+            return False
+        delay = policy.delay(self._failures)
+        logger.warning(
+            "Granian child exited with status %d; respawning in %.1fs (attempt %d of %d)",
+            status,
+            delay,
+            self._failures,
+            policy.limit,
+        )
+        if not self._pause(delay):
+            return False
+        self._start_generation()
+        return True
+
+    def _reload(self) -> None:
+        """Stop the serving child and start a fresh one that imports the changed code."""
+        self._reload_requested = False
+        previous = self._process
+        if previous is None or self._termination_forwarded:
+            return
+        if self.announcer is not None:
+            self.announcer.withdraw("Reloading after file changes")
+        logger.info("Stopping Granian child (generation %d) to reload it", self._generation)
+        self._drain(previous)
+        if not self._termination_forwarded:
+            self._start_generation()
+
+    def _reload_after(self, returncode: int) -> bool:
+        """Keep a failed child down until file changes ask for a reload.
+
+        Returns:
+            ``True`` if a reloaded child is now serving, ``False`` if the
+            supervisor should stop with ``returncode``.
+        """
+        if not self.reload_on_change or returncode == 0 or self._termination_forwarded:
+            return False
+        if self.announcer is not None:
+            self.announcer.withdraw(f"Granian child exited with status {_map_exit_code(returncode)}")
+        logger.warning(
+            "Granian child exited with status %d; waiting for file changes to reload it",
+            _map_exit_code(returncode),
+        )
+        if not self._await_reload():
+            return False
+        self._start_generation()
+        return True
+
+    def _await_reload(self) -> bool:
+        """Sleep until a reload is requested unless shutdown is requested first.
+
+        Returns:
+            ``False`` if a termination signal arrived before any reload request.
+        """
+        while not self._termination_forwarded:
+            if self._reload_requested:
+                self._reload_requested = False
+                return True
+            time.sleep(_POLL_INTERVAL)
+        return False
+
+    def _start_generation(self) -> None:
+        self._generation += 1
+        self._process = self._spawn()
+        self._mark_started()
+        self._expect_ready()
+
+    def _pause(self, delay: float) -> bool:
+        """Sleep through a respawn backoff unless shutdown is requested.
+
+        Returns:
+            ``False`` if a termination signal arrived during the pause.
+        """
+        deadline = time.monotonic() + delay
+        while not self._termination_forwarded:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # A rolling restart requested while no child was serving is satisfied by the respawn.
+                self._restart_requested = False
+                return True
+            time.sleep(min(remaining, _POLL_INTERVAL))
+        return False
+
+    def _drain(self, process: _Child) -> None:
+        """Gracefully stop a child that no longer owns the serving role."""
+        if process.poll() is not None:
+            return
+        self._retiring.append(process)
+        try:
+            with suppress(ProcessLookupError):
+                os.killpg(process.pid, signal.SIGTERM)
+            try:
+                process.wait(timeout=self.kill_timeout + _KILL_GRACE_PERIOD)
+            except subprocess.TimeoutExpired:
+                with suppress(ProcessLookupError):
+                    os.killpg(process.pid, signal.SIGKILL)
+                process.wait()
+        finally:
+            self._retiring.remove(process)
+
+    def reload(self) -> None:
+        """Ask for a fresh child; safe to call from the file watcher thread."""
+        self._reload_requested = True
+        self._wake()
+
     def forward(self, signum: int) -> None:
         """Forward a signal or queue it until the child process is attached."""
         if self._process is None:
             self._pending_signals.append(signum)
             return
 
+        if self.rolling_restart and signum in _ROLLING_RESTART_SIGNALS:
+            self._restart_requested = True
+            self._wake()
+            return
+
         if hasattr(signal, "SIGHUP") and signum == signal.SIGHUP:
             self._send_group_signal(signum)
             return
@@ -117,18 +581,21 @@ class _GranianSupervisor:
             return
 
         self._termination_forwarded = True
+        if self.announcer is not None:
+            self.announcer.stopping()
         self._send_group_signal(signum)
         self._arm_deadline()
 
     def _install_deadline_handler(self) -> None:
-        if self.platform == "win32":
+        if self.platform == "win32" or self._wakeup is not None:
             return
         self._previous_alarm_handler = signal.signal(signal.SIGALRM, self._handle_deadline)
         self._alarm_installed = True
 
     def _arm_deadline(self) -> None:
-        if self.platform == "win32":
+        if self.platform == "win32" or self._wakeup is not None:
             self.deadline = time.monotonic() + self.kill_timeout + _KILL_GRACE_PERIOD
+            self._wake()
             return
         if self._alarm_installed:
             signal.setitimer(signal.ITIMER_REAL, self.kill_timeout + _KILL_GRACE_PERIOD)
@@ -145,31 +612,34 @@ class _GranianSupervisor:
         self._kill_group()
 
     def _send_group_signal(self, signum: int) -> None:
-        process = self._process
-        if process is None or process.poll() is not None:
-            return
-        if self.platform == "win32":
-            process.send_signal(getattr(signal, "CTRL_BREAK_EVENT", signal.SIGTERM))
-        else:
-            with suppress(ProcessLookupError):
-                os.killpg(process.pid, signum)
+        for process in self._children():
+            if process.poll() is not None:
+                continue
+            if self.platform == "win32":
+                process.send_signal(getattr(signal, "CTRL_BREAK_EVENT", signal.SIGTERM))
+            else:
+                with suppress(ProcessLookupError):
+                    os.killpg(process.pid, signum)
 
     def _kill_group(self) -> None:
-        process = self._process
-        if process is None or self._killed or process.poll() is not None:
+        if self._killed:
+            return
+        processes = [process for process in self._children() if process.poll() is None]
+        if not processes:
             return
         self._killed = True
-        if self.platform == "win32":
-            taskkill = shutil.which("taskkill") or str(
-                Path(os.environ.get("SYSTEMROOT", "C:\\Windows")) / "System32" / "taskkill.exe"
-            )
-            subprocess.run(
-                [taskkill, "/PID", str(process.pid), "/T", "/F"],
-                check=False,
-            )
-        else:
-            with suppress(ProcessLookupError):
-                os.killpg(process.pid, signal.SIGKILL)
+        for process in processes:
+            if self.platform == "win32":
+                taskkill = shutil.which("taskkill") or str(
+                    Path(os.environ.get("SYSTEMROOT", "C:\\Windows")) / "System32" / "taskkill.exe"
+                )
+                subprocess.run(
+                    [taskkill, "/PID", str(process.pid), "/T", "/F"],
+                    check=False,
+                )
+            else:
+                with suppress(ProcessLookupError):
+                    os.killpg(process.pid, signal.SIGKILL)
 
 
 class _SignalForwarder:
@@ -177,11 +647,13 @@ class _SignalForwarder:
 
     def __init__(self, supervisor: _GranianSupervisor) -> None:
         self.supervisor = supervisor
-        self.signals = (
+        self.signals: tuple[int, ...] = (
             (signal.SIGINT, signal.SIGTERM, signal.SIGHUP)
             if hasattr(signal, "SIGHUP")
             else (signal.SIGINT, signal.SIGTERM, signal.SIGBREAK)  # type: ignore[attr-defined]
         )
+        if supervisor.rolling_restart and hasattr(signal, "SIGUSR2"):
+            self.signals = (*self.signals, signal.SIGUSR2)
         self._original_handlers: dict[int, Any] = {}
 
     def install(self) -> None:
@@ -19,12 +19,27 @@ def free_port() -> int:
         return int(sock.getsockname()[1])
 
 
+def _answers_http(port: int) -> bool:
+    # The parent-owned listener accepts connections before Granian serves them, so readiness needs a response.
+    with socket.socket() as sock:
+        sock.settimeout(0.5)
+        try:
+            sock.connect(("127.0.0.1", port))
+            sock.sendall(b"GET / HTTP/1.1\r\nHost: 127.0.0.1\r\nConnection: close\r\n\r\n")
+            return bool(sock.recv(1))
+        except OSError:
+            return False
+
+
 def wait_for_port(port: int, process: subprocess.Popen[str] | None = None, *, open_: bool) -> None:
     deadline = time.monotonic() + 15
     while time.monotonic() < deadline:
-        with socket.socket() as sock:
-            sock.settimeout(0.1)
-            is_open = sock.connect_ex(("127.0.0.1", port)) == 0
+        if open_:
+            is_open = _answers_http(port)
+        else:
+            with socket.socket() as sock:
+                sock.settimeout(0.1)
+                is_open = sock.connect_ex(("127.0.0.1", port)) == 0
         if is_open is open_:
             return
         if open_ and process is not None and process.poll() is not None:
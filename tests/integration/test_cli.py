@@ -3,6 +3,9 @@ from __future__ import annotations
 import json
 import os
 import re
+import socket
+import sys
+import tempfile
 from pathlib import Path
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any
@@ -11,6 +14,10 @@ from unittest.mock import MagicMock
 import pytest
 
 from litestar_granian import cli
+from litestar_granian.reloader import _ParentReloader
+from litestar_granian.sockets import _ActivatedListener
+from litestar_granian.supervisor import _RespawnPolicy
+from tests.integration._runtime import free_port
 
 if TYPE_CHECKING:
     from click.testing import CliRunner
@@ -164,10 +171,10 @@ def test_ssl_client_verification_requires_ca(
 @pytest.mark.parametrize(
     ("args", "option_name"),
     [
-        (["--reload"], "--reload"),
-        (["--reload-paths", "."], "--reload"),
-        (["--reload-include", "*.html"], "--reload"),
-        (["--reload-exclude", "*.tmp"], "--reload"),
+        (["--reload", "--reloader", "granian"], "--reloader granian"),
+        (["--reload-paths", ".", "--reloader", "granian"], "--reloader granian"),
+        (["--reload-include", "*.html", "--reloader", "granian"], "--reloader granian"),
+        (["--reload-exclude", "*.tmp", "--reloader", "granian"], "--reloader granian"),
         (["--workers-max-rss", "256"], "--workers-max-rss"),
     ],
 )
@@ -199,6 +206,28 @@ def test_free_threaded_usage_errors_precede_app_and_supervisor_startup(
     server_lifespan.assert_not_called()
 
 
+def test_free_threaded_reload_watches_from_the_parent(
+    runner: CliRunner,
+    root_command: LitestarGroup,
+    app_file: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    run_supervised = MagicMock(return_value=0)
+    monkeypatch.setattr(cli, "_is_free_threaded_build", lambda: True, raising=False)
+    monkeypatch.setattr(cli, "_run_supervised", run_supervised)
+
+    result = runner.invoke(
+        root_command,
+        ["--app", f"{app_file.stem}:app", "run", "--reload-include", "*.html"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "--reload" not in run_supervised.call_args.args[1].argv
+    reloader = run_supervised.call_args.kwargs["reloader"]
+    assert isinstance(reloader, _ParentReloader)
+    assert reloader.paths == (Path.cwd(),)
+
+
 def test_ordinary_build_forwards_reload_and_worker_rss(
     runner: CliRunner,
     root_command: LitestarGroup,
@@ -614,3 +643,286 @@ def test_ssl_certfile_compatibility_alias_is_forwarded(
     assert result.exit_code == 0, result.output
     argv = run_supervised.call_args.args[1].argv
     assert f"--ssl-certificate={cert.resolve()}" in argv
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="parent-owned listeners are POSIX-only")
+def test_parent_binds_the_listener_and_hands_it_to_granian(
+    runner: CliRunner,
+    root_command: LitestarGroup,
+    app_file: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    observed: dict[str, Any] = {}
+
+    def run_supervised(_env: Any, built: Any, **kwargs: Any) -> int:
+        observed.update(kwargs, argv=built.argv, environment=built.environment, pass_fds=built.pass_fds)
+        with socket.create_connection(("127.0.0.1", kwargs["port"]), timeout=5):
+            pass
+        return 0
+
+    monkeypatch.setattr(cli, "_run_supervised", run_supervised)
+
+    result = runner.invoke(root_command, ["--app", f"{app_file.stem}:app", "run", "--port", "0"])
+
+    assert result.exit_code == 0, result.output
+    fd = observed["pass_fds"][0]
+    assert observed["port"] > 0
+    assert f"--port={observed['port']}" in observed["argv"]
+    assert observed["argv"][2] == "litestar_granian._runner"
+    assert observed["environment"]["LITESTAR_GRANIAN_FILE_DESCRIPTOR"] == str(fd)
+    with pytest.raises(OSError):
+        os.fstat(fd)
+
+
+def test_no_parent_socket_lets_granian_bind_in_the_child(
+    runner: CliRunner,
+    root_command: LitestarGroup,
+    app_file: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    run_supervised = MagicMock(return_value=0)
+    monkeypatch.setattr(cli, "_run_supervised", run_supervised)
+
+    result = runner.invoke(root_command, ["--app", f"{app_file.stem}:app", "run", "--no-parent-socket"])
+
+    assert result.exit_code == 0, result.output
+    built = run_supervised.call_args.args[1]
+    assert built.argv[2] == "granian"
+    assert built.pass_fds == ()
+    assert "LITESTAR_GRANIAN_FILE_DESCRIPTOR" not in built.environment
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="parent-owned listeners are POSIX-only")
+def test_parent_listener_bind_failures_are_reported(
+    runner: CliRunner,
+    root_command: LitestarGroup,
+    app_file: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    run_supervised = MagicMock(return_value=0)
+    monkeypatch.setattr(cli, "_run_supervised", run_supervised)
+
+    with socket.socket() as occupied:
+        occupied.bind(("127.0.0.1", 0))
+        occupied.listen()
+        port = occupied.getsockname()[1]
+        result = runner.invoke(root_command, ["--app", f"{app_file.stem}:app", "run", "--port", str(port)])
+
+    assert result.exit_code == 1
+    assert f"cannot bind 127.0.0.1:{port}" in _plain_output(result.output)
+    run_supervised.assert_not_called()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="socket activation is POSIX-only")
+def test_socket_activation_replaces_the_configured_address(
+    runner: CliRunner,
+    root_command: LitestarGroup,
+    app_file: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    run_supervised = MagicMock(return_value=0)
+    monkeypatch.setattr(cli, "_run_supervised", run_supervised)
+
+    with socket.create_server(("127.0.0.1", 0)) as listener:
+        port = listener.getsockname()[1]
+        fd = os.dup(listener.fileno())
+        adopted = socket.socket(fileno=fd)
+        monkeypatch.setattr(cli, "_activated_listeners", lambda: [_ActivatedListener(name="web", socket=adopted)])
+
+        result = runner.invoke(
+            root_command, ["--app", f"{app_file.stem}:app", "run", "--port", "1", "--rolling-restart"]
+        )
+
+    assert result.exit_code == 0, result.output
+    assert f"socket-activated listener web on 127.0.0.1:{port}" in _plain_output(result.output)
+    built = run_supervised.call_args.args[1]
+    assert run_supervised.call_args.kwargs["port"] == port
+    assert f"--port={port}" in built.argv
+    assert built.pass_fds == (fd,)
+    assert adopted.fileno() == -1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="socket activation is POSIX-only")
+def test_every_socket_activated_listener_is_handed_to_granian(
+    runner: CliRunner,
+    root_command: LitestarGroup,
+    app_file: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    run_supervised = MagicMock(return_value=0)
+    monkeypatch.setattr(cli, "_run_supervised", run_supervised)
+
+    with socket.create_server(("127.0.0.1", 0)) as web, socket.create_server(("127.0.0.1", 0)) as admin:
+        ports = [listener.getsockname()[1] for listener in (web, admin)]
+        adopted = [socket.socket(fileno=os.dup(listener.fileno())) for listener in (web, admin)]
+        fds = tuple(listener.fileno() for listener in adopted)
+        names = ("web", "admin")
+        listeners = [_ActivatedListener(name=name, socket=sock) for name, sock in zip(names, adopted, strict=True)]
+        monkeypatch.setattr(cli, "_activated_listeners", lambda: listeners)
+
+        result = runner.invoke(root_command, ["--app", f"{app_file.stem}:app", "run"])
+
+    assert result.exit_code == 0, result.output
+    output = _plain_output(result.output)
+    assert f"socket-activated listener admin on 127.0.0.1:{ports[1]}" in output
+    assert run_supervised.call_args.kwargs["port"] == ports[0]
+    assert run_supervised.call_args.args[1].pass_fds == fds
+    assert all(listener.fileno() == -1 for listener in adopted)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="additional listeners are POSIX-only")
+def test_parent_binds_every_additional_address_for_the_same_child(
+    runner: CliRunner,
+    root_command: LitestarGroup,
+    app_file: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    observed: list[tuple[int, Any]] = []
+
+    def run_supervised(_env: Any, built: Any, **_: Any) -> int:
+        for fd in built.pass_fds:
+            with socket.socket(fileno=os.dup(fd)) as listener:
+                observed.append((listener.family, listener.getsockname()))
+        return 0
+
+    monkeypatch.setattr(cli, "_run_supervised", run_supervised)
+    # Unix socket paths are limited to about 100 bytes, which pytest's tmp_path can exceed.
+    with tempfile.TemporaryDirectory(prefix="lg-") as directory:
+        path = str(Path(directory) / "app.sock")
+        result = runner.invoke(
+            root_command,
+            [
+                "--app",
+                f"{app_file.stem}:app",
+                "run",
+                "--port",
+                "0",
+                "--bind",
+                f"unix:{path}",
+                "--bind",
+                f"127.0.0.1:{free_port()}",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert not Path(path).exists()
+    assert [family for family, _ in observed] == [socket.AF_INET, socket.AF_UNIX, socket.AF_INET]
+    assert observed[1][1] == path
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="listener tuning is POSIX-only")
+def test_socket_tuning_is_applied_to_the_listener_handed_to_granian(
+    runner: CliRunner,
+    root_command: LitestarGroup,
+    app_file: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    observed: dict[str, int] = {}
+
+    def run_supervised(_env: Any, built: Any, **_: Any) -> int:
+        with socket.socket(fileno=os.dup(built.pass_fds[0])) as listener:
+            observed["nodelay"] = listener.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+            observed["keepalive"] = listener.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+        return 0
+
+    monkeypatch.setattr(cli, "_run_supervised", run_supervised)
+
+    result = runner.invoke(
+        root_command,
+        ["--app", f"{app_file.stem}:app", "run", "--port", "0", "--tcp-nodelay", "--tcp-keepalive-interval", "10"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert observed["nodelay"]
+    assert observed["keepalive"]
+
+
+def test_respawn_policy_is_opt_in(
+    runner: CliRunner,
+    root_command: LitestarGroup,
+    app_file: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    run_supervised = MagicMock(return_value=0)
+    monkeypatch.setattr(cli, "_run_supervised", run_supervised)
+
+    result = runner.invoke(root_command, ["--app", f"{app_file.stem}:app", "run", "--no-parent-socket"])
+    assert result.exit_code == 0, result.output
+    assert run_supervised.call_args.kwargs["respawn"] is None
+
+    result = runner.invoke(
+        root_command,
+        ["--app", f"{app_file.stem}:app", "run", "--no-parent-socket", "--child-respawn-max-backoff", "1m"],
+        env={"LITESTAR_GRANIAN_RESPAWN_FAILED_CHILD": "true", "LITESTAR_GRANIAN_CHILD_RESPAWN_LIMIT": "3"},
+    )
+    assert result.exit_code == 0, result.output
+    assert run_supervised.call_args.kwargs["respawn"] == _RespawnPolicy(backoff=0.5, max_backoff=60, limit=3)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="exec mode is POSIX-only")
+def test_exec_replaces_the_parent_with_granian_on_the_parent_listener(
+    runner: CliRunner,
+    root_command: LitestarGroup,
+    app_file: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    observed: dict[str, Any] = {}
+
+    def execve(path: str, argv: list[str], environment: dict[str, str]) -> None:
+        fd = int(environment["LITESTAR_GRANIAN_FILE_DESCRIPTOR"])
+        observed.update(path=path, argv=argv, environment=environment, inheritable=os.get_inheritable(fd))
+        raise SystemExit(0)
+
+    run_supervised = MagicMock(return_value=0)
+    monkeypatch.setattr(cli, "_run_supervised", run_supervised)
+    monkeypatch.setattr(os, "execve", execve)
+    monkeypatch.delenv("NOTIFY_SOCKET", raising=False)
+
+    result = runner.invoke(root_command, ["--app", f"{app_file.stem}:app", "run", "--port", "0", "--exec"])
+
+    assert result.exit_code == 0, result.output
+    run_supervised.assert_not_called()
+    assert observed["path"] == sys.executable
+    assert observed["argv"][:3] == [sys.executable, "-m", "litestar_granian._runner"]
+    assert observed["inheritable"]
+    assert observed["environment"]["LITESTAR_APP"] == f"{app_file.stem}:app"
+    assert observed["environment"]["LITESTAR_HOST"] == "127.0.0.1"
+    assert f"--port={observed['environment']['LITESTAR_PORT']}" in observed["argv"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="exec mode is POSIX-only")
+def test_exec_keeps_the_parent_for_server_lifespans(
+    runner: CliRunner,
+    root_command: LitestarGroup,
+    create_app_file: CreateAppFileFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    app_file = create_app_file(
+        "lifespan_app.py",
+        content=(
+            "from contextlib import contextmanager\n"
+            "from litestar import Litestar\n"
+            "from litestar.plugins import CLIPlugin\n"
+            "from litestar_granian import GranianPlugin\n\n"
+            "class Inert(CLIPlugin):\n"
+            "    pass\n\n"
+            "class Owner(CLIPlugin):\n"
+            "    @contextmanager\n"
+            "    def server_lifespan(self, app):\n"
+            "        yield\n\n"
+            "app = Litestar(plugins=[GranianPlugin(), Inert(), Owner()])\n"
+        ),
+    )
+    execve = MagicMock()
+    run_supervised = MagicMock(return_value=0)
+    monkeypatch.setattr(cli, "_run_supervised", run_supervised)
+    monkeypatch.setattr(os, "execve", execve)
+
+    result = runner.invoke(root_command, ["--app", f"{app_file.stem}:app", "run", "--exec"])
+
+    assert result.exit_code == 0, result.output
+    execve.assert_not_called()
+    run_supervised.assert_called_once()
+    assert "Keeping the Litestar parent instead of --exec: the application registers server lifespans" in (
+        _plain_output(result.output)
+    )
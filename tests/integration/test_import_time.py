@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from tests.conftest import CreateAppFileFixture
+
+# Microseconds the plugin's own modules may spend importing when the Litestar CLI loads it.
+_PLUGIN_IMPORT_BUDGET = 20_000
+_DEFERRED_MODULES = ("granian", "litestar_granian.cli", "litestar_granian.command", "litestar_granian.supervisor")
+
+
+def _import_times(*arguments: str, cwd: Path) -> dict[str, int]:
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join((str(cwd), env.get("PYTHONPATH", "")))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "litestar", *arguments],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    )
+    times: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        raw_self, _, name = line.removeprefix("import time:").split("|")
+        if raw_self.strip().isdigit():
+            times[name.strip()] = int(raw_self)
+    return times
+
+
+def test_litestar_help_does_not_import_granian_or_the_run_command(
+    create_app_file: CreateAppFileFixture,
+    tmp_project_dir: Path,
+) -> None:
+    app_file = create_app_file("lazy_app.py")
+
+    times = _import_times("--app", f"{app_file.stem}:app", "--help", cwd=tmp_project_dir)
+
+    assert "litestar_granian.plugin" in times
+    deferred = sorted(name for name in times if name.startswith(_DEFERRED_MODULES))
+    assert deferred == []
+    plugin_time = sum(elapsed for name, elapsed in times.items() if name.startswith("litestar_granian"))
+    assert plugin_time < _PLUGIN_IMPORT_BUDGET, times
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import http.client
+import json
 import os
 import signal
+import socket
+import subprocess
 import sys
 import sysconfig
+import tempfile
 import time
+import urllib.request
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -194,3 +200,705 @@ def test_parent_only_signal_reaps_granian_and_unwinds_lifespans(
             )
     finally:
         terminate_process_group(process)
+
+
+_ROLLING_APP = """
+from __future__ import annotations
+
+import os
+
+from litestar import Litestar, get
+
+from litestar_granian import GranianPlugin
+
+
+@get("/pid")
+async def worker_pid() -> dict[str, int]:
+    return {"pid": os.getpid()}
+
+
+app = Litestar(route_handlers=[worker_pid], plugins=[GranianPlugin()])
+"""
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="rolling restarts are POSIX-only")
+@pytest.mark.parametrize("restart_signal", ["SIGHUP", "SIGUSR2"])
+def test_rolling_restart_replaces_child_without_refusing_connections(
+    create_app_file: CreateAppFileFixture,
+    tmp_project_dir: Path,
+    restart_signal: str,
+) -> None:
+    app_file = create_app_file(f"rolling_{restart_signal.lower()}.py", content=_ROLLING_APP)
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(128)
+    port = listener.getsockname()[1]
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join((str(tmp_project_dir), env.get("PYTHONPATH", "")))
+    command = [
+        sys.executable,
+        "-m",
+        "litestar",
+        "--app",
+        f"{app_file.stem}:app",
+        "run",
+        "--fd",
+        str(listener.fileno()),
+        "--rolling-restart",
+        "--workers-kill-timeout",
+        "1",
+    ]
+    process = subprocess.Popen(
+        command,
+        cwd=tmp_project_dir,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        start_new_session=True,
+        pass_fds=(listener.fileno(),),
+    )
+
+    def worker_pid() -> int:
+        # A retiring Granian worker may close a connection it accepted as it stops; only refusals fail.
+        for _ in range(3):
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/pid", timeout=5) as response:
+                    return int(json.loads(response.read())["pid"])
+            except (http.client.RemoteDisconnected, ConnectionResetError):
+                continue
+        message = "connection was repeatedly dropped during the rolling restart"
+        raise AssertionError(message)
+
+    try:
+        deadline = time.monotonic() + 15
+        while True:
+            try:
+                original = worker_pid()
+                break
+            except (OSError, AssertionError):
+                if time.monotonic() > deadline or process.poll() is not None:
+                    raise
+                time.sleep(0.05)
+        original_descendants = descendants(process.pid)
+        os.kill(process.pid, getattr(signal, restart_signal))
+
+        observed = {original}
+        deadline = time.monotonic() + 20
+        while original in observed and time.monotonic() < deadline:
+            observed = {worker_pid() for _ in range(5)}
+        assert original not in observed
+        wait_for_descendants_to_exit(original_descendants - descendants(process.pid))
+
+        os.kill(process.pid, signal.SIGTERM)
+        assert process.wait(timeout=12) == 0
+    finally:
+        listener.close()
+        terminate_process_group(process)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="kills the child session with a POSIX signal")
+def test_failed_child_is_respawned_while_server_lifespans_stay_up(
+    create_app_file: CreateAppFileFixture,
+    tmp_project_dir: Path,
+    tmp_path: Path,
+) -> None:
+    app_file = create_app_file("respawned.py", content=_APP)
+    marker = tmp_path / "lifespan.txt"
+    port = free_port()
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join((str(tmp_project_dir), env.get("PYTHONPATH", "")))
+    env["SUPERVISOR_MARKER"] = str(marker)
+    command = [
+        sys.executable,
+        "-m",
+        "litestar",
+        "--app",
+        f"{app_file.stem}:app",
+        "run",
+        "--port",
+        str(port),
+        "--workers-kill-timeout",
+        "1",
+        "--respawn-failed-child",
+        "--child-respawn-backoff",
+        "0.1",
+        "--parent-memory-release",
+    ]
+    process = start_process(command, cwd=tmp_project_dir, env=env)
+
+    try:
+        wait_for_port(port, process, open_=True)
+        wait_for_markers(marker, "app-start", 1)
+        child = next(pid for pid in descendants(process.pid) if os.getpgid(pid) == pid)
+        os.killpg(child, signal.SIGKILL)
+
+        wait_for_markers(marker, "app-start", 2)
+        wait_for_port(port, process, open_=True)
+        assert process.poll() is None
+
+        os.kill(process.pid, signal.SIGTERM)
+        output = finish_process(process, timeout=12)
+        assert process.returncode == 0, output
+        assert "respawning in" in output
+        # The parent sheds its memory once, after the first child starts.
+        assert output.count("Litestar parent") == 1
+        lines = marker.read_text(encoding="utf-8").splitlines()
+        assert lines.count("sidecar-start") == 1
+        assert lines.count("sidecar-stop") == 1
+    finally:
+        terminate_process_group(process)
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="reads child command lines from /proc")
+def test_embedded_children_are_forked_from_the_parent_and_respawned(
+    create_app_file: CreateAppFileFixture,
+    tmp_project_dir: Path,
+    tmp_path: Path,
+) -> None:
+    app_file = create_app_file("embedded.py", content=_APP)
+    marker = tmp_path / "lifespan.txt"
+    port = free_port()
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join((str(tmp_project_dir), env.get("PYTHONPATH", "")))
+    env["SUPERVISOR_MARKER"] = str(marker)
+    command = [sys.executable, "-m", "litestar", "--app", f"{app_file.stem}:app", "run", "--port", str(port)]
+    command += ["--workers-kill-timeout", "1", "--embedded", "--respawn-failed-child", "--child-respawn-backoff", "0.1"]
+    process = start_process(command, cwd=tmp_project_dir, env=env)
+
+    try:
+        wait_for_port(port, process, open_=True)
+        wait_for_markers(marker, "app-start", 1)
+        child = next(pid for pid in descendants(process.pid) if os.getpgid(pid) == pid)
+        # No new interpreter was executed: the Granian main process still carries the parent's command line.
+        assert Path(f"/proc/{child}/cmdline").read_bytes() == Path(f"/proc/{process.pid}/cmdline").read_bytes()
+        os.killpg(child, signal.SIGKILL)
+
+        wait_for_markers(marker, "app-start", 2)
+        wait_for_port(port, process, open_=True)
+        os.kill(process.pid, signal.SIGTERM)
+        output = finish_process(process, timeout=12)
+        assert process.returncode == 0, output
+        lines = marker.read_text(encoding="utf-8").splitlines()
+        assert lines.count("sidecar-start") == 1
+        assert lines.count("sidecar-stop") == 1
+    finally:
+        terminate_process_group(process)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="sd_notify and --ready-file are POSIX-only")
+def test_readiness_is_announced_after_workers_start_and_withdrawn_on_shutdown(
+    create_app_file: CreateAppFileFixture,
+    tmp_project_dir: Path,
+    tmp_path: Path,
+) -> None:
+    app_file = create_app_file("announced.py", content=_ROLLING_APP)
+    ready_file = tmp_path / "ready"
+    port = free_port()
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join((str(tmp_project_dir), env.get("PYTHONPATH", "")))
+    command = [
+        sys.executable,
+        "-m",
+        "litestar",
+        "--app",
+        f"{app_file.stem}:app",
+        "run",
+        "--port",
+        str(port),
+        "--wc",
+        "2",
+        "--ready-file",
+        str(ready_file),
+    ]
+    # Unix socket paths are limited to about 100 bytes, which pytest's tmp_path can exceed.
+    with tempfile.TemporaryDirectory(prefix="lg-") as directory:
+        notify_path = str(Path(directory) / "notify.sock")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as manager:
+            manager.bind(notify_path)
+            manager.settimeout(20)
+            env["NOTIFY_SOCKET"] = notify_path
+            process = start_process(command, cwd=tmp_project_dir, env=env)
+            try:
+                ready = manager.recv(4096).decode().splitlines()
+                assert "READY=1" in ready
+                assert f"MAINPID={process.pid}" in ready
+                assert ready_file.read_text(encoding="utf-8").startswith("READY=1\n")
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/pid", timeout=5) as response:
+                    assert response.status == 200
+
+                os.kill(process.pid, signal.SIGTERM)
+                assert "STOPPING=1" in manager.recv(4096).decode().splitlines()
+                output = finish_process(process, timeout=12)
+                assert process.returncode == 0, output
+                assert not ready_file.exists()
+            finally:
+                terminate_process_group(process)
+
+
+_ACTIVATE = (
+    "import os, sys; os.dup2(int(sys.argv[1]), 3); "
+    "os.environ.update(LISTEN_PID=str(os.getpid()), LISTEN_FDS='1', LISTEN_FDNAMES='web'); "
+    "os.execv(sys.executable, [sys.executable, *sys.argv[2:]])"
+)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="socket activation is POSIX-only")
+@pytest.mark.parametrize("family", ["tcp", "uds"])
+def test_socket_activated_listener_is_served_and_survives_the_service(
+    create_app_file: CreateAppFileFixture,
+    tmp_project_dir: Path,
+    family: str,
+) -> None:
+    app_file = create_app_file(f"activated_{family}.py", content=_ROLLING_APP)
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join((str(tmp_project_dir), env.get("PYTHONPATH", "")))
+    # Unix socket paths are limited to about 100 bytes, which pytest's tmp_path can exceed.
+    with tempfile.TemporaryDirectory(prefix="lg-") as directory:
+        path = str(Path(directory) / "app.sock")
+        listener = socket.create_server(("127.0.0.1", 0)) if family == "tcp" else socket.socket(socket.AF_UNIX)
+        if family == "uds":
+            listener.bind(path)
+            listener.listen(128)
+        command = [sys.executable, "-c", _ACTIVATE, str(listener.fileno()), "-m", "litestar"]
+        command += ["--app", f"{app_file.stem}:app", "run", "--port", "1", "--workers-kill-timeout", "1"]
+
+        def request() -> http.client.HTTPResponse:
+            if family == "tcp":
+                connection = http.client.HTTPConnection("127.0.0.1", listener.getsockname()[1], timeout=20)
+            else:
+                connection = http.client.HTTPConnection("localhost", timeout=20)
+                connection.sock = socket.socket(socket.AF_UNIX)
+                connection.sock.settimeout(20)
+                connection.sock.connect(path)
+            connection.request("GET", "/pid")
+            return connection.getresponse()
+
+        process = subprocess.Popen(
+            command,
+            cwd=tmp_project_dir,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            start_new_session=True,
+            pass_fds=(listener.fileno(),),
+        )
+        try:
+            # The connection queues on the activated socket until the first worker serves it.
+            response = request()
+            assert response.status == 200
+            assert json.loads(response.read())["pid"] != process.pid
+
+            os.kill(process.pid, signal.SIGTERM)
+            output = finish_process(process, timeout=12)
+            assert process.returncode == 0, output
+            assert listener.getsockopt(socket.SOL_SOCKET, socket.SO_ACCEPTCONN)
+            if family == "uds":
+                assert Path(path).is_socket()
+        finally:
+            listener.close()
+            terminate_process_group(process)
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="SO_REUSEPORT load balancing is Linux-only")
+def test_reuse_port_gives_every_worker_its_own_listener(
+    create_app_file: CreateAppFileFixture,
+    tmp_project_dir: Path,
+) -> None:
+    app_file = create_app_file("reuse_port.py", content=_ROLLING_APP)
+    port = free_port()
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join((str(tmp_project_dir), env.get("PYTHONPATH", "")))
+    command = [sys.executable, "-m", "litestar", "--app", f"{app_file.stem}:app", "run"]
+    command += ["--port", str(port), "--wc", "2", "--reuse-port", "--workers-kill-timeout", "1"]
+    process = start_process(command, cwd=tmp_project_dir, env=env)
+
+    try:
+        wait_for_port(port, process, open_=True)
+        deadline = time.monotonic() + 15
+        served: set[int] = set()
+        # The kernel hashes each new connection to one worker's listener, so fresh connections reach both.
+        while len(served) < 2 and time.monotonic() < deadline:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/pid", timeout=5) as response:
+                served.add(int(json.loads(response.read())["pid"]))
+        assert len(served) == 2
+        assert process.pid not in served
+
+        os.kill(process.pid, signal.SIGTERM)
+        output = finish_process(process, timeout=12)
+        assert process.returncode == 0, output
+    finally:
+        terminate_process_group(process)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="additional listeners are POSIX-only")
+@pytest.mark.parametrize("runtime_mode", ["st", "mt"])
+def test_one_worker_pool_serves_tcp_and_unix_listeners(
+    create_app_file: CreateAppFileFixture,
+    tmp_project_dir: Path,
+    runtime_mode: str,
+) -> None:
+    app_file = create_app_file(f"several_listeners_{runtime_mode}.py", content=_ROLLING_APP)
+    port = free_port()
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join((str(tmp_project_dir), env.get("PYTHONPATH", "")))
+    # Unix socket paths are limited to about 100 bytes, which pytest's tmp_path can exceed.
+    with tempfile.TemporaryDirectory(prefix="lg-") as directory:
+        path = str(Path(directory) / "app.sock")
+        command = [sys.executable, "-m", "litestar", "--app", f"{app_file.stem}:app", "run", "--port", str(port)]
+        command += ["--bind", f"unix:{path}", "--runtime-mode", runtime_mode, "--workers-kill-timeout", "5"]
+        process = start_process(command, cwd=tmp_project_dir, env=env)
+
+        try:
+            wait_for_port(port, process, open_=True)
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/pid", timeout=5) as response:
+                tcp_pid = int(json.loads(response.read())["pid"])
+            connection = http.client.HTTPConnection("localhost", timeout=20)
+            connection.sock = socket.socket(socket.AF_UNIX)
+            connection.sock.settimeout(20)
+            connection.sock.connect(path)
+            connection.request("GET", "/pid")
+            unix_pid = int(json.loads(connection.getresponse().read())["pid"])
+            connection.close()
+            assert tcp_pid == unix_pid != process.pid
+
+            os.kill(process.pid, signal.SIGTERM)
+            output = finish_process(process, timeout=12)
+            assert process.returncode == 0, output
+            assert "refused to gracefully stop" not in output
+            assert not Path(path).exists()
+        finally:
+            terminate_process_group(process)
+
+
+_PRELOAD_APP = """
+from __future__ import annotations
+
+import gc
+import os
+from pathlib import Path
+
+from litestar import Litestar, get
+
+from litestar_granian import GranianPlugin
+
+with Path(os.environ["SUPERVISOR_MARKER"]).open("a", encoding="utf-8") as stream:
+    stream.write(f"import {os.getpid()}\\n")
+
+
+@get("/pid")
+async def worker_pid() -> dict[str, int]:
+    return {"pid": os.getpid(), "frozen": gc.get_freeze_count()}
+
+
+app = Litestar(route_handlers=[worker_pid], plugins=[GranianPlugin()])
+"""
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="preloading forks workers and is POSIX-only")
+def test_preload_imports_the_app_once_and_forks_workers_from_it(
+    create_app_file: CreateAppFileFixture,
+    tmp_project_dir: Path,
+) -> None:
+    app_file = create_app_file("preloaded.py", content=_PRELOAD_APP)
+    marker = tmp_project_dir / "imports.log"
+    port = free_port()
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join((str(tmp_project_dir), env.get("PYTHONPATH", "")))
+    env["SUPERVISOR_MARKER"] = str(marker)
+    command = [sys.executable, "-m", "litestar", "--app", f"{app_file.stem}:app", "run"]
+    command += ["--port", str(port), "--wc", "2", "--preload", "--workers-kill-timeout", "1"]
+    process = start_process(command, cwd=tmp_project_dir, env=env)
+
+    try:
+        wait_for_port(port, process, open_=True)
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/pid", timeout=5) as response:
+            served = json.loads(response.read())
+        # The Litestar parent resolves the app for its own CLI; the Granian main process imports it once for
+        # every worker.
+        importers = [int(line.split()[1]) for line in marker.read_text().splitlines()]
+        assert len(importers) == 2
+        assert importers[0] == process.pid
+        assert served["pid"] not in importers
+        assert served["frozen"] > 0
+
+        os.kill(process.pid, signal.SIGTERM)
+        output = finish_process(process, timeout=12)
+        assert process.returncode == 0, output
+    finally:
+        terminate_process_group(process)
+
+
+_GC_APP = """
+from __future__ import annotations
+
+import gc
+import os
+
+from litestar import Litestar, get
+
+from litestar_granian import GranianPlugin
+
+
+@get("/gc")
+async def collector_state() -> dict[str, object]:
+    return {"pid": os.getpid(), "enabled": gc.isenabled(), "frozen": gc.get_freeze_count()}
+
+
+app = Litestar(route_handlers=[collector_state], plugins=[GranianPlugin()])
+"""
+
+
+def test_manual_idle_gc_mode_is_applied_in_workers_and_pauses_are_reported(
+    create_app_file: CreateAppFileFixture,
+    tmp_project_dir: Path,
+) -> None:
+    app_file = create_app_file("gc_mode.py", content=_GC_APP)
+    port = free_port()
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join((str(tmp_project_dir), env.get("PYTHONPATH", "")))
+    command = [sys.executable, "-m", "litestar", "--app", f"{app_file.stem}:app", "run"]
+    command += ["--port", str(port), "--gc-mode", "manual-idle", "--workers-kill-timeout", "5"]
+    process = start_process(command, cwd=tmp_project_dir, env=env)
+
+    try:
+        wait_for_port(port, process, open_=True)
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/gc", timeout=5) as response:
+            state = json.loads(response.read())
+        assert state["pid"] != process.pid
+        assert state["enabled"] is False
+        assert state["frozen"] > 0
+
+        os.kill(process.pid, _WINDOWS_BREAK if sys.platform == "win32" else signal.SIGTERM)
+        output = finish_process(process, timeout=12)
+        assert process.returncode == 0, output
+        assert "Garbage collector mode manual-idle applied" in output
+        assert "Garbage collector pauses: gen0:" in output
+    finally:
+        terminate_process_group(process)
+
+
+_EXEC_APP = """
+from __future__ import annotations
+
+import os
+
+from litestar import Litestar, get
+
+from litestar_granian import GranianPlugin
+
+
+@get("/pid")
+async def worker_parent() -> dict[str, object]:
+    return {"parent": os.getppid(), "app": os.environ.get("LITESTAR_APP"), "port": os.environ.get("LITESTAR_PORT")}
+
+
+app = Litestar(route_handlers=[worker_parent], plugins=[GranianPlugin()])
+"""
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="exec mode is POSIX-only")
+def test_exec_leaves_granian_as_the_launched_process(
+    create_app_file: CreateAppFileFixture,
+    tmp_project_dir: Path,
+) -> None:
+    app_file = create_app_file("exec_app.py", content=_EXEC_APP)
+    port = free_port()
+    env = os.environ.copy()
+    env.pop("NOTIFY_SOCKET", None)
+    env["PYTHONPATH"] = os.pathsep.join((str(tmp_project_dir), env.get("PYTHONPATH", "")))
+    command = [sys.executable, "-m", "litestar", "--app", f"{app_file.stem}:app", "run"]
+    command += ["--port", str(port), "--exec", "--workers-kill-timeout", "1"]
+    process = start_process(command, cwd=tmp_project_dir, env=env)
+
+    try:
+        wait_for_port(port, process, open_=True)
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/pid", timeout=5) as response:
+            served = json.loads(response.read())
+        # Workers are children of the launched PID, which is now the Granian main process.
+        assert served == {"parent": process.pid, "app": f"{app_file.stem}:app", "port": str(port)}
+
+        os.kill(process.pid, signal.SIGTERM)
+        output = finish_process(process, timeout=12)
+        assert process.returncode == 0, output
+        assert "Granian workers stopped." not in output
+    finally:
+        terminate_process_group(process)
+
+
+_RSGI_APP = """
+from __future__ import annotations
+
+import os
+
+from litestar import Litestar, Request, WebSocket, post, websocket
+
+from litestar_granian import GranianPlugin
+
+
+def remember_worker(app: Litestar) -> None:
+    app.state.worker = os.getpid()
+
+
+@post("/echo")
+async def echo(request: Request, data: dict[str, str]) -> dict[str, object]:
+    return {**data, "worker": request.app.state.worker, "prefix": request.scope["root_path"]}
+
+
+@websocket("/ws")
+async def shout(socket: WebSocket) -> None:
+    await socket.accept()
+    await socket.send_text((await socket.receive_text()).upper())
+    await socket.close()
+
+
+app = Litestar(route_handlers=[echo, shout], on_startup=[remember_worker], plugins=[GranianPlugin()])
+"""
+
+
+def test_rsgi_interface_serves_http_websockets_and_lifespans(
+    create_app_file: CreateAppFileFixture,
+    tmp_project_dir: Path,
+) -> None:
+    from websockets.sync.client import connect
+
+    app_file = create_app_file("rsgi_app.py", content=_RSGI_APP)
+    port = free_port()
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join((str(tmp_project_dir), env.get("PYTHONPATH", "")))
+    command = [sys.executable, "-m", "litestar", "--app", f"{app_file.stem}:app", "run"]
+    command += ["--port", str(port), "--interface", "rsgi", "--url-path-prefix", "/api", "--workers-kill-timeout", "5"]
+    process = start_process(command, cwd=tmp_project_dir, env=env)
+
+    try:
+        wait_for_port(port, process, open_=True)
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        connection.request("POST", "/echo", body=b'{"name": "granian"}', headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        assert response.status == 201
+        served = json.loads(response.read())
+        connection.close()
+        assert served["name"] == "granian"
+        assert served["worker"] != process.pid
+        assert served["prefix"] == "/api"
+        with connect(f"ws://127.0.0.1:{port}/ws", open_timeout=5, close_timeout=5) as client:
+            client.send("hello")
+            assert client.recv(timeout=5) == "HELLO"
+
+        os.kill(process.pid, _WINDOWS_BREAK if sys.platform == "win32" else signal.SIGTERM)
+        output = finish_process(process, timeout=12)
+        assert process.returncode == 0, output
+    finally:
+        terminate_process_group(process)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="worker readiness reports use AF_UNIX sockets")
+def test_startup_report_times_parent_and_worker_phases(
+    create_app_file: CreateAppFileFixture,
+    tmp_project_dir: Path,
+) -> None:
+    app_file = create_app_file("reported.py", content=_EXEC_APP)
+    report_file = tmp_project_dir / "startup.json"
+    port = free_port()
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join((str(tmp_project_dir), env.get("PYTHONPATH", "")))
+    command = [sys.executable, "-m", "litestar", "--app", f"{app_file.stem}:app", "run"]
+    command += ["--port", str(port), "--wc", "2", "--startup-report", "--startup-report-json", str(report_file)]
+    process = start_process(command, cwd=tmp_project_dir, env=env)
+
+    try:
+        wait_for_port(port, process, open_=True)
+        deadline = time.monotonic() + 15
+        while not report_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        report = json.loads(report_file.read_text(encoding="utf-8"))
+        phases = {(phase["process"].split(" (pid")[0], phase["name"]) for phase in report["phases"]}
+        assert {
+            ("Litestar parent", "server lifespans"),
+            ("Litestar parent", "Granian child spawn"),
+            ("Granian child", "interpreter start and runner import"),
+            ("worker 1", "application import"),
+            ("worker 2", "startup hooks until accepting"),
+        } <= phases
+        assert report["ready_seconds"] >= max(phase["offset_seconds"] for phase in report["phases"])
+
+        os.kill(process.pid, signal.SIGTERM)
+        output = finish_process(process, timeout=12)
+        assert process.returncode == 0, output
+        assert "Startup report: ready" in output
+    finally:
+        terminate_process_group(process)
+
+
+_OVERLAP_APP = """
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from litestar import Litestar, get
+from litestar.plugins import CLIPlugin
+
+from litestar_granian import GranianPlugin
+
+MARKER = Path(os.environ["SUPERVISOR_MARKER"])
+
+
+def record(event: str) -> None:
+    with MARKER.open("a", encoding="utf-8") as marker:
+        marker.write(event + "\\n")
+
+
+class Warmup(CLIPlugin):
+    @contextmanager
+    def server_lifespan(self, app: Litestar) -> Iterator[None]:
+        # Only finishes early if a worker can start while this lifespan is still starting.
+        deadline = time.monotonic() + 15
+        while time.monotonic() < deadline and not MARKER.exists():
+            time.sleep(0.05)
+        record("lifespans started")
+        yield
+
+
+@get("/events")
+async def events() -> list[str]:
+    return MARKER.read_text(encoding="utf-8").splitlines()
+
+
+app = Litestar(route_handlers=[events], on_startup=[lambda: record("worker started")], plugins=[GranianPlugin(), Warmup()])
+"""
+
+
+def test_lifespan_barrier_overlaps_worker_startup_but_holds_requests(
+    create_app_file: CreateAppFileFixture,
+    tmp_project_dir: Path,
+) -> None:
+    app_file = create_app_file("overlapped.py", content=_OVERLAP_APP)
+    marker = tmp_project_dir / "events.log"
+    port = free_port()
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join((str(tmp_project_dir), env.get("PYTHONPATH", "")))
+    env["SUPERVISOR_MARKER"] = str(marker)
+    command = [sys.executable, "-m", "litestar", "--app", f"{app_file.stem}:app", "run"]
+    command += ["--port", str(port), "--lifespan-overlap", "barrier", "--workers-kill-timeout", "5"]
+    process = start_process(command, cwd=tmp_project_dir, env=env)
+
+    try:
+        wait_for_port(port, process, open_=True)
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+        connection.request("GET", "/events")
+        response = connection.getresponse()
+        assert response.status == 200
+        # The worker started while the parent lifespan was still starting, but served only after it finished.
+        assert json.loads(response.read()) == ["worker started", "lifespans started"]
+        connection.close()
+
+        os.kill(process.pid, _WINDOWS_BREAK if sys.platform == "win32" else signal.SIGTERM)
+        output = finish_process(process, timeout=12)
+        assert process.returncode == 0, output
+    finally:
+        terminate_process_group(process)
@@ -4,7 +4,7 @@ import os
 import signal
 import subprocess
 import sys
-from collections.abc import Iterator
+from collections.abc import Generator, Iterator
 from contextlib import contextmanager
 from pathlib import Path
 from types import SimpleNamespace
@@ -15,6 +15,8 @@ import pytest
 
 from litestar_granian import cli
 from litestar_granian.command import _GranianCommand
+from litestar_granian.lifespans import _LIFESPAN_BARRIER_ENV, _LifespanOverlap
+from litestar_granian.plugin import GranianPlugin
 
 
 def test_supervised_runtime_keeps_handlers_and_app_env_through_lifespan_exit(
@@ -190,3 +192,128 @@ def test_supervised_runtime_removes_generated_config_if_lifespan_entry_fails(
         cli._run_supervised(env, built, workers_kill_timeout=5, host="127.0.0.1", port=9000)
 
     assert not config_path.exists()
+
+
+def test_parent_memory_is_released_only_when_requested(monkeypatch: pytest.MonkeyPatch) -> None:
+    released: list[bool] = []
+    supervisor_class = MagicMock(return_value=MagicMock(run=MagicMock(return_value=0)))
+    monkeypatch.setattr(cli, "_GranianSupervisor", supervisor_class)
+    monkeypatch.setattr(cli, "_SignalForwarder", MagicMock())
+    monkeypatch.setattr(cli, "_server_lifespan", MagicMock())
+    monkeypatch.setattr(cli, "_shed_parent_memory", lambda *, freeze, **_: released.append(freeze))
+    built: Any = SimpleNamespace(argv=["granian"], cleanup=MagicMock(), environment={}, pass_fds=())
+    env: Any = SimpleNamespace(app=object(), app_path="resolved:app")
+
+    assert cli._run_supervised(env, built, workers_kill_timeout=5, host="127.0.0.1", port=9000) == 0
+    assert supervisor_class.call_args.kwargs.get("on_started") is None
+
+    cli._run_supervised(
+        env,
+        built,
+        workers_kill_timeout=5,
+        host="127.0.0.1",
+        port=9000,
+        parent_memory_release=True,
+        parent_gc_freeze=True,
+    )
+    supervisor_class.call_args.kwargs["on_started"]()
+    assert released == [True]
+
+
+def test_overlapped_lifespans_start_after_the_child_and_then_lift_the_barrier(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    events: list[str] = []
+    barrier_path: list[Path] = []
+
+    @contextmanager
+    def lifespan(_app: object) -> Generator[None, None, None]:
+        events.append(f"lifespan entered, barrier up: {barrier_path[0].exists()}")
+        try:
+            yield
+        finally:
+            events.append("lifespan exited")
+
+    def build_supervisor(_argv: list[str], **kwargs: Any) -> MagicMock:
+        barrier_path.append(Path(kwargs["environment"][_LIFESPAN_BARRIER_ENV]))
+
+        def run() -> int:
+            events.append("child spawned")
+            kwargs["on_started"]()
+            events.append(f"serving, barrier up: {barrier_path[0].exists()}")
+            return 0
+
+        return MagicMock(run=run)
+
+    monkeypatch.setattr(cli, "_GranianSupervisor", build_supervisor)
+    monkeypatch.setattr(cli, "_SignalForwarder", MagicMock())
+    monkeypatch.setattr(cli, "_server_lifespan", lifespan)
+    monkeypatch.setattr(cli, "_shed_parent_memory", lambda **_: events.append("memory released"))
+    built: Any = SimpleNamespace(argv=["granian"], cleanup=MagicMock(), environment={"KEEP": "1"}, pass_fds=())
+    env: Any = SimpleNamespace(app=object(), app_path="resolved:app")
+
+    exit_code = cli._run_supervised(
+        env,
+        built,
+        workers_kill_timeout=5,
+        host="127.0.0.1",
+        port=9000,
+        parent_memory_release=True,
+        lifespan_overlap=_LifespanOverlap.barrier,
+    )
+
+    assert exit_code == 0
+    assert events == [
+        "child spawned",
+        "lifespan entered, barrier up: True",
+        "memory released",
+        "serving, barrier up: False",
+        "lifespan exited",
+    ]
+    assert built.environment == {"KEEP": "1"}
+
+
+def test_concurrent_lifespans_wrap_the_child_in_declared_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    events: list[str] = []
+
+    class Database:
+        @contextmanager
+        def server_lifespan(self, _app: object) -> Generator[None, None, None]:
+            events.append("database entered")
+            try:
+                yield
+            finally:
+                events.append("database exited")
+
+    class Cache:
+        @contextmanager
+        def server_lifespan(self, _app: object) -> Generator[None, None, None]:
+            events.append("cache entered")
+            try:
+                yield
+            finally:
+                events.append("cache exited")
+
+    def run() -> int:
+        events.append("serving")
+        return 0
+
+    printed: list[str] = []
+    monkeypatch.setattr(cli, "_GranianSupervisor", MagicMock(return_value=MagicMock(run=run)))
+    monkeypatch.setattr(cli, "_SignalForwarder", MagicMock())
+    monkeypatch.setattr(cli.console, "print", lambda message, **_: printed.append(message))
+    app = SimpleNamespace(
+        plugins=[GranianPlugin(lifespan_dependencies={Cache: [Database]})],
+        _server_lifespan_managers=[Cache().server_lifespan, Database().server_lifespan],
+    )
+    built: Any = SimpleNamespace(argv=["granian"], cleanup=MagicMock(), environment={}, pass_fds=())
+    env: Any = SimpleNamespace(app=app, app_path="resolved:app")
+
+    exit_code = cli._run_supervised(
+        env, built, workers_kill_timeout=5, host="127.0.0.1", port=9000, concurrent_lifespans=True
+    )
+
+    assert exit_code == 0
+    assert events == ["database entered", "cache entered", "serving", "cache exited", "database exited"]
+    assert any(message.startswith("[dim]Server lifespans started concurrently: Cache") for message in printed)
+    assert any(message.startswith("[dim]Server lifespans stopped: Cache") for message in printed)
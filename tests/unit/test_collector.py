@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import logging
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from litestar_granian import collector
+from litestar_granian.collector import (
+    _apply_gc_mode,
+    _GCMode,
+    _IdleCollector,
+    _load_with_gc_mode,
+    _PauseRecorder,
+    _report_gc_pauses,
+)
+
+
+@pytest.fixture
+def restore_gc(monkeypatch: pytest.MonkeyPatch) -> Iterator[_PauseRecorder]:
+    recorder = _PauseRecorder()
+    monkeypatch.setattr(collector, "_pause_recorder", recorder)
+    thresholds = gc.get_threshold()
+    yield recorder
+    if recorder in gc.callbacks:
+        gc.callbacks.remove(recorder)
+    gc.unfreeze()
+    gc.set_threshold(*thresholds)
+    gc.enable()
+
+
+def test_pauses_are_timed_per_generation_and_slow_ones_logged(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    clock = iter((1.0, 1.002, 2.0, 2.25))
+    monkeypatch.setattr(collector.time, "perf_counter", lambda: next(clock))
+    recorder = _PauseRecorder(slow_pause=0.1)
+
+    with caplog.at_level(logging.WARNING, logger="litestar_granian.collector"):
+        recorder("start", {"generation": 0})
+        recorder("stop", {"generation": 0, "collected": 3})
+        recorder("start", {"generation": 2})
+        recorder("stop", {"generation": 2, "collected": 40})
+
+    assert recorder.generations[0].collections == 1
+    assert recorder.generations[2].longest == pytest.approx(0.25)
+    assert caplog.messages == ["Generation 2 garbage collection paused the worker for 250.0 ms (40 objects collected)"]
+    assert recorder.summary().startswith("gen0: 1 collections, 2.0 ms total, 2.0 ms max; gen1: 0 collections")
+
+
+@pytest.mark.parametrize(
+    ("mode", "enabled", "thresholds"),
+    [
+        (_GCMode.freeze_after_startup, True, None),
+        (_GCMode.tuned_thresholds, True, collector._TUNED_THRESHOLDS),
+        (_GCMode.manual_idle, False, None),
+    ],
+)
+def test_modes_freeze_startup_objects_and_start_timing(
+    restore_gc: _PauseRecorder,
+    mode: _GCMode,
+    enabled: bool,
+    thresholds: tuple[int, int, int] | None,
+) -> None:
+    defaults = gc.get_threshold()
+
+    _apply_gc_mode(mode)
+
+    assert gc.get_freeze_count() > 0
+    assert gc.isenabled() is enabled
+    assert gc.get_threshold() == (thresholds or defaults)
+    assert restore_gc in gc.callbacks
+
+
+def test_default_mode_only_times_pauses(restore_gc: _PauseRecorder) -> None:
+    _apply_gc_mode(_GCMode.default)
+
+    assert gc.get_freeze_count() == 0
+    assert restore_gc in gc.callbacks
+
+
+def test_litestar_targets_are_tuned_after_startup_and_report_on_shutdown(restore_gc: _PauseRecorder) -> None:
+    user_hook = MagicMock()
+    app: Any = SimpleNamespace(on_startup=[user_hook], on_shutdown=[])
+
+    loaded = _load_with_gc_mode("app:app", loader=MagicMock(return_value=app), mode=_GCMode.manual_idle)
+
+    assert isinstance(loaded, _IdleCollector)
+    assert loaded.on_startup[0] is user_hook
+    assert len(loaded.on_startup) == 2
+    assert app.on_shutdown == [_report_gc_pauses]
+    assert gc.isenabled()
+    assert restore_gc not in gc.callbacks
+
+
+@pytest.mark.anyio
+async def test_idle_collector_collects_once_no_request_is_in_flight(monkeypatch: pytest.MonkeyPatch) -> None:
+    collect = MagicMock()
+    monkeypatch.setattr(collector, "_collect_due_generation", collect)
+    release = asyncio.Event()
+
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        if scope["path"] == "/slow":
+            await release.wait()
+
+    wrapped = _IdleCollector(app)
+    slow = asyncio.create_task(wrapped({"type": "http", "path": "/slow"}, None, None))
+    await asyncio.sleep(0)
+    await wrapped({"type": "http", "path": "/fast"}, None, None)
+    await asyncio.sleep(0)
+    collect.assert_not_called()
+
+    release.set()
+    await slow
+    await asyncio.sleep(0)
+    collect.assert_called_once_with()
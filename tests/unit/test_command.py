@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import logging
 import multiprocessing
+import os
 import re
 import sys
 from pathlib import Path
@@ -10,16 +11,21 @@ from types import SimpleNamespace
 from typing import Any
 
 import pytest
-from click import UsageError
+from click import BadParameter, UsageError
 from granian.constants import HTTPModes, Loops
 from granian.log import LogLevels
 from litestar.logging import LoggingConfig
 
 from litestar_granian import command
 from litestar_granian.cli import _validate_cli_options, run_command
+from litestar_granian.collector import _GCMode
 from litestar_granian.command import _build_granian_command
+from litestar_granian.lifespans import _LifespanOverlap
 from litestar_granian.logging import build_logging_config
 from litestar_granian.plugin import GranianPlugin
+from litestar_granian.reloader import _Reloader
+from litestar_granian.rsgi import _Interface
+from litestar_granian.sockets import _BindAddress, _SocketTuning
 
 
 @pytest.fixture(autouse=True)
@@ -232,6 +238,16 @@ def test_automatic_formatter_matching_generates_mode_600_config() -> None:
     assert built.temporary_files == ()
 
 
+def test_exec_hands_the_generated_log_config_to_the_runner_for_removal() -> None:
+    built = _build_granian_command(_env(GranianPlugin(), LoggingConfig()), _options(exec_granian=True))
+    try:
+        (config_path,) = built.temporary_files
+        assert built.argv[:3] == [sys.executable, "-m", "litestar_granian._runner"]
+        assert json.loads(built.environment["LITESTAR_GRANIAN_TEMPORARY_FILES"]) == [str(config_path)]
+    finally:
+        built.cleanup()
+
+
 def test_no_logging_config_keeps_granian_native_logging(monkeypatch: pytest.MonkeyPatch) -> None:
     logger = logging.getLogger("litestar")
     monkeypatch.setattr(logger, "handlers", [])
@@ -247,6 +263,8 @@ def _validate(**overrides: Any) -> None:
     options: dict[str, Any] = {
         "fd": None,
         "reload": False,
+        "reloader": _Reloader.granian,
+        "reload_coalescing": False,
         "workers_max_rss": None,
         "ssl_client_verify": False,
         "ssl_ca": None,
@@ -255,11 +273,203 @@ def _validate(**overrides: Any) -> None:
         "create_self_signed_cert": False,
         "static_path_route": (),
         "static_path_mount": (),
+        "parent_socket": True,
+        "rolling_restart": False,
+        "child_max_rss": None,
+        "pid_file": None,
+        "metrics_enabled": False,
+        "ready_file": None,
+        "reuse_port": False,
+        "uds": None,
+        "port": 8000,
+        "tuning": _SocketTuning(),
+        "bind": (),
+        "preload": False,
+        "exec_granian": False,
+        "respawn_failed_child": False,
+        "embedded": False,
+        "startup_report": False,
+        "lifespan_overlap": _LifespanOverlap.off,
+        "concurrent_lifespans": False,
+        "parent_memory_release": False,
+        "parent_gc_freeze": False,
     }
     options.update(overrides)
     _validate_cli_options(**options)
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="rolling restarts are POSIX-only")
+@pytest.mark.parametrize(
+    ("overrides", "expected"),
+    [
+        ({"parent_socket": False}, "--rolling-restart requires a shared listener"),
+        ({"pid_file": Path("granian.pid")}, "cannot be combined with --pid-file"),
+        ({"metrics_enabled": True}, "cannot be combined with --metrics"),
+    ],
+)
+def test_rolling_restart_rejects_exclusive_child_resources(overrides: dict[str, Any], expected: str) -> None:
+    with pytest.raises(UsageError, match=re.escape(expected)):
+        _validate(rolling_restart=True, **overrides)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="rolling restarts are POSIX-only")
+@pytest.mark.parametrize("overrides", [{}, {"parent_socket": False, "fd": 3}])
+def test_rolling_restart_with_a_shared_listener_passes_validation(overrides: dict[str, Any]) -> None:
+    _validate(rolling_restart=True, **overrides)
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="the child memory limit reads /proc")
+@pytest.mark.parametrize(
+    ("overrides", "expected"),
+    [
+        ({"parent_socket": False}, "--child-max-rss requires a shared listener"),
+        ({"metrics_enabled": True}, "--child-max-rss cannot be combined with --metrics"),
+        ({"exec_granian": True}, "--exec cannot be combined with --child-max-rss"),
+    ],
+)
+def test_child_memory_limit_needs_what_rolling_restarts_need(overrides: dict[str, Any], expected: str) -> None:
+    _validate(child_max_rss=512)
+    with pytest.raises(UsageError, match=re.escape(expected)):
+        _validate(child_max_rss=512, **overrides)
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="SO_REUSEPORT load balancing is Linux-only")
+@pytest.mark.parametrize(
+    ("overrides", "expected"),
+    [
+        ({"uds": "/run/app.sock"}, "cannot be combined with --uds"),
+        ({"fd": 3}, "cannot use --fd or socket activation"),
+        ({"port": 0}, "--reuse-port requires a fixed --port"),
+        ({"rolling_restart": True}, "--rolling-restart cannot be combined with --reuse-port"),
+    ],
+)
+def test_reuse_port_requires_a_fixed_tcp_address_per_worker(overrides: dict[str, Any], expected: str) -> None:
+    with pytest.raises(UsageError, match=re.escape(expected)):
+        _validate(reuse_port=True, **overrides)
+
+
+@pytest.mark.skipif(sys.platform == "linux", reason="SO_REUSEPORT load balancing is Linux-only")
+def test_reuse_port_is_rejected_outside_linux() -> None:
+    with pytest.raises(UsageError, match="--reuse-port is only supported on Linux"):
+        _validate(reuse_port=True)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="listener tuning is POSIX-only")
+@pytest.mark.parametrize(
+    ("overrides", "expected"),
+    [
+        ({"parent_socket": False}, "--tcp-nodelay requires a parent-owned listener (--parent-socket or --fd)"),
+        ({"uds": "/run/app.sock"}, "--tcp-nodelay requires a TCP listener and cannot be combined with --uds"),
+        ({"reuse_port": True}, "--tcp-nodelay cannot be combined with --reuse-port"),
+    ],
+)
+def test_socket_tuning_requires_a_parent_owned_tcp_listener(overrides: dict[str, Any], expected: str) -> None:
+    with pytest.raises(UsageError, match=re.escape(expected)):
+        _validate(tuning=_SocketTuning(tcp_nodelay=True), **overrides)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="listener tuning is POSIX-only")
+def test_buffer_sizes_apply_to_unix_and_inherited_listeners() -> None:
+    _validate(tuning=_SocketTuning(so_rcvbuf=1 << 20), uds="/run/app.sock")
+    _validate(tuning=_SocketTuning(tcp_defer_accept=5), parent_socket=False, fd=3)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="additional listeners are POSIX-only")
+@pytest.mark.parametrize(
+    ("overrides", "expected"),
+    [
+        ({"parent_socket": False}, "--bind requires a parent-owned primary listener (--parent-socket or --fd)"),
+        ({"reuse_port": True}, "--bind cannot be combined with --reuse-port"),
+    ],
+)
+def test_bind_requires_a_parent_owned_primary_listener(overrides: dict[str, Any], expected: str) -> None:
+    with pytest.raises(UsageError, match=re.escape(expected)):
+        _validate(bind=(_BindAddress(uds="/run/app.sock"),), **overrides)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="additional listeners are POSIX-only")
+def test_bind_accepts_an_inherited_primary_listener() -> None:
+    _validate(bind=(_BindAddress(host="::1", port=8001),), parent_socket=False, fd=3)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="preloading forks workers and is POSIX-only")
+def test_preload_cannot_serve_reloaded_code() -> None:
+    with pytest.raises(UsageError, match=re.escape("--preload cannot be combined with --reload")):
+        _validate(preload=True, reload=True)
+
+
+def test_reload_coalescing_needs_the_parent_reloader() -> None:
+    _validate(reload=True, reloader=_Reloader.parent, reload_coalescing=True)
+    for overrides in ({"reload": True}, {"reloader": _Reloader.parent}):
+        with pytest.raises(UsageError, match=re.escape("require --reload with --reloader parent")):
+            _validate(reload_coalescing=True, **overrides)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="preloading and forked children are POSIX-only")
+def test_parent_reloader_restarts_whole_children_but_cannot_refresh_forked_ones() -> None:
+    _validate(preload=True, reload=True, reloader=_Reloader.parent)
+    _validate(embedded=True, reload=True)
+    with pytest.raises(UsageError, match=re.escape("--embedded cannot be combined with --reloader parent")):
+        _validate(embedded=True, reload=True, reloader=_Reloader.parent)
+    with pytest.raises(UsageError, match=re.escape("--exec cannot be combined with --reloader parent")):
+        _validate(exec_granian=True, reload=True, reloader=_Reloader.parent)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="embedded children are POSIX-only")
+def test_embedded_children_are_forked_before_concurrent_lifespan_threads_start() -> None:
+    _validate(embedded=True, concurrent_lifespans=True, lifespan_overlap=_LifespanOverlap.barrier)
+    _validate(embedded=True, concurrent_lifespans=True, lifespan_overlap=_LifespanOverlap.eager)
+    with pytest.raises(UsageError, match=re.escape("requires --lifespan-overlap barrier or eager")):
+        _validate(embedded=True, concurrent_lifespans=True)
+    for overrides, flag in (
+        ({"rolling_restart": True}, "--rolling-restart"),
+        ({"respawn_failed_child": True}, "--respawn-failed-child"),
+        ({"child_max_rss": 512}, "--child-max-rss"),
+    ):
+        with pytest.raises(UsageError, match=re.escape(f"cannot be combined with {flag}, which forks later")):
+            _validate(
+                embedded=True,
+                concurrent_lifespans=True,
+                lifespan_overlap=_LifespanOverlap.barrier,
+                **overrides,
+            )
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="exec mode is POSIX-only")
+@pytest.mark.parametrize(
+    ("overrides", "flag"),
+    [
+        ({"rolling_restart": True}, "--rolling-restart"),
+        ({"respawn_failed_child": True}, "--respawn-failed-child"),
+        ({"ready_file": Path("ready")}, "--ready-file"),
+        ({"startup_report": True}, "--startup-report"),
+        ({"embedded": True}, "--embedded"),
+        ({"lifespan_overlap": _LifespanOverlap.barrier}, "--lifespan-overlap"),
+        ({"lifespan_overlap": _LifespanOverlap.eager}, "--lifespan-overlap"),
+        ({"concurrent_lifespans": True}, "--concurrent-lifespans"),
+        ({"parent_memory_release": True}, "--parent-memory-release"),
+        ({"parent_gc_freeze": True}, "--parent-gc-freeze"),
+    ],
+)
+def test_exec_rejects_features_run_by_the_litestar_parent(overrides: dict[str, Any], flag: str) -> None:
+    with pytest.raises(UsageError, match=re.escape(f"--exec cannot be combined with {flag}")):
+        _validate(exec_granian=True, **overrides)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="--ready-file is POSIX-only")
+def test_ready_file_directory_must_exist_and_be_writable(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _validate(ready_file=tmp_path / "ready")
+    missing = tmp_path / "missing"
+    with pytest.raises(
+        UsageError, match=f"Directory for --ready-file was not found: {re.escape(str(missing.resolve()))}"
+    ):
+        _validate(ready_file=missing / "ready")
+
+    monkeypatch.setattr(os, "access", lambda _path, _mode: False)
+    with pytest.raises(UsageError, match="Directory for --ready-file is not writable"):
+        _validate(ready_file=tmp_path / "ready")
+
+
 def test_ssl_client_verification_requires_ca() -> None:
     with pytest.raises(UsageError, match="--ssl-ca"):
         _validate(ssl_client_verify=True)
@@ -379,12 +589,92 @@ def test_litestar_file_descriptor_uses_compatibility_runner() -> None:
     assert built.pass_fds == (7,)
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="inherited file descriptors are POSIX-only")
+def test_additional_listeners_are_inherited_by_the_same_child() -> None:
+    built = _build_granian_command(_env(), _options(fd=(7, 8, 9)))
+
+    assert built.environment["LITESTAR_GRANIAN_FILE_DESCRIPTOR"] == "7"
+    assert json.loads(built.environment["LITESTAR_GRANIAN_EXTRA_FILE_DESCRIPTORS"]) == [8, 9]
+    assert built.pass_fds == (7, 8, 9)
+
+
+def test_rolling_restart_uses_compatibility_runner() -> None:
+    built = _build_granian_command(_env(), _options(rolling_restart=True))
+
+    assert built.argv[:4] == [sys.executable, "-m", "litestar_granian._runner", "app:app"]
+    assert not any("rolling" in argument for argument in built.argv)
+
+
+@pytest.mark.parametrize("overrides", [{"startup_report": True}, {"startup_report_json": Path("startup.json")}])
+def test_startup_report_uses_compatibility_runner(overrides: dict[str, Any]) -> None:
+    built = _build_granian_command(_env(), _options(**overrides))
+
+    assert built.argv[:4] == [sys.executable, "-m", "litestar_granian._runner", "app:app"]
+    assert not any("startup" in argument for argument in built.argv)
+
+
+def test_lifespan_barrier_uses_compatibility_runner() -> None:
+    assert _build_granian_command(_env(), _options(lifespan_overlap="barrier")).argv[2] == "litestar_granian._runner"
+    assert _build_granian_command(_env(), _options(lifespan_overlap="eager")).argv[2] == "granian"
+
+
+def test_reuse_port_uses_compatibility_runner() -> None:
+    built = _build_granian_command(_env(), _options(reuse_port=True))
+
+    assert built.argv[:4] == [sys.executable, "-m", "litestar_granian._runner", "app:app"]
+    assert built.environment["LITESTAR_GRANIAN_REUSE_PORT"] == "1"
+    assert built.pass_fds == ()
+    assert not any("reuse" in argument for argument in built.argv)
+
+
+@pytest.mark.parametrize(("gc_freeze", "expected"), [(True, "1"), (False, None)])
+def test_preload_uses_compatibility_runner(gc_freeze: bool, expected: str | None) -> None:
+    built = _build_granian_command(_env(), _options(preload=True, preload_gc_freeze=gc_freeze))
+
+    assert built.argv[:4] == [sys.executable, "-m", "litestar_granian._runner", "app:app"]
+    assert built.environment["LITESTAR_GRANIAN_PRELOAD"] == "1"
+    assert built.environment.get("LITESTAR_GRANIAN_PRELOAD_GC_FREEZE") == expected
+    assert not any("preload" in argument for argument in built.argv)
+
+
+def test_gc_mode_is_applied_by_the_compatibility_runner() -> None:
+    built = _build_granian_command(_env(), _options(gc_mode=_GCMode.manual_idle))
+
+    assert built.argv[:4] == [sys.executable, "-m", "litestar_granian._runner", "app:app"]
+    assert built.environment["LITESTAR_GRANIAN_GC_MODE"] == "manual-idle"
+
+
+def test_rsgi_interface_is_served_through_the_runner_adapter() -> None:
+    built = _build_granian_command(_env(), _options(interface=_Interface.rsgi))
+
+    assert built.argv[:5] == [sys.executable, "-m", "litestar_granian._runner", "app:app", "--interface=rsgi"]
+    assert built.environment["LITESTAR_GRANIAN_RSGI"] == "1"
+
+
+def test_auto_workers_max_rss_forwards_a_starting_budget_and_lets_the_runner_reevaluate(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setattr("litestar_granian.resources._memory_limit", lambda: (2048 * 1024 * 1024, "cgroup memory.max"))
+    monkeypatch.setattr("litestar_granian.resources._resident_set_size", lambda _pid: 128 * 1024 * 1024)
+    caplog.set_level(logging.INFO, logger="litestar_granian.command")
+
+    built = _build_granian_command(_env(), _options(wc=4, workers_max_rss="auto", rss_sample_interval=10))
+
+    assert built.argv[:4] == [sys.executable, "-m", "litestar_granian._runner", "app:app"]
+    assert "--workers-max-rss=428" in built.argv
+    assert built.environment["LITESTAR_GRANIAN_MAX_RSS_AUTO"].isdigit()
+    assert "428 MiB per worker (cgroup memory.max 2048 MiB" in caplog.text
+    assert "sampled every 10s, respawning after 1 consecutive sample over budget" in caplog.text
+
+
 def test_worker_count_has_no_cpu_based_maximum() -> None:
     workers = next(parameter for parameter in run_command.params if parameter.name == "wc")
     workers_type: Any = workers.type
 
-    assert workers_type.min == 1
-    assert workers_type.max is None
+    assert workers_type.convert("1", None, None) == 1
+    assert workers_type.convert("4096", None, None) == 4096
+    with pytest.raises(BadParameter):
+        workers_type.convert("0", None, None)
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import os
+import signal
+import subprocess
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from litestar_granian.embedded import _EmbeddedChild
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="embedded children are forked")
+
+_MODULE = """
+import os
+import sys
+import time
+from pathlib import Path
+
+Path(os.environ["EMBEDDED_RESULT"]).write_text(" ".join([__name__, *sys.argv[1:]]), encoding="utf-8")
+time.sleep(float(os.environ.get("EMBEDDED_SLEEP", "0")))
+sys.exit(int(sys.argv[1]))
+"""
+
+
+@pytest.fixture
+def module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    (tmp_path / "embedded_target.py").write_text(_MODULE, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "embedded_target"
+    sys.modules.pop("embedded_target", None)
+
+
+def test_child_runs_the_module_as_main_with_its_own_environment_and_session(module: str, tmp_path: Path) -> None:
+    result = tmp_path / "result.txt"
+
+    child = _EmbeddedChild([sys.executable, "-m", module, "3", "--flag"], {"EMBEDDED_RESULT": str(result)})
+
+    assert os.getsid(child.pid) == child.pid
+    assert child.wait() == 3
+    assert child.poll() == 3
+    assert result.read_text(encoding="utf-8") == "__main__ 3 --flag"
+
+
+def test_wait_times_out_like_popen_and_reports_signal_exits(module: str, tmp_path: Path) -> None:
+    environment = {"EMBEDDED_RESULT": str(tmp_path / "result.txt"), "EMBEDDED_SLEEP": "30"}
+    child = _EmbeddedChild([sys.executable, "-m", module, "0"], environment)
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        child.wait(timeout=0.1)
+    os.killpg(child.pid, signal.SIGKILL)
+
+    assert child.wait(timeout=5) == -signal.SIGKILL
+
+
+def test_only_module_commands_can_be_embedded() -> None:
+    with pytest.raises(ValueError, match="python -m MODULE"):
+        _EmbeddedChild(["granian", "app:app"], {})
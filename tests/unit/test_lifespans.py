@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import signal
+import sys
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from litestar_granian.lifespans import (
+    _ConcurrentServerLifespans,
+    _create_lifespan_barrier,
+    _load_with_lifespan_barrier,
+    _wait_for_lifespans,
+)
+
+
+class _SlowLifespan:
+    def __init__(self, events: list[str], *, delay: float = 0.0, fail: bool = False) -> None:
+        self.events = events
+        self.delay = delay
+        self.fail = fail
+
+    @contextmanager
+    def server_lifespan(self, app: object) -> Generator[None, None, None]:
+        name = type(self).__name__
+        time.sleep(self.delay)
+        if self.fail:
+            message = f"{name} failed"
+            raise RuntimeError(message)
+        self.events.append(f"{name} entered")
+        try:
+            yield
+        finally:
+            self.events.append(f"{name} exited")
+
+
+class Database(_SlowLifespan): ...
+
+
+class Cache(_SlowLifespan): ...
+
+
+class Search(_SlowLifespan): ...
+
+
+def _app(*plugins: _SlowLifespan) -> Any:
+    return SimpleNamespace(_server_lifespan_managers=[plugin.server_lifespan for plugin in plugins])
+
+
+@pytest.mark.anyio
+async def test_worker_startup_waits_until_the_barrier_is_removed() -> None:
+    barrier = _create_lifespan_barrier()
+    try:
+        waiting = asyncio.ensure_future(_wait_for_lifespans(barrier))
+        await asyncio.sleep(0.1)
+        assert not waiting.done()
+
+        barrier.unlink()
+
+        await asyncio.wait_for(waiting, timeout=1)
+    finally:
+        barrier.unlink(missing_ok=True)
+
+
+def test_litestar_targets_wait_after_their_own_startup_hooks(tmp_path: Path) -> None:
+    user_hook = MagicMock()
+    app: Any = SimpleNamespace(on_startup=[user_hook])
+
+    assert _load_with_lifespan_barrier("app:app", loader=MagicMock(return_value=app), path=tmp_path / "b") is app
+    assert app.on_startup[0] is user_hook
+    [barrier_hook] = app.on_startup[1:]
+    assert barrier_hook.func is _wait_for_lifespans
+    assert barrier_hook.args == (tmp_path / "b",)
+
+
+def test_independent_lifespans_start_in_the_time_of_the_slowest() -> None:
+    events: list[str] = []
+    lifespans = _ConcurrentServerLifespans(
+        _app(Database(events, delay=0.3), Cache(events, delay=0.3), Search(events, delay=0.3))
+    )
+
+    started = time.monotonic()
+    lifespans.start()
+    elapsed = time.monotonic() - started
+    lifespans.stop()
+
+    assert elapsed < 0.6
+    assert sorted(events) == sorted(
+        f"{name} {event}" for name in ("Database", "Cache", "Search") for event in ("entered", "exited")
+    )
+    assert lifespans.startup_summary().startswith("Server lifespans started concurrently: Database 0.3")
+    assert "Search" in lifespans.shutdown_summary()
+    assert not any(thread.name.startswith("litestar-granian-lifespan-") for thread in threading.enumerate())
+
+
+def test_declared_dependencies_start_first_and_stop_last() -> None:
+    events: list[str] = []
+    app = _app(Cache(events), Database(events, delay=0.1))
+
+    lifespans = _ConcurrentServerLifespans(app, dependencies={Cache: [Database]})
+    lifespans.start()
+    lifespans.stop()
+
+    assert events == ["Database entered", "Cache entered", "Cache exited", "Database exited"]
+
+
+def test_failed_startup_exits_the_lifespans_that_started() -> None:
+    events: list[str] = []
+    app = _app(Database(events), Cache(events, delay=0.1, fail=True), Search(events))
+    lifespans = _ConcurrentServerLifespans(app, dependencies={Search: [Cache]})
+
+    with pytest.raises(RuntimeError, match="Cache failed"):
+        lifespans.start()
+
+    assert sorted(events) == ["Database entered", "Database exited"]
+
+
+def test_failed_dependency_is_reported_when_its_dependent_is_listed_first() -> None:
+    events: list[str] = []
+    app = _app(Cache(events), Database(events, fail=True), Search(events))
+    lifespans = _ConcurrentServerLifespans(app, dependencies={Cache: [Database]})
+
+    with pytest.raises(RuntimeError, match="Database failed"):
+        lifespans.start()
+
+    assert events == ["Search entered", "Search exited"]
+
+
+def test_lifespan_that_neither_starts_nor_fails_is_reported() -> None:
+    lifespans = _ConcurrentServerLifespans(_app(Database([])))
+    lifespans.lifespans[0]._serve = lambda: None  # type: ignore[method-assign]
+
+    with pytest.raises(RuntimeError, match="server lifespan Database did not start"):
+        lifespans.start()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="delivers SIGINT to the main thread")
+def test_interrupted_startup_exits_the_lifespans_that_already_entered() -> None:
+    events: list[str] = []
+    lifespans = _ConcurrentServerLifespans(_app(Database(events), Cache(events, delay=0.5)))
+    interrupt = threading.Timer(0.2, signal.pthread_kill, (threading.main_thread().ident, signal.SIGINT))
+
+    interrupt.start()
+    try:
+        with pytest.raises(KeyboardInterrupt):
+            lifespans.start()
+    finally:
+        interrupt.cancel()
+
+    assert sorted(events) == ["Cache entered", "Cache exited", "Database entered", "Database exited"]
+    assert not any(thread.name.startswith("litestar-granian-lifespan-") for thread in threading.enumerate())
+
+
+def test_dependency_cycles_are_rejected() -> None:
+    app = _app(Database([]), Cache([]))
+
+    with pytest.raises(ValueError, match="cycle between Database, Cache"):
+        _ConcurrentServerLifespans(app, dependencies={Database: [Cache], Cache: [Database]})
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import gc
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from litestar_granian import memory
+from litestar_granian.memory import _malloc_trim, _MemoryRelease, _release_parent_memory, _resident_set_size
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="reads /proc/self/statm")
+def test_resident_set_size_is_read_from_proc() -> None:
+    rss = _resident_set_size()
+
+    assert rss is not None
+    assert rss > 0
+
+
+def test_release_collects_freezes_and_reports_both_sizes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(memory, "_resident_set_size", MagicMock(side_effect=[96 * 1024 * 1024, 64 * 1024 * 1024]))
+    monkeypatch.setattr(memory, "_malloc_trim", MagicMock(return_value=True))
+    try:
+        release = _release_parent_memory(freeze=True)
+        frozen = gc.get_freeze_count()
+    finally:
+        gc.unfreeze()
+
+    assert release == _MemoryRelease(before=96 * 1024 * 1024, after=64 * 1024 * 1024, trimmed=True, frozen=frozen)
+    assert (
+        release.summary() == f"Litestar parent RSS 96.0 MiB -> 64.0 MiB (collected, trimmed, {frozen:,} objects frozen)"
+    )
+
+
+def test_summary_without_rss_still_reports_the_release() -> None:
+    release = _MemoryRelease(before=None, after=None, trimmed=False, frozen=0)
+
+    assert release.summary() == "Litestar parent memory released (collected)"
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="malloc_trim is a glibc extension")
+def test_malloc_trim_is_skipped_without_glibc(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(memory.os, "confstr", MagicMock(side_effect=ValueError("unrecognized configuration name")))
+
+    assert _malloc_trim() is False
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import sys
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from litestar_granian.notify import _ReadinessAnnouncer
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="sd_notify uses AF_UNIX datagram sockets")
+
+
+@pytest.fixture
+def manager_socket() -> Iterator[tuple[socket.socket, str]]:
+    # Unix socket paths are limited to about 100 bytes, which pytest's tmp_path can exceed.
+    with tempfile.TemporaryDirectory(prefix="lg-") as directory:
+        path = str(Path(directory) / "notify.sock")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as receiver:
+            receiver.bind(path)
+            receiver.settimeout(5)
+            yield receiver, path
+
+
+def _fields(receiver: socket.socket) -> dict[str, str]:
+    return dict(line.split("=", 1) for line in receiver.recv(4096).decode().splitlines())
+
+
+def test_ready_and_stopping_follow_the_sd_notify_protocol(manager_socket: tuple[socket.socket, str]) -> None:
+    receiver, path = manager_socket
+    announcer = _ReadinessAnnouncer(notify_socket=path, ready_file=None)
+    try:
+        announcer.ready(generation=2, workers=4)
+        announcer.status("Rolling restart to generation 3")
+        announcer.stopping()
+    finally:
+        announcer.close()
+
+    assert _fields(receiver) == {
+        "READY": "1",
+        "MAINPID": str(os.getpid()),
+        "STATUS": "Serving with 4 workers (generation 2)",
+    }
+    assert _fields(receiver) == {"STATUS": "Rolling restart to generation 3"}
+    assert _fields(receiver) == {"STOPPING": "1", "STATUS": "Stopping"}
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="abstract socket namespaces are Linux-only")
+def test_abstract_notify_sockets_are_supported() -> None:
+    name = f"litestar-granian-test-{os.getpid()}"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as receiver:
+        receiver.bind(f"\0{name}")
+        receiver.settimeout(5)
+        announcer = _ReadinessAnnouncer(notify_socket=f"@{name}", ready_file=None)
+        try:
+            announcer.status("Starting")
+        finally:
+            announcer.close()
+
+        assert receiver.recv(4096) == b"STATUS=Starting"
+
+
+def test_ready_file_is_replaced_atomically_and_withdrawn(tmp_path: Path) -> None:
+    ready_file = tmp_path / "ready"
+    ready_file.write_text("stale")
+    announcer = _ReadinessAnnouncer(notify_socket=None, ready_file=ready_file)
+
+    assert not ready_file.exists()
+
+    announcer.ready(generation=1, workers=1)
+    assert ready_file.read_text() == f"READY=1\nMAINPID={os.getpid()}\nGENERATION=1\n"
+    assert not list(tmp_path.glob(".ready.*"))
+
+    announcer.withdraw("Granian child exited with status 137")
+    assert not ready_file.exists()
+
+    announcer.ready(generation=2, workers=1)
+    announcer.close()
+    assert not ready_file.exists()
+
+
+def test_ready_file_write_failure_is_logged_instead_of_raised(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    directory = tmp_path / "run"
+    directory.mkdir()
+    announcer = _ReadinessAnnouncer(notify_socket=None, ready_file=directory / "ready")
+    directory.rmdir()
+
+    with caplog.at_level(logging.WARNING, logger="litestar_granian.notify"):
+        announcer.ready(generation=1, workers=1)
+    announcer.close()
+
+    assert "Could not write the ready file" in caplog.text
+
+
+def test_unreachable_manager_does_not_break_the_supervisor(tmp_path: Path) -> None:
+    announcer = _ReadinessAnnouncer(notify_socket=str(tmp_path / "missing.sock"), ready_file=None)
+    try:
+        announcer.ready(generation=1, workers=1)
+    finally:
+        announcer.close()
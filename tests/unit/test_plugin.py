@@ -5,7 +5,7 @@ from typing import Literal
 from unittest.mock import MagicMock
 
 import pytest
-from click import Group
+from click import Context, Group
 from litestar.config.app import AppConfig
 from litestar.logging import LoggingConfig
 from litestar.plugins import CLIPluginProtocol, InitPlugin
@@ -21,12 +21,16 @@ def test_plugin_uses_current_litestar_base_classes() -> None:
     assert isinstance(plugin, CLIPluginProtocol)
 
 
-def test_on_cli_init_registers_run_command_on_supplied_group() -> None:
+def test_on_cli_init_registers_run_command_lazily_on_supplied_group() -> None:
     cli_group = Group()
 
     GranianPlugin().on_cli_init(cli_group)
+    registered = cli_group.commands["run"]
 
-    assert cli_group.commands["run"] is run_command
+    assert registered.get_short_help_str() == run_command.help
+    registered.get_params(Context(registered))
+    assert registered.params == run_command.params
+    assert registered.callback is not None
 
 
 @pytest.mark.parametrize(
@@ -47,6 +51,16 @@ def test_plugin_rejects_invalid_static_configuration() -> None:
         GranianPlugin(static="invalid")  # type: ignore[arg-type]
 
 
+def test_plugin_normalizes_lifespan_dependencies_and_rejects_non_types() -> None:
+    class Database: ...
+
+    class Cache: ...
+
+    assert GranianPlugin(lifespan_dependencies={Cache: [Database]}).lifespan_dependencies == {Cache: (Database,)}
+    with pytest.raises(ValueError):
+        GranianPlugin(lifespan_dependencies={Cache: ["Database"]})  # type: ignore[list-item]
+
+
 def test_on_app_init_does_not_mutate_or_eagerly_configure_logging() -> None:
     logging_config = LoggingConfig(loggers={})
     before = deepcopy(logging_config)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import socket
+import sys
+from contextlib import closing
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import ANY, MagicMock
+
+import pytest
+
+from litestar_granian import readiness
+from litestar_granian.readiness import (
+    _GENERATION_ENV,
+    _READY_SOCKET_ENV,
+    _load_reporting_target,
+    _parse_report,
+    _ReadinessChannel,
+    _ReadyReport,
+    _report_ready,
+)
+from litestar_granian.startup import _RUNNER_STARTED_ENV
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="readiness datagrams use AF_UNIX sockets")
+
+
+def _send(path: Path, payload: str) -> None:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sender:
+        sender.sendto(payload.encode(), str(path))
+
+
+def test_report_parser_ignores_malformed_lines() -> None:
+    assert _parse_report(b"READY=1\nnoise\nGENERATION= 2 \n") == {"READY": "1", "GENERATION": "2"}
+
+
+def test_channel_waits_for_every_worker_of_one_generation() -> None:
+    with closing(_ReadinessChannel(workers=2)) as channel:
+        _send(channel.path, "READY=1\nGENERATION=1\nWORKER=a")
+        _send(channel.path, "READY=1\nGENERATION=2\nWORKER=a")
+        _send(channel.path, "READY=1\nGENERATION=2\nWORKER=a")
+
+        assert not channel.wait(2, timeout=0.05, alive=lambda: True)
+
+        _send(channel.path, "READY=1\nGENERATION=2\nWORKER=b")
+
+        assert channel.wait(2, timeout=1, alive=lambda: True)
+        assert not channel.is_ready(1)
+    assert not channel.path.parent.exists()
+
+
+def test_channel_stops_waiting_when_the_child_can_no_longer_report() -> None:
+    alive = MagicMock(return_value=False)
+
+    with closing(_ReadinessChannel(workers=1)) as channel:
+        assert not channel.wait(1, timeout=30, alive=alive)
+
+    alive.assert_called_once_with()
+
+
+def test_channel_environment_routes_each_generation() -> None:
+    with closing(_ReadinessChannel(workers=1)) as channel:
+        assert channel.environment(3) == {_READY_SOCKET_ENV: str(channel.path), _GENERATION_ENV: "3"}
+
+
+def test_worker_report_reaches_the_parent_channel(monkeypatch: pytest.MonkeyPatch) -> None:
+    with closing(_ReadinessChannel(workers=1)) as channel:
+        for name, value in channel.environment(4).items():
+            monkeypatch.setenv(name, value)
+
+        _report_ready()
+
+        assert channel.wait(4, timeout=1, alive=lambda: True)
+
+
+def test_worker_report_carries_startup_marks(monkeypatch: pytest.MonkeyPatch) -> None:
+    with closing(_ReadinessChannel(workers=1)) as channel:
+        for name, value in channel.environment(1).items():
+            monkeypatch.setenv(name, value)
+        monkeypatch.setenv(_RUNNER_STARTED_ENV, "10.5")
+
+        _ReadyReport(load_started=11.0, load_finished=12.25)()
+
+        assert channel.wait(1, timeout=1, alive=lambda: True)
+        [report] = channel.reports(1)
+    assert (report["RUNNER_STARTED"], report["LOAD_STARTED"], report["LOAD_FINISHED"]) == ("10.5", "11.0", "12.25")
+    assert float(report["READY_AT"]) > 0
+
+
+def test_worker_report_without_a_parent_channel_is_a_no_op(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(_READY_SOCKET_ENV, raising=False)
+    sender = MagicMock()
+    monkeypatch.setattr(readiness.socket, "socket", sender)
+
+    _report_ready()
+
+    sender.assert_not_called()
+
+
+def test_litestar_targets_report_after_their_startup_hooks() -> None:
+    user_hook = MagicMock()
+    app: Any = SimpleNamespace(on_startup=[user_hook])
+    assert _load_reporting_target("app:app", loader=MagicMock(return_value=app)) is app
+    assert app.on_startup[0] is user_hook
+    [report] = app.on_startup[1:]
+    assert isinstance(report, _ReadyReport)
+    assert report.load_started <= report.load_finished
+
+
+def test_plain_asgi_targets_report_once_loaded(monkeypatch: pytest.MonkeyPatch) -> None:
+    report = MagicMock()
+
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        return None
+
+    monkeypatch.setattr(readiness, "_report_ready", report)
+
+    assert _load_reporting_target("app:app", loader=MagicMock(return_value=app)) is app
+    report.assert_called_once_with(load_started=ANY, load_finished=ANY)
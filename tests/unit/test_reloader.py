@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path, PurePath
+
+import pytest
+from watchfiles import Change
+
+from litestar_granian.reloader import (
+    _coalesce_changes,
+    _CompiledGlobs,
+    _ParentReloader,
+    _reload_filter,
+    _ReloadPatternFilter,
+)
+
+_GLOBS = (
+    "*.py",
+    "ignored/*",
+    "/app/*.py",
+    "/app/pkg/*",
+    "a/*/c.py",
+    "[!m]*.py",
+    "[]x]*",
+    "[z-a]*",
+    "file?.html",
+    ".*",
+    "~*",
+    "deep/er/than/the/path/x.py",
+)
+_PATHS = (
+    "/app/module.py",
+    "/app/pkg/module.py",
+    "/app/ignored/module.py",
+    "/app/a/b/c.py",
+    "/app/a/b/d/c.py",
+    "/app/x.py",
+    "/app/]x",
+    "/app/file1.html",
+    "/app/file12.html",
+    "/app/.hidden",
+    "/app/~backup",
+    "/ignored/module.py",
+)
+
+
+def test_reload_filter_matches_litestar_uvicorn_include_and_exclude_globs() -> None:
+    reload_filter = _ReloadPatternFilter(
+        includes=("*.html",),
+        excludes=("*.tmp", "ignored/*"),
+    )
+
+    assert reload_filter(Change.modified, str(Path("/app/module.py")))
+    assert reload_filter(Change.modified, str(Path("/app/template.html")))
+    assert not reload_filter(Change.modified, str(Path("/app/notes.txt")))
+    assert not reload_filter(Change.modified, str(Path("/app/module.tmp")))
+    assert not reload_filter(Change.modified, str(Path("/app/ignored/module.py")))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="compares POSIX path semantics")
+@pytest.mark.parametrize("glob", _GLOBS)
+def test_compiled_globs_agree_with_path_match(glob: str) -> None:
+    globs = _CompiledGlobs((glob,))
+
+    for path in _PATHS:
+        assert globs.matches(path, path.rpartition("/")[2]) == PurePath(path).match(glob), path
+
+
+def test_excluded_directories_cover_the_directory_and_everything_below_it(tmp_path: Path) -> None:
+    (tmp_path / "build").mkdir()
+    reload_filter = _ReloadPatternFilter(includes=("*",), excludes=(str(tmp_path / "build"),))
+
+    for _ in range(2):
+        assert not reload_filter(Change.added, str(tmp_path / "build"))
+        assert not reload_filter(Change.modified, str(tmp_path / "build" / "nested" / "module.py"))
+        assert reload_filter(Change.modified, str(tmp_path / "builder" / "module.py"))
+
+
+def test_parent_reload_filter_extends_the_watchfiles_ignores_like_granian(tmp_path: Path) -> None:
+    reload_filter = _reload_filter(
+        includes=("*.html",),
+        excludes=(),
+        ignore_dirs=("build",),
+        ignore_patterns=(r"^scratch_",),
+        ignore_paths=(tmp_path / "generated",),
+    )
+
+    assert reload_filter(Change.modified, str(tmp_path / "module.py"))
+    assert reload_filter(Change.modified, str(tmp_path / "template.html"))
+    assert not reload_filter(Change.modified, str(tmp_path / "__pycache__" / "module.py"))
+    assert not reload_filter(Change.modified, str(tmp_path / "build" / "module.py"))
+    assert not reload_filter(Change.modified, str(tmp_path / "scratch_module.py"))
+    assert not reload_filter(Change.modified, str(tmp_path / "generated" / "module.py"))
+
+
+def test_parent_reloader_reports_each_batch_of_changes(tmp_path: Path) -> None:
+    changed = threading.Event()
+    reloader = _ParentReloader(
+        (tmp_path,),
+        watch_filter=_reload_filter(includes=(), excludes=(), ignore_dirs=(), ignore_patterns=(), ignore_paths=()),
+        tick=50,
+    )
+    reloader.start(changed.set)
+    try:
+        # The watcher needs a moment to register the directory before it sees writes.
+        for _ in range(20):
+            (tmp_path / "module.py").write_text("VALUE = 1\n", encoding="utf-8")
+            (tmp_path / "notes.txt").write_text("ignored\n", encoding="utf-8")
+            if changed.wait(0.5):
+                break
+    finally:
+        reloader.stop()
+
+    assert changed.is_set()
+
+
+def test_changes_are_coalesced_until_the_watcher_reports_a_quiet_window() -> None:
+    batches = [
+        {(Change.modified, "/app/a.py")},
+        {(Change.modified, "/app/b.py"), (Change.added, "/app/c.py")},
+        {(Change.modified, "/app/a.py")},
+        set(),
+        set(),
+        {(Change.deleted, "/app/d.py")},
+        set(),
+    ]
+
+    reloads = list(_coalesce_changes(batches, wait_for_quiet=True, min_interval=0))
+
+    assert [(sorted(path for _, path in reload.changes), reload.events, reload.batches) for reload in reloads] == [
+        (["/app/a.py", "/app/b.py", "/app/c.py"], 4, 3),
+        (["/app/d.py"], 1, 1),
+    ]
+
+
+def test_reloads_closer_than_the_minimum_interval_are_merged(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = iter([10.0, 10.5, 11.0, 12.5])
+    monkeypatch.setattr("litestar_granian.reloader.time.monotonic", lambda: next(clock))
+    batches = [
+        {(Change.modified, "/app/a.py")},
+        {(Change.modified, "/app/b.py")},
+        set(),
+        {(Change.modified, "/app/c.py")},
+        set(),
+    ]
+
+    reloads = list(_coalesce_changes(batches, wait_for_quiet=False, min_interval=2))
+
+    assert [sorted(path for _, path in reload.changes) for reload in reloads] == [
+        ["/app/a.py"],
+        ["/app/b.py", "/app/c.py"],
+    ]
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from click import BadParameter
+
+from litestar_granian import resources
+from litestar_granian.cli import _CountOrAutoType
+from litestar_granian.resources import (
+    _auto_workers,
+    _cgroup_cpu_quota,
+    _CPUBudget,
+    _memory_limit,
+    _MemoryBudget,
+    _process_group_memory,
+)
+
+_MIB = 1024 * 1024
+
+
+def _cgroup_tree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, files: dict[str, str]) -> None:
+    root = tmp_path / "cgroup"
+    for relative, value in files.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(value, encoding="ascii")
+    (tmp_path / "self-cgroup").write_text("0::/kubepods/pod/container\n", encoding="utf-8")
+    monkeypatch.setattr(resources, "_CGROUP_ROOT", root)
+    monkeypatch.setattr(resources, "_PROC_CGROUP", tmp_path / "self-cgroup")
+
+
+def test_tightest_quota_on_the_cgroup_path_applies(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _cgroup_tree(
+        tmp_path,
+        monkeypatch,
+        {
+            "kubepods/cpu.max": "400000 100000\n",
+            "kubepods/pod/cpu.max": "150000 100000\n",
+            "kubepods/pod/container/cpu.max": "max 100000\n",
+        },
+    )
+
+    assert _cgroup_cpu_quota() == pytest.approx(1.5)
+
+
+def test_missing_cgroup_v2_means_no_quota(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(resources, "_PROC_CGROUP", tmp_path / "missing")
+
+    assert _cgroup_cpu_quota() is None
+
+
+@pytest.mark.parametrize(
+    ("budget", "runtime_threads", "expected"),
+    [
+        (_CPUBudget(64, 64, 2.0), 1, 2),
+        (_CPUBudget(64, 4, None), 1, 4),
+        (_CPUBudget(64, None, 0.5), 1, 1),
+        (_CPUBudget(8, 8, 6.5), 2, 3),
+        (_CPUBudget(2, 2, None), 4, 1),
+    ],
+)
+def test_auto_workers_share_the_smallest_cpu_limit_among_runtime_threads(
+    monkeypatch: pytest.MonkeyPatch, budget: _CPUBudget, runtime_threads: int, expected: int
+) -> None:
+    monkeypatch.setattr(resources, "_cpu_budget", lambda: budget)
+
+    decision = _auto_workers(runtime_threads=runtime_threads)
+
+    assert decision.count == expected
+    assert decision.summary().startswith(
+        f"Granian workers: {expected} (auto: {budget.cpus} of {budget.logical} logical"
+    )
+
+
+def test_tightest_memory_limit_on_the_cgroup_path_applies(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _cgroup_tree(
+        tmp_path,
+        monkeypatch,
+        {
+            "kubepods/memory.max": f"{4096 * _MIB}\n",
+            "kubepods/pod/container/memory.max": "max\n",
+            "kubepods/pod/container/memory.high": f"{1536 * _MIB}\n",
+        },
+    )
+
+    assert _memory_limit() == (1536 * _MIB, "cgroup memory.high")
+
+
+def test_memory_limit_falls_back_to_physical_memory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _cgroup_tree(tmp_path, monkeypatch, {"kubepods/pod/container/memory.max": "max\n"})
+
+    limit, source = _memory_limit()
+
+    assert source == "physical memory"
+    assert limit > 0
+
+
+@pytest.mark.parametrize(
+    ("baseline", "workers", "expected"),
+    [
+        (200 * _MIB, 4, 400 * _MIB),
+        (800 * _MIB, 4, 250 * _MIB),
+        (1900 * _MIB, 4, 64 * _MIB),
+    ],
+)
+def test_memory_budget_splits_what_the_baseline_leaves_with_headroom(
+    baseline: int, workers: int, expected: int
+) -> None:
+    budget = _MemoryBudget(2000 * _MIB, "cgroup memory.max", baseline, workers)
+
+    assert budget.per_worker == expected
+    assert budget.summary().startswith(f"{expected // _MIB} MiB per worker (cgroup memory.max 2000 MiB, 10% headroom")
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="reads /proc")
+def test_process_group_memory_covers_this_process() -> None:
+    used = _process_group_memory(os.getpgrp())
+
+    assert used is not None
+    assert used > 0
+    assert _process_group_memory(2**22 + 1) is None
+
+
+def test_count_or_auto_option_accepts_positive_integers_and_auto() -> None:
+    count = _CountOrAutoType()
+
+    assert count.convert("4", None, None) == 4
+    assert count.convert("Auto", None, None) == "auto"
+    with pytest.raises(BadParameter):
+        count.convert("0", None, None)
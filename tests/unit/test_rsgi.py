@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from litestar import Litestar, Request, post
+
+from litestar_granian.rsgi import _RSGIApp
+
+
+class _HTTPProtocol:
+    def __init__(self, *chunks: bytes) -> None:
+        self.chunks = chunks
+        self.responses: list[tuple[Any, ...]] = []
+        self.streamed: list[bytes] = []
+        self.disconnected = asyncio.Event()
+
+    async def __call__(self) -> bytes:
+        return b"".join(self.chunks)
+
+    def __aiter__(self) -> Any:
+        async def chunks() -> Any:
+            for chunk in self.chunks:
+                yield chunk
+
+        return chunks()
+
+    async def client_disconnect(self) -> None:
+        await self.disconnected.wait()
+
+    def response_bytes(self, status: int, headers: list[tuple[str, str]], body: bytes) -> None:
+        self.responses.append(("bytes", status, headers, body))
+
+    def response_file(self, status: int, headers: list[tuple[str, str]], file: str) -> None:
+        self.responses.append(("file", status, headers, file))
+
+    def response_stream(self, status: int, headers: list[tuple[str, str]]) -> Any:
+        self.responses.append(("stream", status, headers))
+
+        async def send_bytes(data: bytes) -> None:
+            self.streamed.append(data)
+
+        return SimpleNamespace(send_bytes=send_bytes)
+
+
+class _WebSocketProtocol:
+    def __init__(self, *messages: tuple[int, Any]) -> None:
+        self.inbound = [SimpleNamespace(kind=kind, data=data) for kind, data in messages]
+        self.sent: list[Any] = []
+        self.closed: list[int | None] = []
+
+    async def accept(self) -> Any:
+        async def receive() -> Any:
+            return self.inbound.pop(0)
+
+        async def send(data: Any) -> None:
+            self.sent.append(data)
+
+        return SimpleNamespace(receive=receive, send_str=send, send_bytes=send)
+
+    def close(self, status: int | None) -> tuple[int, bool]:
+        self.closed.append(status)
+        return status or 0, True
+
+
+def _scope(proto: str = "http", method: str = "GET", path: str = "/", **headers: str) -> Any:
+    return SimpleNamespace(
+        proto=proto,
+        http_version="1.1",
+        method=method,
+        scheme="http",
+        path=path,
+        query_string="page=2",
+        headers={"host": "testserver", **headers},
+        server="127.0.0.1:8000",
+        client="[::1]:51000",
+    )
+
+
+def test_litestar_requests_run_inside_the_worker_lifespan() -> None:
+    @post("/items")
+    async def create(request: Request, data: dict[str, int]) -> dict[str, Any]:
+        return {
+            **data,
+            "greeting": request.app.state.greeting,
+            "client": list(request.client or ()),
+            "page": request.query_params["page"],
+        }
+
+    def startup(app: Litestar) -> None:
+        app.state.greeting = "hello"
+
+    events: list[str] = []
+    app = Litestar(
+        route_handlers=[create],
+        on_startup=[startup],
+        on_shutdown=[lambda: events.append("shutdown")],
+    )
+    adapter = _RSGIApp(app)
+    protocol = _HTTPProtocol(b'{"id": 1}')
+    loop = asyncio.new_event_loop()
+    try:
+        adapter.__rsgi_init__(loop)
+        loop.run_until_complete(
+            adapter.__rsgi__(_scope(method="POST", path="/items", **{"content-length": "9"}), protocol)
+        )
+        adapter.__rsgi_del__(loop)
+    finally:
+        loop.close()
+
+    [(kind, status, headers, body)] = protocol.responses
+    assert (kind, status) == ("bytes", 201)
+    assert ("content-type", "application/json") in headers
+    assert body == b'{"id":1,"greeting":"hello","client":["::1",51000],"page":"2"}'
+    assert events == ["shutdown"]
+
+
+def test_failed_lifespan_startup_stops_the_worker() -> None:
+    def startup() -> None:
+        raise RuntimeError("database unavailable")
+
+    adapter = _RSGIApp(Litestar(on_startup=[startup]))
+    loop = asyncio.new_event_loop()
+    try:
+        with pytest.raises(SystemExit) as exc_info:
+            adapter.__rsgi_init__(loop)
+    finally:
+        loop.close()
+
+    assert exc_info.value.code == 1
+
+
+@pytest.mark.anyio
+async def test_unsized_bodies_and_chunked_responses_are_streamed() -> None:
+    received: list[tuple[bytes, bool]] = []
+
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        while True:
+            message = await receive()
+            received.append((message["body"], message["more_body"]))
+            if not message["more_body"]:
+                break
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"x-chunks", b"2")]})
+        await send({"type": "http.response.body", "body": b"first", "more_body": True})
+        await send({"type": "http.response.body", "body": b"second", "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    protocol = _HTTPProtocol(b"a" * 10, b"b" * 10)
+
+    await _RSGIApp(app).__rsgi__(_scope(method="POST", **{"transfer-encoding": "chunked"}), protocol)
+
+    assert received == [(b"a" * 10, True), (b"b" * 10, True), (b"", False)]
+    assert protocol.responses == [("stream", 200, [("x-chunks", "2")])]
+    assert protocol.streamed == [b"first", b"second"]
+
+
+@pytest.mark.anyio
+async def test_pathsend_responses_are_sent_by_granian(tmp_path: Path) -> None:
+    asset = tmp_path / "asset.txt"
+    asset.write_text("static")
+
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        assert "http.response.pathsend" in scope["extensions"]
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.pathsend", "path": str(asset)})
+
+    protocol = _HTTPProtocol()
+
+    await _RSGIApp(app).__rsgi__(_scope(), protocol)
+
+    assert protocol.responses == [("file", 200, [], str(asset))]
+
+
+@pytest.mark.anyio
+async def test_websocket_messages_are_translated_both_ways() -> None:
+    received: list[dict[str, Any]] = []
+
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        assert (scope["type"], scope["scheme"], scope["subprotocols"]) == ("websocket", "ws", ["chat", "json"])
+        received.append(await receive())
+        await send({"type": "websocket.accept"})
+        while (message := await receive())["type"] == "websocket.receive":
+            if "text" in message:
+                await send({"type": "websocket.send", "text": message["text"].upper()})
+            else:
+                await send({"type": "websocket.send", "bytes": message["bytes"][::-1]})
+        received.append(message)
+
+    protocol = _WebSocketProtocol((2, "hello"), (1, b"abc"), (0, None))
+
+    await _RSGIApp(app).__rsgi__(_scope("ws", **{"sec-websocket-protocol": "chat, json"}), protocol)
+
+    assert received == [{"type": "websocket.connect"}, {"type": "websocket.disconnect", "code": 1005}]
+    assert protocol.sent == ["HELLO", b"cba"]
+    assert protocol.closed == []
+
+
+@pytest.mark.anyio
+async def test_websocket_is_closed_once_with_the_application_code() -> None:
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        await receive()
+        await send({"type": "websocket.close", "code": 4003})
+
+    protocol = _WebSocketProtocol()
+
+    await _RSGIApp(app).__rsgi__(_scope("ws"), protocol)
+
+    assert protocol.closed == [4003]
@@ -1,26 +1,23 @@
 from __future__ import annotations
 
+import sys
+from dataclasses import dataclass
 from importlib.metadata import version
 from pathlib import Path
 from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
-from watchfiles import Change
 
-from litestar_granian._runner import _probe_granian_compatibility, _ReloadPatternFilter
-
-
-def test_reload_filter_matches_litestar_uvicorn_include_and_exclude_globs() -> None:
-    reload_filter = _ReloadPatternFilter(
-        includes=("*.html",),
-        excludes=("*.tmp", "ignored/*"),
-    )
-
-    assert reload_filter(Change.modified, str(Path("/app/module.py")))
-    assert reload_filter(Change.modified, str(Path("/app/template.html")))
-    assert not reload_filter(Change.modified, str(Path("/app/notes.txt")))
-    assert not reload_filter(Change.modified, str(Path("/app/module.tmp")))
-    assert not reload_filter(Change.modified, str(Path("/app/ignored/module.py")))
+from litestar_granian._runner import (
+    _ChainedWorkerSignal,
+    _configure_server,
+    _MultiListenerWorkerFactory,
+    _preload_target,
+    _probe_granian_compatibility,
+    _reevaluate_rss_budget,
+    _serve_extra_listeners,
+)
 
 
 def test_probe_passes_against_the_installed_granian_release() -> None:
@@ -42,6 +39,7 @@ def test_probe_fails_when_entrypoint_is_missing() -> None:
     assert version("granian") in message
     assert "granian==2.7.*" in message
     assert "--fd/--reload-include/--reload-exclude" in message
+    assert "--no-parent-socket" in message
 
 
 def test_probe_fails_when_server_no_longer_exposes_init_shared_socket() -> None:
@@ -76,3 +74,134 @@ def test_probe_fails_when_socket_holder_is_missing(monkeypatch: pytest.MonkeyPat
         _probe_granian_compatibility(granian.cli)
 
     assert "granian._granian.SocketHolder is missing" in str(exc_info.value)
+
+
+def test_probe_fails_when_extra_listeners_cannot_be_patched(monkeypatch: pytest.MonkeyPatch) -> None:
+    import granian.cli
+
+    monkeypatch.delattr("granian.server.mt.ASGIWorker")
+    monkeypatch.delattr("granian._signals.WorkerSignal")
+    _probe_granian_compatibility(granian.cli)
+
+    monkeypatch.setenv("LITESTAR_GRANIAN_EXTRA_FILE_DESCRIPTORS", "[5]")
+    with pytest.raises(SystemExit) as exc_info:
+        _probe_granian_compatibility(granian.cli)
+
+    message = str(exc_info.value)
+    assert "granian.server.mt.ASGIWorker is missing (required by --bind and additional --fd listeners)" in message
+    assert "granian._signals.WorkerSignal is missing" in message
+
+
+def test_extra_listeners_fail_when_no_worker_class_can_be_patched(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in ("granian.server.mp", "granian.server.mt"):
+        monkeypatch.setitem(sys.modules, name, SimpleNamespace())
+
+    with pytest.raises(RuntimeError, match="No Granian worker class could be patched"):
+        _serve_extra_listeners(((5, False),), 16)
+
+
+def test_inherited_unix_socket_path_outlives_the_child(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    socket_path = tmp_path / "app.sock"
+    socket_path.touch()
+
+    @dataclass
+    class StubServer:
+        bind_uds: Path | None = socket_path
+
+        def _unlink_pidfile(self) -> None:
+            if self.bind_uds is not None:
+                self.bind_uds.unlink()
+
+    stub = SimpleNamespace(Server=StubServer)
+    monkeypatch.setenv("LITESTAR_GRANIAN_FILE_DESCRIPTOR", "7")
+    _configure_server(stub)
+
+    server = stub.Server()
+    server._unlink_pidfile()
+
+    assert socket_path.exists()
+    assert server.bind_uds == socket_path
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="SO_REUSEPORT load balancing is Linux-only")
+def test_reuse_port_hands_each_worker_a_listener_spec(monkeypatch: pytest.MonkeyPatch) -> None:
+    from granian.net import SocketSpec
+
+    @dataclass
+    class StubServer:
+        bind_addr: str = "127.0.0.1"
+        bind_port: int = 0
+        backlog: int = 16
+
+        def _init_shared_socket(self) -> None:
+            raise AssertionError
+
+    stub = SimpleNamespace(Server=StubServer)
+    monkeypatch.setenv("LITESTAR_GRANIAN_REUSE_PORT", "1")
+    _configure_server(stub)
+
+    server = stub.Server()
+    server._init_shared_socket()
+
+    assert isinstance(server._ssp, SocketSpec)
+    assert server._sso is None
+
+
+def test_extra_listeners_are_served_by_the_same_worker_with_their_own_shutdown_signal() -> None:
+    served: list[tuple[str, object, object]] = []
+
+    class StubWorker:
+        def __init__(self, worker_id: int, sock: tuple[object, object], *args: object) -> None:
+            self.sock = sock
+
+        def __getattr__(self, name: str) -> object:
+            return lambda *args: served.append((name, self.sock[1], args[-1]))
+
+    factory = _MultiListenerWorkerFactory(StubWorker, [("tcp-holder", False), ("uds-holder", True)])
+    worker = factory(1, (None, "primary-holder"), "ipc")
+    shutdown_event = _ChainedWorkerSignal()
+
+    worker.serve_mtr_uds("scheduler", "loop", shutdown_event)
+
+    assert [(name, holder) for name, holder, _ in served] == [
+        ("serve_mtr", "tcp-holder"),
+        ("serve_mtr_uds", "uds-holder"),
+        ("serve_mtr_uds", "primary-holder"),
+    ]
+    assert [signal for _, _, signal in served] == [*shutdown_event.followers, shutdown_event.signal]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="preloading forks workers and is POSIX-only")
+def test_preloaded_target_is_frozen_and_shared_by_forked_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    import gc
+    import multiprocessing
+
+    app = object()
+    loader = MagicMock(return_value=app)
+    freeze = MagicMock()
+    start_method = MagicMock()
+    monkeypatch.setattr(gc, "freeze", freeze)
+    monkeypatch.setattr(multiprocessing, "get_start_method", MagicMock(return_value="spawn"))
+    monkeypatch.setattr(multiprocessing, "set_start_method", start_method)
+
+    worker_loader = _preload_target("app:app", loader=loader, env_files=None, freeze_gc=True)
+
+    assert worker_loader("app:app") is app
+    assert worker_loader("app:app") is app
+    loader.assert_called_once_with("app:app")
+    freeze.assert_called_once_with()
+    start_method.assert_called_once_with("fork", force=True)
+
+
+def test_auto_rss_budget_is_reevaluated_against_the_parent_and_main_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    sizes = {4242: 300 * 1024 * 1024, None: 100 * 1024 * 1024}
+    monkeypatch.setattr("litestar_granian.resources._memory_limit", lambda: (2000 * 1024 * 1024, "cgroup memory.max"))
+    monkeypatch.setattr("litestar_granian.resources._resident_set_size", sizes.get)
+    server = SimpleNamespace(workers=2, workers_rss=512 * 1024 * 1024)
+
+    _reevaluate_rss_budget(server)
+    assert server.workers_rss == 512 * 1024 * 1024
+
+    monkeypatch.setenv("LITESTAR_GRANIAN_MAX_RSS_AUTO", "4242")
+    _reevaluate_rss_budget(server)
+    assert server.workers_rss == 700 * 1024 * 1024
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import socket
+import stat
+import sys
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from litestar_granian import sockets
+from litestar_granian.sockets import (
+    _activated_listeners,
+    _BindAddress,
+    _parent_listener,
+    _SocketTuning,
+    _tune_inherited_listener,
+)
+
+
+@pytest.fixture
+def short_tmp_path() -> Iterator[Path]:
+    # Unix socket paths are limited to about 100 bytes, which pytest's tmp_path can exceed.
+    with tempfile.TemporaryDirectory(prefix="lg-") as directory:
+        yield Path(directory)
+
+
+def test_tcp_listener_accepts_connections_until_the_run_ends() -> None:
+    with _parent_listener(host="127.0.0.1", port=0, uds=None, uds_permissions=None, backlog=16) as listener:
+        address = listener.getsockname()
+        with socket.create_connection(address, timeout=5):
+            pass
+        assert listener.getsockopt(socket.SOL_SOCKET, socket.SO_ACCEPTCONN)
+
+    assert listener.fileno() == -1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets are POSIX-only")
+def test_unix_listener_applies_permissions_and_removes_its_path(short_tmp_path: Path) -> None:
+    path = short_tmp_path / "app.sock"
+
+    with _parent_listener(host="", port=0, uds=str(path), uds_permissions=0o660, backlog=16):
+        assert stat.S_IMODE(path.stat().st_mode) == 0o660
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(path))
+
+    assert not path.exists()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets are POSIX-only")
+def test_unix_listener_replaces_a_stale_socket_but_not_a_live_one(short_tmp_path: Path) -> None:
+    path = short_tmp_path / "app.sock"
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(path))
+    stale.close()
+
+    with _parent_listener(host="", port=0, uds=str(path), uds_permissions=None, backlog=16):
+        with pytest.raises(OSError), _parent_listener(host="", port=0, uds=str(path), uds_permissions=None, backlog=16):
+            pass
+        assert path.is_socket()
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("0.0.0.0:8000", _BindAddress(host="0.0.0.0", port=8000)),
+        ("[::]:8443", _BindAddress(host="::", port=8443)),
+        ("unix:/run/app.sock", _BindAddress(uds="/run/app.sock")),
+        ("/run/app.sock", _BindAddress(uds="/run/app.sock")),
+    ],
+)
+def test_bind_addresses_round_trip(value: str, expected: _BindAddress) -> None:
+    parsed = _BindAddress.parse(value)
+
+    assert parsed == expected
+    assert _BindAddress.parse(str(parsed)) == parsed
+
+
+@pytest.mark.parametrize("value", ["localhost", "127.0.0.1:http", "[::1]:70000", "unix:"])
+def test_malformed_bind_addresses_are_rejected(value: str) -> None:
+    with pytest.raises(ValueError, match=re.escape(repr(value))):
+        _BindAddress.parse(value)
+
+
+def _activate(monkeypatch: pytest.MonkeyPatch, listener: socket.socket, *, pid: int | None = None) -> None:
+    monkeypatch.setattr(sockets, "_LISTEN_FDS_START", listener.fileno())
+    monkeypatch.setenv("LISTEN_PID", str(os.getpid() if pid is None else pid))
+    monkeypatch.setenv("LISTEN_FDS", "1")
+    monkeypatch.setenv("LISTEN_FDNAMES", "web")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="socket activation is POSIX-only")
+def test_activated_listener_is_adopted_and_the_environment_consumed(monkeypatch: pytest.MonkeyPatch) -> None:
+    with socket.create_server(("127.0.0.1", 0)) as listener:
+        listener.set_inheritable(True)
+        _activate(monkeypatch, listener)
+
+        (activated,) = _activated_listeners()
+
+        assert activated.name == "web"
+        assert activated.socket.fileno() == listener.fileno()
+        assert activated.address == f"127.0.0.1:{listener.getsockname()[1]}"
+        assert not activated.socket.get_inheritable()
+        assert not {"LISTEN_PID", "LISTEN_FDS", "LISTEN_FDNAMES"} & set(os.environ)
+        activated.socket.detach()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="socket activation is POSIX-only")
+def test_activation_for_another_process_is_ignored(monkeypatch: pytest.MonkeyPatch) -> None:
+    with socket.create_server(("127.0.0.1", 0)) as listener:
+        _activate(monkeypatch, listener, pid=os.getpid() + 1)
+
+        assert _activated_listeners() == []
+        assert "LISTEN_FDS" not in os.environ
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="socket activation is POSIX-only")
+def test_activated_descriptor_must_be_a_listening_stream_socket(monkeypatch: pytest.MonkeyPatch) -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as datagram:
+        _activate(monkeypatch, datagram)
+
+        with pytest.raises(ValueError, match="is not a listening stream socket"):
+            _activated_listeners()
+        assert datagram.fileno() != -1
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="asserts Linux socket option names and buffer accounting")
+def test_tuning_is_applied_to_the_parent_listener_before_it_listens() -> None:
+    tuning = _SocketTuning(
+        tcp_defer_accept=5,
+        tcp_fastopen_queue=64,
+        so_rcvbuf=1 << 18,
+        tcp_nodelay=True,
+        tcp_keepalive_idle=30,
+        tcp_keepalive_count=4,
+    )
+
+    with _parent_listener(host="127.0.0.1", port=0, uds=None, uds_permissions=None, backlog=16, tuning=tuning) as s:
+        assert s.getsockopt(socket.IPPROTO_TCP, socket.TCP_DEFER_ACCEPT) > 0
+        assert s.getsockopt(socket.IPPROTO_TCP, socket.TCP_FASTOPEN) == 64
+        # Linux doubles the requested size to account for bookkeeping overhead.
+        assert s.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) >= 1 << 18
+        assert s.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        assert s.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+        assert s.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE) == 30
+        assert s.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT) == 4
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="listener tuning is POSIX-only")
+def test_unsupported_and_inapplicable_options_are_skipped_with_a_warning(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+    short_tmp_path: Path,
+) -> None:
+    monkeypatch.delattr(socket, "TCP_DEFER_ACCEPT", raising=False)
+    caplog.set_level(logging.WARNING, logger="litestar_granian.sockets")
+
+    with socket.create_server(("127.0.0.1", 0)) as listener:
+        _tune_inherited_listener(listener.fileno(), _SocketTuning(tcp_defer_accept=5, tcp_nodelay=True))
+        assert listener.fileno() != -1
+        assert listener.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+    with _parent_listener(
+        host="",
+        port=0,
+        uds=str(short_tmp_path / "app.sock"),
+        uds_permissions=None,
+        backlog=16,
+        tuning=_SocketTuning(tcp_nodelay=True),
+    ):
+        pass
+
+    assert "--tcp-defer-accept is not supported on this platform; ignoring it" in caplog.messages
+    assert "--tcp-nodelay only applies to TCP listeners; ignoring it" in caplog.messages
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import sys
+import time
+
+import pytest
+
+from litestar_granian.startup import _process_started, _StartupTimeline
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="reads /proc/self/stat")
+def test_process_start_is_read_from_proc() -> None:
+    started = _process_started()
+
+    assert started is not None
+    assert started < time.monotonic()
+
+
+def test_worker_reports_extend_the_parent_timeline() -> None:
+    timeline = _StartupTimeline()
+    timeline.add("server lifespans", 1.0, 1.5)
+    timeline.add("Granian child spawn", 1.5, 1.6)
+
+    timeline.add_worker_reports([
+        {"PID": "12", "RUNNER_STARTED": "2.0", "LOAD_STARTED": "2.5", "LOAD_FINISHED": "4.5", "READY_AT": "4.75"},
+        {"PID": "11", "RUNNER_STARTED": "2.0", "LOAD_STARTED": "2.4", "LOAD_FINISHED": "3.4", "READY_AT": "3.5"},
+        {"PID": "13", "READY_AT": "not a time"},
+    ])
+
+    assert [(phase.process, phase.name, phase.started, phase.finished) for phase in timeline.phases[2:]] == [
+        ("Granian child", "interpreter start and runner import", 1.6, 2.0),
+        ("Granian child", "Granian startup and worker spawn", 2.0, 2.4),
+        ("worker 1 (pid 11)", "application import", 2.4, 3.4),
+        ("worker 1 (pid 11)", "startup hooks until accepting", 3.4, 3.5),
+        ("worker 2 (pid 12)", "application import", 2.5, 4.5),
+        ("worker 2 (pid 12)", "startup hooks until accepting", 4.5, 4.75),
+    ]
+
+
+def test_report_flags_the_slowest_phase_and_serializes_offsets() -> None:
+    timeline = _StartupTimeline()
+    timeline.add("static file resolution", 10.0, 10.25)
+    timeline.add("application import", 10.5, 12.0, process="worker 1 (pid 7)")
+
+    lines = timeline.render(12.5)
+
+    assert lines[0] == "Startup report: ready 2.500s after start"
+    assert lines[1].endswith("static file resolution")
+    assert lines[2].endswith("application import  <- slowest")
+    assert "+  0.500s   1.500s  worker 1 (pid 7)" in lines[2]
+    assert json.loads(timeline.as_json(12.5)) == {
+        "ready_seconds": 2.5,
+        "phases": [
+            {
+                "process": "Litestar parent",
+                "name": "static file resolution",
+                "offset_seconds": 0.0,
+                "duration_seconds": 0.25,
+            },
+            {
+                "process": "worker 1 (pid 7)",
+                "name": "application import",
+                "offset_seconds": 0.5,
+                "duration_seconds": 1.5,
+            },
+        ],
+    }
+
+
+def test_new_run_starts_from_the_cli_marks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("litestar_granian.startup._process_started", lambda: 0.0)
+    timeline = _StartupTimeline()
+    timeline.add("stale phase", 0.0, 1.0)
+    timeline.cli_initialized = time.monotonic()
+
+    timeline.begin()
+
+    assert [phase.name for phase in timeline.phases] == [
+        "interpreter start, Litestar CLI, and application import",
+        "run command import and option parsing",
+    ]
@@ -4,22 +4,44 @@ import os
 import signal
 import subprocess
 import sys
+import threading
+import time
+from collections.abc import Iterator
 from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 
+from litestar_granian import supervisor as supervisor_module
 from litestar_granian.supervisor import (
     _CREATE_NEW_PROCESS_GROUP,
     _GranianSupervisor,
     _map_exit_code,
+    _MemoryLimit,
+    _RespawnPolicy,
     _SignalForwarder,
 )
 
 posix_only = pytest.mark.skipif(sys.platform == "win32", reason="exercises the POSIX supervisor path")
+pidfd_only = pytest.mark.skipif(
+    sys.platform != "linux" or not hasattr(os, "pidfd_open"),
+    reason="exercises the Linux pidfd wait loop",
+)
+
+
+@pytest.fixture
+def no_pidfds(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Mocked children carry made-up pids that a real pidfd could resolve to an unrelated process.
+    monkeypatch.setattr(supervisor_module, "_HAS_PIDFD", False)
+
+
+@pytest.fixture
+def real_pidfds(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(supervisor_module, "_HAS_PIDFD", True)
 
 
 @posix_only
+@pytest.mark.usefixtures("no_pidfds")
 def test_supervisor_starts_new_posix_session(monkeypatch: pytest.MonkeyPatch) -> None:
     process = MagicMock(pid=123, returncode=0)
     process.wait.return_value = 0
@@ -37,6 +59,7 @@ def test_supervisor_starts_new_posix_session(monkeypatch: pytest.MonkeyPatch) ->
 
 
 @posix_only
+@pytest.mark.usefixtures("no_pidfds")
 def test_supervisor_passes_child_environment_and_file_descriptors(monkeypatch: pytest.MonkeyPatch) -> None:
     process = MagicMock(pid=123, returncode=0)
     process.wait.return_value = 0
@@ -57,6 +80,46 @@ def test_supervisor_passes_child_environment_and_file_descriptors(monkeypatch: p
 
 
 @posix_only
+@pytest.mark.usefixtures("no_pidfds")
+def test_embedded_children_are_forked_with_the_child_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    process = MagicMock(pid=123, returncode=0)
+    process.wait.return_value = 0
+    embedded_child = MagicMock(return_value=process)
+    popen = MagicMock()
+    monkeypatch.setattr(supervisor_module, "_EmbeddedChild", embedded_child)
+    monkeypatch.setattr(subprocess, "Popen", popen)
+    monkeypatch.setenv("INHERITED", "yes")
+
+    exit_code = _GranianSupervisor(
+        ["python", "-m", "granian"], kill_timeout=5, environment={"COMPAT": "1"}, embedded=True
+    ).run()
+
+    assert exit_code == 0
+    popen.assert_not_called()
+    command, environment = embedded_child.call_args.args
+    assert command == ["python", "-m", "granian"]
+    assert environment["COMPAT"] == "1"
+    assert environment["INHERITED"] == "yes"
+
+
+@pytest.mark.usefixtures("no_pidfds")
+def test_started_callback_runs_once_after_the_first_spawn(monkeypatch: pytest.MonkeyPatch) -> None:
+    process = MagicMock(pid=123, returncode=0)
+    process.wait.return_value = 0
+    popen = MagicMock(return_value=process)
+    monkeypatch.setattr(subprocess, "Popen", popen)
+    observed: list[tuple[bool, bool]] = []
+
+    def on_started() -> None:
+        observed.append((popen.called, process.wait.called))
+
+    _GranianSupervisor(["granian"], kill_timeout=5, on_started=on_started).run()
+
+    assert observed == [(True, False)]
+
+
+@posix_only
+@pytest.mark.usefixtures("no_pidfds")
 def test_pending_termination_signal_is_forwarded_after_child_attachment(monkeypatch: pytest.MonkeyPatch) -> None:
     process = MagicMock(pid=123, returncode=0)
     process.wait.return_value = 0
@@ -94,6 +157,7 @@ def test_repeated_termination_signal_kills_process_group(monkeypatch: pytest.Mon
 
 
 @pytest.mark.skipif(not hasattr(signal, "SIGHUP"), reason="POSIX only")
+@pytest.mark.usefixtures("no_pidfds")
 def test_sighup_is_forwarded_without_starting_shutdown(monkeypatch: pytest.MonkeyPatch) -> None:
     process = MagicMock(pid=123)
     process.poll.return_value = None
@@ -112,6 +176,7 @@ def test_sighup_is_forwarded_without_starting_shutdown(monkeypatch: pytest.Monke
 
 
 @posix_only
+@pytest.mark.usefixtures("no_pidfds")
 def test_first_termination_signal_arms_kill_deadline_timer(monkeypatch: pytest.MonkeyPatch) -> None:
     process = MagicMock(pid=123)
     process.wait.return_value = 0
@@ -133,6 +198,7 @@ def test_first_termination_signal_arms_kill_deadline_timer(monkeypatch: pytest.M
 
 
 @posix_only
+@pytest.mark.usefixtures("no_pidfds")
 def test_kill_deadline_alarm_kills_process_group(monkeypatch: pytest.MonkeyPatch) -> None:
     process = MagicMock(pid=123)
     process.poll.return_value = None
@@ -166,6 +232,7 @@ def test_kill_deadline_alarm_kills_process_group(monkeypatch: pytest.MonkeyPatch
 
 
 @posix_only
+@pytest.mark.usefixtures("no_pidfds")
 def test_run_restores_previous_alarm_handler(monkeypatch: pytest.MonkeyPatch) -> None:
     process = MagicMock(pid=123)
     process.wait.return_value = 0
@@ -187,6 +254,7 @@ def test_run_restores_previous_alarm_handler(monkeypatch: pytest.MonkeyPatch) ->
 
 
 @posix_only
+@pytest.mark.usefixtures("no_pidfds")
 def test_run_restores_default_alarm_handler_when_previous_is_foreign(monkeypatch: pytest.MonkeyPatch) -> None:
     process = MagicMock(pid=123)
     process.wait.return_value = 0
@@ -253,6 +321,7 @@ def test_process_lookup_error_from_killpg_does_not_propagate(monkeypatch: pytest
 
 
 @posix_only
+@pytest.mark.usefixtures("no_pidfds")
 def test_failed_wait_kills_process_group(monkeypatch: pytest.MonkeyPatch) -> None:
     process = MagicMock(pid=123)
     process.wait.side_effect = RuntimeError("wait failed")
@@ -267,6 +336,7 @@ def test_failed_wait_kills_process_group(monkeypatch: pytest.MonkeyPatch) -> Non
     killpg.assert_called_once_with(123, signal.SIGKILL)
 
 
+@pytest.mark.usefixtures("no_pidfds")
 def test_windows_uses_process_group_and_list_taskkill(monkeypatch: pytest.MonkeyPatch) -> None:
     process = MagicMock(pid=456)
     process.wait.return_value = 1
@@ -298,6 +368,7 @@ def test_windows_uses_process_group_and_list_taskkill(monkeypatch: pytest.Monkey
     )
 
 
+@pytest.mark.usefixtures("no_pidfds")
 def test_windows_expired_deadline_kills_process_group(monkeypatch: pytest.MonkeyPatch) -> None:
     process = MagicMock(pid=456)
     process.poll.return_value = None
@@ -366,3 +437,386 @@ def test_signal_forwarder_restores_handlers_that_python_did_not_install(monkeypa
 )
 def test_exit_code_mapping(returncode: int, expected: int) -> None:
     assert _map_exit_code(returncode) == expected
+
+
+@posix_only
+@pytest.mark.usefixtures("no_pidfds")
+def test_rolling_restart_drains_previous_child_after_replacement_is_ready(monkeypatch: pytest.MonkeyPatch) -> None:
+    current = MagicMock(pid=123)
+    replacement = MagicMock(pid=456)
+    current.poll.return_value = None
+    replacement.poll.return_value = None
+    replacement.wait.return_value = 0
+    readiness = MagicMock()
+    readiness.environment.side_effect = lambda generation: {"LITESTAR_GRANIAN_GENERATION": str(generation)}
+    readiness.wait.return_value = True
+    popen = MagicMock(side_effect=[current, replacement])
+    killpg = MagicMock()
+    monkeypatch.setattr(subprocess, "Popen", popen)
+    monkeypatch.setattr(os, "killpg", killpg)
+    monkeypatch.setattr(signal, "setitimer", MagicMock())
+    supervisor = _GranianSupervisor(
+        ["granian", "app:app"],
+        kill_timeout=5,
+        pass_fds=(7,),
+        rolling_restart=True,
+        restart_timeout=30,
+        readiness=readiness,
+    )
+
+    def request_restart(*, timeout: float) -> int:
+        if not killpg.called:
+            supervisor.forward(signal.SIGHUP)
+            raise subprocess.TimeoutExpired("granian", timeout)
+        return 0
+
+    current.wait.side_effect = request_restart
+
+    assert supervisor.run() == 0
+    assert [call.kwargs["env"]["LITESTAR_GRANIAN_GENERATION"] for call in popen.call_args_list] == ["1", "2"]
+    assert all(call.kwargs["pass_fds"] == (7,) for call in popen.call_args_list)
+    assert readiness.wait.call_args.args == (2,)
+    assert readiness.wait.call_args.kwargs["timeout"] == 30
+    killpg.assert_called_once_with(123, signal.SIGTERM)
+    assert supervisor._process is replacement
+
+
+@posix_only
+@pytest.mark.usefixtures("no_pidfds")
+def test_rolling_restart_keeps_current_child_when_replacement_is_not_ready(monkeypatch: pytest.MonkeyPatch) -> None:
+    current = MagicMock(pid=123)
+    replacement = MagicMock(pid=456)
+    current.poll.return_value = None
+    replacement.poll.return_value = None
+    readiness = MagicMock()
+    readiness.environment.return_value = {}
+    readiness.wait.return_value = False
+    killpg = MagicMock()
+    monkeypatch.setattr(subprocess, "Popen", MagicMock(side_effect=[current, replacement]))
+    monkeypatch.setattr(os, "killpg", killpg)
+    supervisor = _GranianSupervisor(
+        ["granian", "app:app"],
+        kill_timeout=5,
+        rolling_restart=True,
+        readiness=readiness,
+    )
+    waits: Iterator[int | subprocess.TimeoutExpired] = iter([subprocess.TimeoutExpired("granian", 0.1), 3])
+
+    def request_restart(*, timeout: float) -> int:
+        result = next(waits)
+        if isinstance(result, BaseException):
+            supervisor.forward(signal.SIGUSR2)
+            raise result
+        return result
+
+    current.wait.side_effect = request_restart
+
+    assert supervisor.run() == 3
+    killpg.assert_called_once_with(456, signal.SIGTERM)
+    assert supervisor._process is current
+
+
+@posix_only
+@pytest.mark.usefixtures("no_pidfds")
+def test_child_group_over_its_memory_limit_is_replaced_through_a_rolling_restart(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    current = MagicMock(pid=123)
+    replacement = MagicMock(pid=456)
+    current.poll.return_value = None
+    replacement.poll.return_value = None
+    replacement.wait.return_value = 0
+    readiness = MagicMock()
+    readiness.environment.return_value = {}
+    readiness.wait.return_value = True
+    killpg = MagicMock()
+    samples = {123: iter([900, 300, 900, 900]), 456: iter([100])}
+    monkeypatch.setattr(subprocess, "Popen", MagicMock(side_effect=[current, replacement]))
+    monkeypatch.setattr(os, "killpg", killpg)
+    monkeypatch.setattr(supervisor_module, "_process_group_memory", lambda pid: next(samples[pid]))
+    supervisor = _GranianSupervisor(
+        ["granian", "app:app"],
+        kill_timeout=5,
+        platform="linux",
+        readiness=readiness,
+        memory_limit=_MemoryLimit(limit=500, interval=0, samples=2),
+    )
+
+    def serve(*, timeout: float) -> int:
+        if not killpg.called:
+            raise subprocess.TimeoutExpired("granian", timeout)
+        return 0
+
+    current.wait.side_effect = serve
+
+    assert supervisor.run() == 0
+    assert next(samples[123], None) is None
+    killpg.assert_called_once_with(123, signal.SIGTERM)
+    assert supervisor._process is replacement
+
+
+@posix_only
+@pytest.mark.usefixtures("no_pidfds")
+def test_reload_replaces_the_child_and_waits_for_changes_after_a_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    serving = MagicMock(pid=123)
+    broken = MagicMock(pid=456)
+    fixed = MagicMock(pid=789)
+    serving.poll.return_value = None
+    broken.wait.return_value = 1
+    fixed.wait.return_value = 0
+    popen = MagicMock(side_effect=[serving, broken, fixed])
+    killpg = MagicMock()
+    monkeypatch.setattr(subprocess, "Popen", popen)
+    monkeypatch.setattr(os, "killpg", killpg)
+    supervisor = _GranianSupervisor(["granian", "app:app"], kill_timeout=5, reload_on_change=True)
+    monkeypatch.setattr(
+        "litestar_granian.supervisor.time.sleep", MagicMock(side_effect=lambda _delay: supervisor.reload())
+    )
+
+    def serve(*, timeout: float) -> int:
+        if not killpg.called:
+            supervisor.reload()
+            raise subprocess.TimeoutExpired("granian", timeout)
+        return -signal.SIGTERM
+
+    serving.wait.side_effect = serve
+
+    assert supervisor.run() == 0
+    assert popen.call_count == 3
+    killpg.assert_called_once_with(123, signal.SIGTERM)
+    assert supervisor._process is fixed
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR2"), reason="POSIX only")
+def test_signal_forwarder_adds_sigusr2_only_for_rolling_restarts() -> None:
+    assert signal.SIGUSR2 not in _SignalForwarder(_GranianSupervisor(["granian"], kill_timeout=5)).signals
+    rolling = _GranianSupervisor(["granian"], kill_timeout=5, rolling_restart=True)
+    assert signal.SIGUSR2 in _SignalForwarder(rolling).signals
+
+
+@pytest.mark.parametrize(("attempt", "ceiling"), [(1, 0.5), (3, 2.0), (10, 8.0), (10_000, 8.0)])
+def test_respawn_delay_is_jittered_below_the_capped_exponential_backoff(attempt: int, ceiling: float) -> None:
+    policy = _RespawnPolicy(backoff=0.5, max_backoff=8, limit=5)
+
+    delays = [policy.delay(attempt) for _ in range(50)]
+
+    assert all(ceiling / 2 <= delay <= ceiling for delay in delays)
+
+
+@posix_only
+@pytest.mark.usefixtures("no_pidfds")
+def test_abnormal_child_exit_is_respawned_with_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    crashed = MagicMock(pid=123)
+    crashed.wait.return_value = -signal.SIGKILL
+    respawned = MagicMock(pid=456)
+    respawned.wait.return_value = 0
+    popen = MagicMock(side_effect=[crashed, respawned])
+    pause = MagicMock(return_value=True)
+    monkeypatch.setattr(subprocess, "Popen", popen)
+    supervisor = _GranianSupervisor(
+        ["granian", "app:app"],
+        kill_timeout=5,
+        respawn=_RespawnPolicy(backoff=0.2, max_backoff=1, limit=3),
+    )
+    monkeypatch.setattr(supervisor, "_pause", pause)
+
+    assert supervisor.run() == 0
+    assert popen.call_count == 2
+    assert 0.1 <= pause.call_args.args[0] <= 0.2
+    assert supervisor._process is respawned
+
+
+@posix_only
+@pytest.mark.usefixtures("no_pidfds")
+def test_crash_loop_gives_up_after_the_respawn_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    process = MagicMock(pid=123)
+    process.wait.return_value = 1
+    popen = MagicMock(return_value=process)
+    monkeypatch.setattr(subprocess, "Popen", popen)
+    monkeypatch.setattr("litestar_granian.supervisor.time.sleep", MagicMock())
+    supervisor = _GranianSupervisor(
+        ["granian", "app:app"],
+        kill_timeout=5,
+        respawn=_RespawnPolicy(backoff=0.1, max_backoff=1, limit=2),
+    )
+
+    assert supervisor.run() == 1
+    assert popen.call_count == 3
+
+
+@posix_only
+@pytest.mark.usefixtures("no_pidfds")
+def test_requested_shutdown_is_not_respawned(monkeypatch: pytest.MonkeyPatch) -> None:
+    process = MagicMock(pid=123)
+    popen = MagicMock(return_value=process)
+    monkeypatch.setattr(subprocess, "Popen", popen)
+    monkeypatch.setattr(os, "killpg", MagicMock())
+    monkeypatch.setattr(signal, "setitimer", MagicMock())
+    supervisor = _GranianSupervisor(
+        ["granian", "app:app"],
+        kill_timeout=5,
+        respawn=_RespawnPolicy(backoff=0.1, max_backoff=1, limit=2),
+    )
+
+    def terminated() -> int:
+        supervisor.forward(signal.SIGTERM)
+        return -signal.SIGTERM
+
+    process.wait.side_effect = terminated
+
+    assert supervisor.run() == 128 + signal.SIGTERM
+    popen.assert_called_once()
+
+
+@posix_only
+@pytest.mark.usefixtures("no_pidfds")
+def test_shutdown_during_respawn_backoff_stops_without_a_new_child(monkeypatch: pytest.MonkeyPatch) -> None:
+    process = MagicMock(pid=123)
+    process.wait.return_value = -signal.SIGSEGV
+    process.poll.return_value = -signal.SIGSEGV
+    popen = MagicMock(return_value=process)
+    monkeypatch.setattr(subprocess, "Popen", popen)
+    monkeypatch.setattr(signal, "setitimer", MagicMock())
+    supervisor = _GranianSupervisor(
+        ["granian", "app:app"],
+        kill_timeout=5,
+        respawn=_RespawnPolicy(backoff=30, max_backoff=60, limit=2),
+    )
+    monkeypatch.setattr(
+        "litestar_granian.supervisor.time.sleep",
+        MagicMock(side_effect=lambda _delay: supervisor.forward(signal.SIGTERM)),
+    )
+
+    assert supervisor.run() == 128 + signal.SIGSEGV
+    popen.assert_called_once()
+
+
+@pidfd_only
+@pytest.mark.usefixtures("real_pidfds")
+def test_linux_wait_returns_child_status_without_touching_sigalrm(monkeypatch: pytest.MonkeyPatch) -> None:
+    setitimer = MagicMock()
+    monkeypatch.setattr(signal, "setitimer", setitimer)
+    alarm_handler = signal.getsignal(signal.SIGALRM)
+
+    exit_code = _GranianSupervisor([sys.executable, "-c", "raise SystemExit(3)"], kill_timeout=5).run()
+
+    assert exit_code == 3
+    setitimer.assert_not_called()
+    assert signal.getsignal(signal.SIGALRM) is alarm_handler
+
+
+@pidfd_only
+@pytest.mark.usefixtures("real_pidfds")
+def test_linux_wait_enforces_the_kill_deadline_from_the_select_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(supervisor_module, "_KILL_GRACE_PERIOD", 0.0)
+    ignore_sigterm = "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); time.sleep(60)"
+    supervisor = _GranianSupervisor([sys.executable, "-c", ignore_sigterm], kill_timeout=0.2)
+    timer = threading.Timer(0.5, supervisor.forward, (signal.SIGTERM,))
+    started = time.monotonic()
+
+    timer.start()
+    try:
+        exit_code = supervisor.run()
+    finally:
+        timer.cancel()
+
+    assert exit_code == 128 + signal.SIGKILL
+    assert time.monotonic() - started < 5
+    assert supervisor._wakeup is None
+
+
+@pidfd_only
+@pytest.mark.usefixtures("real_pidfds")
+def test_linux_wait_falls_back_to_the_alarm_when_pidfds_are_refused(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(os, "pidfd_open", MagicMock(side_effect=PermissionError))
+    monkeypatch.setattr(signal, "setitimer", MagicMock())
+    handlers: list[Any] = []
+    original_signal = signal.signal
+
+    def record_signal(signum: int, handler: Any) -> Any:
+        if signum == signal.SIGALRM:
+            handlers.append(handler)
+        return original_signal(signum, handler)
+
+    monkeypatch.setattr(signal, "signal", record_signal)
+
+    assert _GranianSupervisor([sys.executable, "-c", "pass"], kill_timeout=5).run() == 0
+    assert len(handlers) == 2
+
+
+@posix_only
+@pytest.mark.usefixtures("no_pidfds")
+def test_ready_is_announced_once_every_serving_worker_reports(monkeypatch: pytest.MonkeyPatch) -> None:
+    process = MagicMock(pid=123)
+    readiness = MagicMock(workers=2)
+    readiness.environment.return_value = {}
+    readiness.is_ready.side_effect = [False, True]
+    announcer = MagicMock(notifies=False)
+    waits: Iterator[int | subprocess.TimeoutExpired] = iter([
+        subprocess.TimeoutExpired("granian", 0.1),
+        subprocess.TimeoutExpired("granian", 0.1),
+        0,
+    ])
+
+    def wait(*, timeout: float) -> int:
+        result = next(waits)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    process.wait.side_effect = wait
+    monkeypatch.setattr(subprocess, "Popen", MagicMock(return_value=process))
+    supervisor = _GranianSupervisor(["granian", "app:app"], kill_timeout=5, readiness=readiness, announcer=announcer)
+
+    assert supervisor.run() == 0
+    announcer.ready.assert_called_once_with(generation=1, workers=2)
+    readiness.forget.assert_called_once_with(1)
+
+
+@posix_only
+@pytest.mark.usefixtures("no_pidfds")
+def test_startup_callback_receives_the_first_generation_reports_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    process = MagicMock(pid=123)
+    process.wait.side_effect = [subprocess.TimeoutExpired("granian", 0.1), 0]
+    readiness = MagicMock(workers=1)
+    readiness.environment.return_value = {}
+    readiness.is_ready.return_value = True
+    readiness.reports.return_value = [{"PID": "7", "READY_AT": "1.0"}]
+    on_ready = MagicMock()
+    monkeypatch.setattr(subprocess, "Popen", MagicMock(return_value=process))
+    supervisor = _GranianSupervisor(["granian", "app:app"], kill_timeout=5, readiness=readiness, on_ready=on_ready)
+
+    assert supervisor.run() == 0
+    on_ready.assert_called_once_with([{"PID": "7", "READY_AT": "1.0"}])
+    readiness.forget.assert_called_once_with(1)
+
+
+@posix_only
+@pytest.mark.usefixtures("no_pidfds")
+def test_first_termination_signal_announces_stopping_and_hides_notify_socket(monkeypatch: pytest.MonkeyPatch) -> None:
+    process = MagicMock(pid=123)
+    process.poll.return_value = None
+    popen = MagicMock(return_value=process)
+    readiness = MagicMock(workers=1)
+    readiness.environment.return_value = {"LITESTAR_GRANIAN_GENERATION": "1"}
+    readiness.is_ready.return_value = False
+    announcer = MagicMock(notifies=True)
+    monkeypatch.setattr(subprocess, "Popen", popen)
+    monkeypatch.setattr(os, "killpg", MagicMock())
+    monkeypatch.setattr(signal, "setitimer", MagicMock())
+    monkeypatch.setenv("NOTIFY_SOCKET", "/run/systemd/notify")
+    supervisor = _GranianSupervisor(["granian", "app:app"], kill_timeout=5, readiness=readiness, announcer=announcer)
+
+    def terminated(*, timeout: float) -> int:
+        supervisor.forward(signal.SIGTERM)
+        supervisor.forward(signal.SIGTERM)
+        return 0
+
+    process.wait.side_effect = terminated
+
+    assert supervisor.run() == 0
+    announcer.stopping.assert_called_once_with()
+    announcer.ready.assert_not_called()
+    child_env = popen.call_args.kwargs["env"]
+    assert "NOTIFY_SOCKET" not in child_env
+    assert child_env["LITESTAR_GRANIAN_GENERATION"] == "1"
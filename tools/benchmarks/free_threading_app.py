@@ -1,6 +1,7 @@
 import asyncio
+import os
 
-from litestar import Litestar, WebSocket, get, websocket
+from litestar import Litestar, Response, WebSocket, get, websocket
 
 from litestar_granian import GranianPlugin
 
@@ -19,6 +20,11 @@ async def io(delay: float = 0.01) -> dict[str, float]:
     return {"delay": delay}
 
 
+@get("/json")
+async def as_json() -> dict[str, object]:
+    return {"message": "Hello, World!", "items": [1, 2, 3]}
+
+
 @get("/correctness/http2")
 async def http2_correctness() -> dict[str, bool]:
     return {"ok": True}
@@ -31,7 +37,14 @@ async def websocket_correctness(socket: WebSocket) -> None:
     await socket.close()
 
 
+async def tag_worker(response: Response) -> Response:
+    # Lets the benchmark attribute each response to the worker whose listener accepted it.
+    response.headers["x-worker-pid"] = str(os.getpid())
+    return response
+
+
 app = Litestar(
-    route_handlers=[cpu, io, http2_correctness, websocket_correctness],
+    route_handlers=[cpu, io, as_json, http2_correctness, websocket_correctness],
     plugins=[GranianPlugin()],
+    after_request=tag_worker,
 )
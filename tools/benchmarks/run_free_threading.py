@@ -11,6 +11,7 @@ import sys
 import tempfile
 import threading
 import time
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -24,6 +25,8 @@ from h2.connection import H2Connection  # pyright: ignore[reportMissingImports]
 from h2.events import DataReceived, ResponseReceived, StreamEnded  # pyright: ignore[reportMissingImports]
 from websockets.sync.client import connect
 
+from litestar_granian.resources import _cpu_budget
+
 _REPOSITORY_ROOT = Path(__file__).resolve().parents[2]
 _APP = "tools.benchmarks.free_threading_app:app"
 _LOOP_EXTRAS = {"rloop": "rloop", "uvloop": "uvloop", "winloop": "winloop"}
@@ -35,6 +38,8 @@ class _Cell:
     loop: str
     workers: int
     workload: str
+    listener: str = "shared"
+    interface: str = "asgi"
 
 
 class _ProcessTreeSampler:
@@ -69,9 +74,26 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--workers",
         default="1,2,logical",
-        help="Comma-separated worker counts; use 'logical' for os.cpu_count()",
+        help=(
+            "Comma-separated worker counts; use 'logical' for os.cpu_count() or 'auto' for the CPUs allowed by the "
+            "cgroup quota and affinity mask"
+        ),
+    )
+    parser.add_argument("--workload", action="append", dest="workloads", choices=["cpu", "io", "json"])
+    parser.add_argument(
+        "--listener",
+        action="append",
+        dest="listeners",
+        choices=["shared", "reuse-port"],
+        help="Accept model, repeatable: one parent-owned socket, or one SO_REUSEPORT socket per worker",
+    )
+    parser.add_argument(
+        "--interface",
+        action="append",
+        dest="interfaces",
+        choices=["asgi", "rsgi"],
+        help="Granian interface, repeatable: Granian's ASGI layer, or the plugin's RSGI adapter",
     )
-    parser.add_argument("--workload", action="append", dest="workloads", choices=["cpu", "io"])
     parser.add_argument("--duration", type=float, default=30.0)
     parser.add_argument("--warmup", type=float, default=2.0)
     parser.add_argument("--concurrency", type=int, default=16)
@@ -86,8 +108,8 @@ def _parse_args() -> argparse.Namespace:
 
 
 def _worker_counts(value: str) -> list[int]:
-    logical = os.cpu_count() or 1
-    counts = {logical if item.strip() == "logical" else int(item) for item in value.split(",")}
+    named = {"logical": os.cpu_count() or 1, "auto": _cpu_budget().cpus}
+    counts = {named.get(item.strip()) or int(item) for item in value.split(",")}
     if any(count < 1 for count in counts):
         message = "worker counts must be positive"
         raise ValueError(message)
@@ -106,7 +128,9 @@ def _locked_version(package_name: str) -> tuple[int, ...] | None:
     return None
 
 
-def _eligible(python: str, loop: str) -> tuple[bool, str | None]:
+def _eligible(python: str, loop: str, listener: str = "shared") -> tuple[bool, str | None]:
+    if listener == "reuse-port" and sys.platform != "linux":
+        return False, "--reuse-port is Linux-only"
     if loop == "winloop" and sys.platform != "win32":
         return False, "winloop is Windows-only"
     if loop in {"rloop", "uvloop"} and sys.platform == "win32":
@@ -141,7 +165,21 @@ def _wait_for_port(port: int, process: subprocess.Popen[str], *, open_: bool) ->
     raise TimeoutError(message)
 
 
-def _server_command(cell: _Cell, port: int) -> list[str]:
+def _wait_for_ready_file(ready_file: Path, process: subprocess.Popen[str]) -> None:
+    deadline = time.monotonic() + 20
+    while time.monotonic() < deadline:
+        if ready_file.exists():
+            return
+        if process.poll() is not None:
+            output, _ = process.communicate()
+            message = f"benchmark server exited before readiness ({process.returncode}):\n{output}"
+            raise RuntimeError(message)
+        time.sleep(0.05)
+    message = f"{ready_file} was not written"
+    raise TimeoutError(message)
+
+
+def _server_command(cell: _Cell, port: int, ready_file: Path | None) -> list[str]:
     command = [
         "uv",
         "run",
@@ -172,7 +210,13 @@ def _server_command(cell: _Cell, port: int) -> list[str]:
         cell.loop,
         "--workers-kill-timeout",
         "5",
+        "--interface",
+        cell.interface,
     ))
+    if cell.listener == "reuse-port":
+        command.append("--reuse-port")
+    if ready_file is not None:
+        command.extend(("--ready-file", str(ready_file)))
     return command
 
 
@@ -187,8 +231,14 @@ def _start_server(cell: _Cell, port: int) -> subprocess.Popen[str]:
         options["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
     else:
         options["start_new_session"] = True
-    process = subprocess.Popen(_server_command(cell, port), **options)  # type: ignore[arg-type]
-    _wait_for_port(port, process, open_=True)
+    # The parent-owned listener accepts connections before any worker serves; on POSIX wait for the
+    # supervisor's readiness file instead so warmup never measures worker startup.
+    ready_file = None if sys.platform == "win32" else Path(tempfile.gettempdir()) / f"litestar-granian-{port}.ready"
+    process = subprocess.Popen(_server_command(cell, port, ready_file), **options)  # type: ignore[arg-type]
+    if ready_file is None:
+        _wait_for_port(port, process, open_=True)
+    else:
+        _wait_for_ready_file(ready_file, process)
     return process
 
 
@@ -308,19 +358,23 @@ def _check_websocket(port: int) -> None:
 def _endpoint(cell: _Cell, port: int, args: argparse.Namespace) -> str:
     if cell.workload == "cpu":
         return f"http://127.0.0.1:{port}/cpu?iterations={args.cpu_iterations}"
+    if cell.workload == "json":
+        return f"http://127.0.0.1:{port}/json"
     return f"http://127.0.0.1:{port}/io?delay={args.io_delay}"
 
 
-def _run_load(url: str, *, duration: float, concurrency: int) -> tuple[int, int, list[float]]:
+def _run_load(url: str, *, duration: float, concurrency: int) -> tuple[int, int, list[float], Counter[str]]:
     deadline = time.monotonic() + duration
     latencies: list[float] = []
     errors = 0
+    served_by: Counter[str] = Counter()
     lock = threading.Lock()
 
     def worker() -> None:
         nonlocal errors
         local_latencies: list[float] = []
         local_errors = 0
+        local_served_by: Counter[str] = Counter()
         with httpx.Client(timeout=5) as client:
             while time.monotonic() < deadline:
                 started = time.perf_counter()
@@ -331,15 +385,44 @@ def _run_load(url: str, *, duration: float, concurrency: int) -> tuple[int, int,
                     local_errors += 1
                 else:
                     local_latencies.append((time.perf_counter() - started) * 1000)
+                    local_served_by[response.headers.get("x-worker-pid", "unknown")] += 1
         with lock:
             latencies.extend(local_latencies)
             errors += local_errors
+            served_by.update(local_served_by)
 
     with ThreadPoolExecutor(max_workers=concurrency) as executor:
         futures = [executor.submit(worker) for _ in range(concurrency)]
         for future in futures:
             future.result()
-    return len(latencies), errors, latencies
+    return len(latencies), errors, latencies, served_by
+
+
+def _accept_distribution(served_by: Counter[str], workers: int) -> dict[str, Any]:
+    counts = sorted(served_by.values(), reverse=True) + [0] * max(0, workers - len(served_by))
+    mean = sum(counts) / len(counts) if counts else 0.0
+    spread = math.sqrt(sum((count - mean) ** 2 for count in counts) / len(counts)) if counts else 0.0
+    return {
+        "requests_per_worker": counts,
+        "max_to_mean": round(counts[0] / mean, 3) if mean else 0.0,
+        "coefficient_of_variation": round(spread / mean, 3) if mean else 0.0,
+    }
+
+
+def _process_tree_cpu_seconds(root_pid: int) -> float:
+    total = 0.0
+    try:
+        root = psutil.Process(root_pid)
+        processes = [root, *root.children(recursive=True)]
+    except psutil.NoSuchProcess:
+        return total
+    for process in processes:
+        try:
+            times = process.cpu_times()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+        total += times.user + times.system
+    return total
 
 
 def _percentile(values: list[float], quantile: float) -> float:
@@ -363,11 +446,13 @@ def _run_cell(cell: _Cell, args: argparse.Namespace) -> dict[str, Any]:
         with httpx.Client(timeout=5) as client:
             while time.monotonic() < warmup_deadline:
                 client.get(_endpoint(cell, port, args)).raise_for_status()
-        requests, errors, latencies = _run_load(
+        cpu_before = _process_tree_cpu_seconds(process.pid)
+        requests, errors, latencies, served_by = _run_load(
             _endpoint(cell, port, args),
             duration=args.duration,
             concurrency=args.concurrency,
         )
+        server_cpu_seconds = _process_tree_cpu_seconds(process.pid) - cpu_before
         shutdown_seconds, output = _terminate_server(process, port)
     finally:
         sampler.stop()
@@ -380,6 +465,8 @@ def _run_cell(cell: _Cell, args: argparse.Namespace) -> dict[str, Any]:
         "loop": cell.loop,
         "workers": cell.workers,
         "workload": cell.workload,
+        "listener": cell.listener,
+        "interface": cell.interface,
         "duration_seconds": args.duration,
         "requests": requests,
         "errors": errors,
@@ -389,6 +476,9 @@ def _run_cell(cell: _Cell, args: argparse.Namespace) -> dict[str, Any]:
             "p95": _percentile(latencies, 0.95),
             "p99": _percentile(latencies, 0.99),
         },
+        "accept_distribution": _accept_distribution(served_by, cell.workers),
+        # Server CPU per request isolates per-request overhead from the load generator sharing the machine.
+        "server_cpu_us_per_request": round(server_cpu_seconds / requests * 1_000_000, 3) if requests else 0.0,
         "peak_process_tree_rss_bytes": sampler.peak_rss_bytes,
         "shutdown_seconds": round(shutdown_seconds, 3),
     }
@@ -408,16 +498,20 @@ def main() -> None:
     pythons = args.pythons or ["3.14", "3.14t"]
     loops = args.loops or _default_loops()
     workloads = args.workloads or ["cpu", "io"]
+    listeners = args.listeners or ["shared"]
+    interfaces = args.interfaces or ["asgi"]
     cells = [
-        _Cell(python, loop, workers, workload)
+        _Cell(python, loop, workers, workload, listener, interface)
         for python in pythons
         for loop in loops
         for workers in _worker_counts(args.workers)
         for workload in workloads
+        for listener in listeners
+        for interface in interfaces
     ]
     results: list[dict[str, Any]] = []
     for cell in cells:
-        eligible, reason = _eligible(cell.python, cell.loop)
+        eligible, reason = _eligible(cell.python, cell.loop, cell.listener)
         if not eligible:
             print(f"SKIP {cell}: {reason}")
             continue